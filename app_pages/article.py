@@ -0,0 +1,3 @@
+from lesson_pages.article import show_article
+
+show_article()
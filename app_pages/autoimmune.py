@@ -0,0 +1,3 @@
+from lesson_pages.autoimmune import show_autoimmune
+
+show_autoimmune()
@@ -0,0 +1,3 @@
+from lesson_pages.design_challenge import show_design_challenge
+
+show_design_challenge()
@@ -0,0 +1,3 @@
+from lesson_pages.drug_development import show_drug_development
+
+show_drug_development()
@@ -0,0 +1,3 @@
+from lesson_pages.home import show_home
+
+show_home()
@@ -0,0 +1,3 @@
+from lesson_pages.immune_system import show_immune_system
+
+show_immune_system()
@@ -0,0 +1,3 @@
+from lesson_pages.objectives import show_objectives
+
+show_objectives()
@@ -0,0 +1,3 @@
+from lesson_pages.quiz import show_quiz
+
+show_quiz()
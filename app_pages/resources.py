@@ -0,0 +1,3 @@
+from lesson_pages.resources import show_resources
+
+show_resources()
@@ -0,0 +1,146 @@
+"""Circuit breaker for calls to the messages API.
+
+Without one, a provider outage costs every student a full read timeout per
+click. The breaker counts consecutive failures (connection errors, timeouts,
+429/5xx) and consecutive calls slower than the latency SLO (time to the first
+streamed token). When either count reaches its threshold the circuit opens, and
+callers fail fast to whatever feedback is available without the LLM. After
+``open_seconds`` it goes half-open and lets a limited number of probe calls
+through: a healthy probe closes the circuit, a bad one opens it again.
+"""
+
+import collections
+import threading
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Thread-safe three-state breaker shared by every session in the process"""
+
+    def __init__(self, failure_threshold=5, slow_threshold=3, latency_slo=15.0, open_seconds=30.0,
+                 half_open_probes=1, recent_latencies=500, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.slow_threshold = slow_threshold
+        self.latency_slo = latency_slo
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._consecutive_failures = 0
+        self._consecutive_slow = 0
+        self._latencies = collections.deque(maxlen=recent_latencies)
+        self._counts = collections.Counter()
+        self._last_trip_reason = None
+
+    def _advance(self):
+        if self._state == OPEN and self._clock() - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._probes_in_flight = 0
+
+    def _trip(self, reason):
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._probes_in_flight = 0
+        self._consecutive_failures = 0
+        self._consecutive_slow = 0
+        self._last_trip_reason = reason
+        self._counts["trips"] += 1
+
+    @property
+    def state(self):
+        with self._lock:
+            self._advance()
+            return self._state
+
+    @property
+    def is_open(self):
+        """True while calls would be rejected (without using up a half-open probe)"""
+        with self._lock:
+            self._advance()
+            return self._state == OPEN or (
+                self._state == HALF_OPEN and self._probes_in_flight >= self.half_open_probes
+            )
+
+    def allow(self):
+        """Admit one call, or return False to fail fast. Every admitted call must be
+        followed by ``record_success`` or ``record_failure``."""
+        with self._lock:
+            self._advance()
+            if self._state == CLOSED:
+                admitted = True
+            elif self._state == HALF_OPEN and self._probes_in_flight < self.half_open_probes:
+                self._probes_in_flight += 1
+                self._counts["probes"] += 1
+                admitted = True
+            else:
+                admitted = False
+            self._counts["admitted" if admitted else "rejected"] += 1
+            return admitted
+
+    def record_success(self, latency):
+        """The call answered; ``latency`` is the seconds until its first token"""
+        with self._lock:
+            self._latencies.append(latency)
+            self._counts["successes"] += 1
+            slow = latency > self.latency_slo
+            if slow:
+                self._counts["slow_calls"] += 1
+            if self._state == HALF_OPEN:
+                if slow:
+                    self._trip("slow probe")
+                else:
+                    self._state = CLOSED
+                    self._consecutive_failures = 0
+                    self._consecutive_slow = 0
+                return
+            self._consecutive_failures = 0
+            self._consecutive_slow = self._consecutive_slow + 1 if slow else 0
+            if self._state == CLOSED and self._consecutive_slow >= self.slow_threshold:
+                self._trip(f"{self._consecutive_slow} calls slower than {self.latency_slo:g}s")
+
+    def record_failure(self):
+        with self._lock:
+            self._counts["failures"] += 1
+            if self._state == HALF_OPEN:
+                self._trip("failed probe")
+                return
+            self._consecutive_failures += 1
+            if self._state == CLOSED and self._consecutive_failures >= self.failure_threshold:
+                self._trip(f"{self._consecutive_failures} consecutive failures")
+
+    def record_error(self, latency, status_code=None):
+        """The call failed before its first token; ``status_code`` is the HTTP status, if any.
+
+        Client errors (4xx other than 429) mean the API is up and answering, so
+        they count as a success; no response, 429 and 5xx count as a failure.
+        """
+        if status_code is not None and 400 <= status_code < 500 and status_code != 429:
+            self.record_success(latency)
+        else:
+            self.record_failure()
+
+    def metrics(self):
+        with self._lock:
+            self._advance()
+            latencies = sorted(self._latencies)
+            return {
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                "consecutive_slow": self._consecutive_slow,
+                "trips": self._counts["trips"],
+                "last_trip_reason": self._last_trip_reason,
+                "admitted": self._counts["admitted"],
+                "rejected": self._counts["rejected"],
+                "probes": self._counts["probes"],
+                "successes": self._counts["successes"],
+                "failures": self._counts["failures"],
+                "slow_calls": self._counts["slow_calls"],
+                "p95_first_token_seconds": latencies[int(len(latencies) * 0.95)] if latencies else 0.0,
+            }
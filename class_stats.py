@@ -0,0 +1,103 @@
+"""Class-wide aggregates for the teacher dashboard.
+
+Running totals are updated once per progress event: an XP award, an
+achievement or a first quiz answer. The dashboard therefore reads a handful of
+small counters instead of rescanning every student's ledger on each rerun.
+Events are de-duplicated the same way the ledger is, by (student, check) and
+(student, achievement), so replays do not inflate the numbers. The aggregates
+are seeded from the SQLite ledger once at startup and then see every event
+recorded through this process.
+"""
+
+import threading
+from collections import Counter
+
+
+class ClassAggregates:
+    """Incrementally maintained per-question, XP and achievement statistics"""
+
+    def __init__(self, xp_bucket_size=50):
+        self.xp_bucket_size = xp_bucket_size
+        self._lock = threading.Lock()
+        self._version = 0
+        self._snapshot = None
+        self._snapshot_version = -1
+
+        self._xp = {}
+        self._checks = set()
+        self._xp_buckets = Counter()
+        self._achievements = set()
+        self._achievement_counts = Counter()
+        self._answers = set()
+        self._answered = Counter()
+        self._correct = Counter()
+
+    # Updates (O(1) per event)
+
+    def add_check(self, student_id, check_id, points):
+        with self._lock:
+            if (student_id, check_id) in self._checks:
+                return
+            self._checks.add((student_id, check_id))
+            old = self._xp.get(student_id)
+            if old is not None:
+                self._xp_buckets[self._bucket(old)] -= 1
+            new = (old or 0) + points
+            self._xp[student_id] = new
+            self._xp_buckets[self._bucket(new)] += 1
+            self._version += 1
+
+    def add_achievement(self, student_id, achievement):
+        with self._lock:
+            if (student_id, achievement) in self._achievements:
+                return
+            self._achievements.add((student_id, achievement))
+            self._achievement_counts[achievement] += 1
+            self._add_student(student_id)
+            self._version += 1
+
+    def add_answer(self, student_id, question_id, correct):
+        """Count a student's first answer to a quiz question"""
+        with self._lock:
+            if (student_id, question_id) in self._answers:
+                return
+            self._answers.add((student_id, question_id))
+            self._answered[question_id] += 1
+            if correct:
+                self._correct[question_id] += 1
+            self._add_student(student_id)
+            self._version += 1
+
+    def _add_student(self, student_id):
+        if student_id not in self._xp:
+            self._xp[student_id] = 0
+            self._xp_buckets[0] += 1
+
+    def _bucket(self, xp):
+        return xp // self.xp_bucket_size * self.xp_bucket_size
+
+    # Reads
+
+    @property
+    def version(self):
+        return self._version
+
+    def snapshot(self):
+        """Current class summary; rebuilt only after new events arrive"""
+        with self._lock:
+            if self._snapshot_version == self._version:
+                return self._snapshot
+            students = len(self._xp)
+            total_xp = sum(self._xp.values())
+            self._snapshot = {
+                "students": students,
+                "mean_xp": total_xp / students if students else 0.0,
+                "xp_buckets": sorted((bucket, count) for bucket, count in self._xp_buckets.items() if count),
+                "achievements": self._achievement_counts.most_common(),
+                "questions": {
+                    question_id: (self._correct[question_id], answered)
+                    for question_id, answered in self._answered.items()
+                },
+            }
+            self._snapshot_version = self._version
+            return self._snapshot
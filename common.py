@@ -0,0 +1,321 @@
+"""State and helpers shared by the entry script and every lesson page.
+
+Imported once per process, so none of this is re-executed on a rerun. Cached
+resources (progress store, analytics event log, lesson content, feedback cache,
+LLM rate limiter and circuit breaker) are created on first use and shared by
+every session.
+"""
+
+import functools
+import hmac
+import uuid
+
+import streamlit as st
+
+import instrumentation
+import settings
+from circuit_breaker import CircuitBreaker
+from concept_scorer import build_scorers
+from event_log import CHECK, SELECT, VIEW, XP, EventLog
+from feedback_cache import FeedbackCache
+from lesson_content import load_lesson_content
+from progress_store import ProgressStore
+from quiz_bank import load_question_bank
+from rate_limiter import RateLimiter
+from session_model import StudentSession
+from session_spill import SessionSpiller
+from static_assets import STATIC_CSS_STREAMLIT, Stylesheet
+
+# Idle students' lesson state is spilled to disk and reloaded on their next interaction
+@st.cache_resource
+def get_session_spiller():
+    return SessionSpiller(
+        settings.SESSION_SPILL_DIR,
+        idle_seconds=settings.SESSION_IDLE_SECONDS,
+        check_interval=settings.SESSION_SPILL_INTERVAL,
+    )
+
+def touch_student():
+    """Mark this student active, reloading their state first if it was spilled"""
+    get_session_spiller().touch(st.session_state.student)
+
+# Durable progress store (write-behind SQLite ledger shared by all sessions)
+@st.cache_resource
+def get_progress_store():
+    return ProgressStore(
+        settings.PROGRESS_DB_PATH,
+        batch_size=settings.PROGRESS_BATCH_SIZE,
+        flush_interval=settings.PROGRESS_FLUSH_INTERVAL,
+    )
+
+def record_progress(kind, *args):
+    """Queue a progress event for the signed-in student, or hold it until they sign in"""
+    student_id = st.session_state.student_id
+    if not student_id:
+        st.session_state.unsynced_progress.append((kind, args))
+        return
+    store = get_progress_store()
+    if kind == "check":
+        store.record_check(student_id, *args)
+    elif kind == "achievement":
+        store.record_achievement(student_id, *args)
+    elif kind == "answer":
+        store.record_answer(student_id, *args)
+    else:
+        store.record_short_answer(student_id, *args)
+
+def load_student_progress():
+    """Save progress earned before sign-in, then restore the student's full ledger"""
+    # Rehydrate first: called from the sign-in callback, before this run's touch_student(),
+    # and a spilled session would otherwise reload its stale file over the restored ledger
+    touch_student()
+    pending = st.session_state.unsynced_progress
+    st.session_state.unsynced_progress = []
+    for kind, args in pending:
+        record_progress(kind, *args)
+    
+    store = get_progress_store()
+    store.flush()
+    saved = store.load_student(st.session_state.student_id)
+    quiz_progress = {f"{question_id}_answered": choice for question_id, choice in saved["answers"].items()}
+    st.session_state.student.restore(saved["xp"], saved["checks"], saved["achievements"], quiz_progress)
+    for question_id, choice in saved["answers"].items():
+        st.session_state[f"quiz_{question_id}"] = choice
+    if saved["short_answers"]:
+        q7, q8 = saved["short_answers"].get("q7", ""), saved["short_answers"].get("q8", "")
+        st.session_state.student.set_short_answers(q7, q8)
+        st.session_state.quiz_q7, st.session_state.quiz_q8 = q7, q8
+    st.session_state.progress_loaded = True
+
+def sign_in_student():
+    student_id = st.session_state.student_id_input.strip()
+    st.session_state.student_id = student_id
+    if student_id:
+        st.query_params["student"] = student_id
+        load_student_progress()
+    else:
+        st.query_params.pop("student", None)
+
+# Learning analytics: events are queued here and written to Parquet by a background thread
+@st.cache_resource
+def get_event_log():
+    return EventLog(
+        settings.EVENT_LOG_DIR,
+        batch_size=settings.EVENT_LOG_BATCH_SIZE,
+        flush_interval=settings.EVENT_LOG_FLUSH_INTERVAL,
+        segment_events=settings.EVENT_LOG_SEGMENT_EVENTS,
+        segment_seconds=settings.EVENT_LOG_SEGMENT_SECONDS,
+    )
+
+def log_event(kind, item="", value="", correct=None, points=None):
+    """Record an analytics event for this session on the page it is viewing"""
+    get_event_log().record(
+        kind, st.session_state.analytics_session, st.session_state.student_id,
+        st.session_state.get("current_page", ""), item, value, correct, points,
+    )
+
+def track_page_view(title):
+    """Log a page view when this session lands on a different page"""
+    if st.session_state.get("current_page") != title:
+        st.session_state.current_page = title
+        log_event(VIEW)
+
+# Session state: initialized on the first run of each browser session
+def init_session_state():
+    """Set up this browser session's state on its first run, and reload a signed-in student's progress"""
+    if 'activity_submitted' not in st.session_state:
+        st.session_state.activity_submitted = False
+    if 'student' not in st.session_state:
+        st.session_state.student = StudentSession()
+    if 'feedback_job_id' not in st.session_state:
+        st.session_state.feedback_job_id = None
+    if 'feedback_core' not in st.session_state:
+        st.session_state.feedback_core = None
+    if 'feedback_result' not in st.session_state:
+        st.session_state.feedback_result = None
+    if 'check_results' not in st.session_state:
+        st.session_state.check_results = {}
+    if 'student_id' not in st.session_state:
+        st.session_state.student_id = st.query_params.get("student", "")
+        st.session_state.student_id_input = st.session_state.student_id
+        st.session_state.progress_loaded = False
+    if 'unsynced_progress' not in st.session_state:
+        st.session_state.unsynced_progress = []
+    if 'analytics_session' not in st.session_state:
+        st.session_state.analytics_session = uuid.uuid4().hex
+    
+    touch_student()
+    if st.session_state.student_id and not st.session_state.progress_loaded:
+        load_student_progress()
+
+# Teacher tools (class data, LLM budget) need the passcode from settings, checked here on the server
+def sign_in_teacher():
+    entered = st.session_state.teacher_passcode_input
+    st.session_state.teacher_passcode_input = ""
+    passcode = settings.TEACHER_PASSCODE
+    st.session_state.teacher_authenticated = bool(passcode) and hmac.compare_digest(
+        entered.encode("utf-8"), passcode.encode("utf-8")
+    )
+    st.session_state.teacher_sign_in_failed = bool(entered) and not st.session_state.teacher_authenticated
+
+def sign_out_teacher():
+    st.session_state.teacher_authenticated = False
+    st.session_state.pop("gradebook_export", None)
+
+def teacher_authenticated():
+    """Whether this session entered the teacher passcode"""
+    return st.session_state.get("teacher_authenticated", False)
+
+# XP Award Function
+@instrumentation.timed()
+def award_xp(points, check_id, achievement_name=None):
+    """Award XP points and track completed checks to prevent double-counting"""
+    if check_id not in st.session_state.student.completed_checks:
+        st.session_state.student.xp_points += points
+        st.session_state.student.completed_checks.add(check_id)
+        record_progress("check", check_id, points)
+        log_event(XP, item=check_id, points=points)
+        if achievement_name:
+            unlock_achievement(achievement_name)
+        return True
+    return False
+
+def unlock_achievement(achievement_name):
+    """Add an achievement once and record it in the progress store"""
+    if achievement_name in st.session_state.student.achievements:
+        return False
+    st.session_state.student.add_achievement(achievement_name)
+    record_progress("achievement", achievement_name)
+    return True
+
+# Quick Check questions run as fragments: answering one reruns only its own card.
+# A full rerun happens only when XP or achievements change, so the sidebar catches up.
+def select_check_choice(key):
+    st.session_state.check_results.pop(key, None)
+    log_event(SELECT, item=key, value=st.session_state[key] or "")
+
+@st.fragment
+def quick_check(key, question, options, answer, xp, correct_message, wrong_message,
+                repeat_message=None, balloons=False, first_steps=False, unlocks=None):
+    """Radio question with a Check Answer button; the result is kept in session state"""
+    touch_student()
+    choice = st.radio(question, options, key=key, on_change=select_check_choice, args=(key,))
+    
+    if st.button("Check Answer", key=f"check_{key}"):
+        log_event(CHECK, item=key, value=choice or "", correct=choice == answer)
+        if choice == answer:
+            newly_awarded = award_xp(xp, key, "🌟 First Steps" if first_steps and not st.session_state.student.achievements else None)
+            
+            unlocked = False
+            if unlocks and all(check in st.session_state.student.completed_checks for check in unlocks["requires"]):
+                unlocked = unlock_achievement(unlocks["achievement"])
+            
+            if unlocked:
+                st.session_state.check_results[key] = ("success", unlocks["message"], True)
+            elif newly_awarded or repeat_message is None:
+                st.session_state.check_results[key] = ("success", correct_message, balloons and newly_awarded)
+            else:
+                st.session_state.check_results[key] = ("success", repeat_message, False)
+            
+            if newly_awarded or unlocked:
+                st.rerun()
+        else:
+            st.session_state.check_results[key] = ("error", wrong_message, False)
+    
+    result = st.session_state.check_results.get(key)
+    if result:
+        kind, message, celebrate = result
+        if celebrate:
+            st.balloons()
+            st.session_state.check_results[key] = (kind, message, False)
+        if kind == "success":
+            st.success(message)
+        else:
+            st.error(message)
+
+# Lesson text, parsed once per process and shared read-only by every session
+@st.cache_resource
+def get_lesson_content():
+    return load_lesson_content(settings.CONTENT_DIR, settings.CONTENT_BUNDLE_PATH)
+
+# Local concept scorers: instant feedback, and a filter deciding which answers need the LLM
+@st.cache_resource
+def get_concept_scorers():
+    content = get_lesson_content()
+    return build_scorers({
+        "q7": content["quiz"]["q7_concepts"],
+        "q8": content["quiz"]["q8_concepts"],
+        "design": content["design_challenge"]["design_concepts"],
+    })
+
+# Shared feedback cache (one per server process, survives restarts on disk)
+@st.cache_resource
+def get_feedback_cache():
+    return FeedbackCache(
+        settings.FEEDBACK_CACHE_PATH,
+        ttl_seconds=settings.FEEDBACK_CACHE_TTL,
+        max_entries=settings.FEEDBACK_CACHE_MAX_ENTRIES,
+    )
+
+# Outbound LLM calls: one rate limiter and one circuit breaker per process
+@st.cache_resource
+def get_llm_breaker():
+    return CircuitBreaker(
+        failure_threshold=settings.LLM_BREAKER_FAILURES,
+        slow_threshold=settings.LLM_BREAKER_SLOW_CALLS,
+        latency_slo=settings.LLM_LATENCY_SLO,
+        open_seconds=settings.LLM_BREAKER_OPEN_SECONDS,
+    )
+
+@st.cache_resource
+def get_llm_rate_limiter():
+    return RateLimiter(
+        rate_per_minute=settings.LLM_RATE_PER_MINUTE,
+        burst=settings.LLM_RATE_BURST,
+        state_path=settings.LLM_RATE_STATE_PATH or None,
+    )
+
+# Quiz engine: questions come from a declarative bank loaded once per process
+@st.cache_resource
+def get_question_bank(path, mtime):
+    """Parse and validate the question bank; reloaded only when the file changes"""
+    return load_question_bank(path)
+
+# Lesson stylesheet: a hashed static file built by tools/build_content.py (see static_assets.py)
+@st.cache_resource
+def get_stylesheet_tag():
+    """A <link> to the built stylesheet, or the inline <style> when it cannot be served"""
+    stylesheet = Stylesheet()
+    streamlit_version = tuple(int(part) for part in st.__version__.split(".")[:2])
+    if (st.get_option("server.enableStaticServing") and streamlit_version >= STATIC_CSS_STREAMLIT
+            and stylesheet.is_published()):
+        return stylesheet.link_tag()
+    return stylesheet.style_tag()
+
+# Styled HTML components (classes from assets/lesson.css); each distinct markup string is built once
+@functools.lru_cache(maxsize=64)
+def page_header_html(title):
+    return (
+        f'<div class="main-header">{title}</div>\n'
+        '<p class="developer-credit">Developed by Xavier Honablue, M.Ed. for Grosse Pointe South High School</p>'
+    )
+
+@functools.lru_cache(maxsize=512)
+def box_html(kind, body):
+    return f'<div class="{kind}-box">\n{body.rstrip()}\n</div>'
+
+def page_header(title):
+    """The banner and developer credit at the top of every page, as one element"""
+    st.markdown(page_header_html(title), unsafe_allow_html=True)
+
+def info_box(body):
+    st.markdown(box_html("info", body), unsafe_allow_html=True)
+
+def success_box(body):
+    st.markdown(box_html("success", body), unsafe_allow_html=True)
+
+def warning_box(body):
+    st.markdown(box_html("warning", body), unsafe_allow_html=True)
+
+def michigan_box(body):
+    st.markdown(box_html("michigan", body), unsafe_allow_html=True)
@@ -0,0 +1,104 @@
+"""Instant, offline keyword/concept scoring of written answers.
+
+Each question (and the design challenge) lists its key concepts in the lesson
+content, each with a few phrasings: "active site", "competitive inhibitor",
+"phosphorylate", "Phase 3", ... Phrases and answers are lowercased, tokenized
+and lightly stemmed, so "inhibits", "inhibition" and "inhibitor" all meet. All
+of a question's phrases are compiled into a single regex alternation, so one
+pass over the answer finds every concept it mentions.
+
+The score decides whether an LLM round trip is worth it. Low-effort answers
+(too short, or no key concept at all) and answers that already cover every
+concept are handled locally in microseconds. Only the partial answers in
+between, where nuanced feedback helps, go to the model.
+"""
+
+import re
+from dataclasses import dataclass
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+# Tried in order (longer endings first); a suffix is stripped only if three letters remain
+_SUFFIXES = (
+    "ational", "ations", "atory", "ation", "ators", "ator", "ating", "ated", "ates", "ate",
+    "ions", "ion", "ings", "ing", "ives", "ive", "ors", "or", "ers", "er",
+    "ies", "ied", "als", "al", "ed", "es", "ly", "s", "e",
+)
+
+
+def stem(word):
+    """Crude suffix-stripping stemmer: enough to merge the usual English inflections"""
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[:-len(suffix)]
+    return word
+
+
+def stems(text):
+    return [stem(token) for token in _TOKEN.findall(text.lower())]
+
+
+@dataclass(frozen=True)
+class ConceptScore:
+    words: int
+    matched: tuple
+    missing: tuple
+    low_effort: bool
+
+    @property
+    def coverage(self):
+        total = len(self.matched) + len(self.missing)
+        return len(self.matched) / total if total else 0.0
+
+    @property
+    def complete(self):
+        return not self.missing
+
+    @property
+    def needs_llm(self):
+        """True only for partial answers, where the model's feedback adds something"""
+        return not (self.low_effort or self.complete)
+
+    def rubric_score(self, max_score):
+        return round(self.coverage * max_score)
+
+    def feedback(self):
+        if self.complete:
+            return "Excellent - your answer uses every key concept: " + ", ".join(self.matched) + "."
+        hint = "Try to explain: " + ", ".join(self.missing) + "."
+        if self.words == 0:
+            return hint
+        if self.low_effort:
+            return "Your answer is very brief. " + hint
+        return "Good start - you mentioned " + ", ".join(self.matched) + ". " + hint
+
+
+class ConceptScorer:
+    """Precompiled matcher for one question's key concepts"""
+
+    def __init__(self, concepts, min_words=12):
+        """``concepts`` maps a concept name to the phrases that express it"""
+        self.names = tuple(concepts)
+        self.min_words = min_words
+        alternatives = []
+        for index, phrases in enumerate(concepts.values()):
+            stemmed = sorted({" ".join(stems(phrase)) for phrase in phrases}, key=len, reverse=True)
+            body = "|".join(re.escape(phrase) for phrase in stemmed if phrase)
+            alternatives.append(f"(?P<c{index}>(?<!\\S)(?:{body})(?!\\S))")
+        self._pattern = re.compile("|".join(alternatives))
+
+    def score(self, text):
+        tokens = stems(text or "")
+        found = {int(match.lastgroup[1:]) for match in self._pattern.finditer(" ".join(tokens))}
+        matched = tuple(name for index, name in enumerate(self.names) if index in found)
+        missing = tuple(name for index, name in enumerate(self.names) if index not in found)
+        return ConceptScore(
+            words=len(tokens),
+            matched=matched,
+            missing=missing,
+            low_effort=len(tokens) < self.min_words or not matched,
+        )
+
+
+def build_scorers(concept_sets, min_words=12):
+    """One scorer per entry of ``{key: {concept: [phrases]}}``"""
+    return {key: ConceptScorer(concepts, min_words) for key, concepts in concept_sets.items()}
@@ -0,0 +1,171 @@
+"""Near-duplicate detection for treatment designs, to reuse generated feedback.
+
+Two students rarely type the same mechanism and rationale word for word, so
+exact cache keys miss most reuse. Professor Xavier's review, though, is mostly
+about the structured choices (disease, target, drug type, delivery, ...). This
+index finds an earlier design with the same choices whose free text is nearly
+the same:
+
+  * the free text is normalized and split into character 5-grams
+  * a 64-bin one-permutation MinHash signature is computed in a single pass
+  * LSH over 16 bands of 4 bins proposes candidates with the same structured
+    choices, and the signature agreement estimates their Jaccard similarity
+
+The index holds at most ``max_entries`` designs and drops the least recently
+used. ``stats`` reports its size and the lookup latency.
+"""
+
+import collections
+import json
+import threading
+import time
+import zlib
+from array import array
+
+FREE_TEXT_FIELDS = ("name", "mechanism", "rationale")
+NUM_BINS = 64
+BAND_ROWS = 4
+_MIX = 0x9E3779B97F4A7C15
+_MASK = (1 << 64) - 1
+_EMPTY = _MASK
+
+
+def structure_key(design):
+    """Hash of the multiple-choice fields; only designs with equal choices are compared"""
+    choices = {field: value for field, value in sorted(design.items()) if field not in FREE_TEXT_FIELDS}
+    return zlib.crc32(json.dumps(choices, ensure_ascii=False, sort_keys=True).encode("utf-8"))
+
+
+def free_text(design):
+    return " ".join(f"{design.get('mechanism') or ''} {design.get('rationale') or ''}".lower().split())
+
+
+def signature(text, ngram=5):
+    """One-permutation MinHash: each shingle hashes once into one of NUM_BINS bins"""
+    bins = [_EMPTY] * NUM_BINS
+    shingles = {text[i:i + ngram] for i in range(max(1, len(text) - ngram + 1))}
+    for shingle in shingles:
+        h = (zlib.crc32(shingle.encode("utf-8")) * _MIX) & _MASK
+        slot = h % NUM_BINS
+        value = h // NUM_BINS
+        if value < bins[slot]:
+            bins[slot] = value
+    # Densify: an empty bin borrows from the next filled one, offset so it cannot collide by accident
+    filled = [i for i, value in enumerate(bins) if value != _EMPTY]
+    if filled and len(filled) < NUM_BINS:
+        for i in range(NUM_BINS):
+            if bins[i] == _EMPTY:
+                source = next((j for j in filled if j > i), filled[0])
+                bins[i] = (bins[source] + (source - i) % NUM_BINS * _MIX) & (_MASK >> 6)
+    return array("Q", bins)
+
+
+def similarity(a, b):
+    """Estimated Jaccard similarity of two signatures"""
+    return sum(x == y for x, y in zip(a, b)) / NUM_BINS
+
+
+def adapt_feedback(text, source_name, target_name):
+    """Point feedback written for another student's design at this one"""
+    source_name = (source_name or "").strip()
+    if source_name and source_name in text:
+        text = text.replace(source_name, (target_name or "").strip() or "your treatment")
+    return text
+
+
+class _Entry:
+    __slots__ = ("cache_key", "name", "signature", "bands")
+
+    def __init__(self, cache_key, name, signature, bands):
+        self.cache_key = cache_key
+        self.name = name
+        self.signature = signature
+        self.bands = bands
+
+
+Match = collections.namedtuple("Match", "cache_key name similarity")
+
+
+class DesignSimilarityIndex:
+    """Bounded in-memory LSH index from designs to the cache keys of their feedback"""
+
+    def __init__(self, threshold=0.8, max_entries=2000, latency_window=1000):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self._buckets = collections.defaultdict(set)
+        self._lock = threading.Lock()
+        self._lookups = 0
+        self._matches = 0
+        self._latencies = collections.deque(maxlen=latency_window)
+
+    def _bands(self, design, sig):
+        key = structure_key(design)
+        return tuple(
+            hash((key, band, tuple(sig[band * BAND_ROWS:(band + 1) * BAND_ROWS])))
+            for band in range(NUM_BINS // BAND_ROWS)
+        )
+
+    def add(self, design, cache_key):
+        """Index a design whose feedback is stored under ``cache_key``"""
+        sig = signature(free_text(design))
+        entry = _Entry(cache_key, design.get("name") or "", sig, self._bands(design, sig))
+        with self._lock:
+            if cache_key in self._entries:
+                self._entries.move_to_end(cache_key)
+                return
+            self._entries[cache_key] = entry
+            for band in entry.bands:
+                self._buckets[band].add(cache_key)
+            while len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                for band in evicted.bands:
+                    bucket = self._buckets[band]
+                    bucket.discard(evicted.cache_key)
+                    if not bucket:
+                        del self._buckets[band]
+
+    def query(self, design):
+        """Most similar indexed design at or above the threshold, as a Match, or None"""
+        started = time.perf_counter()
+        sig = signature(free_text(design))
+        bands = self._bands(design, sig)
+        best = None
+        with self._lock:
+            candidates = set()
+            for band in bands:
+                candidates |= self._buckets.get(band, set())
+            for cache_key in candidates:
+                entry = self._entries[cache_key]
+                score = similarity(sig, entry.signature)
+                if score >= self.threshold and (best is None or score > best.similarity):
+                    best = Match(cache_key, entry.name, score)
+            if best is not None:
+                self._entries.move_to_end(best.cache_key)
+                self._matches += 1
+            self._lookups += 1
+            self._latencies.append(time.perf_counter() - started)
+        return best
+
+    def discard(self, cache_key):
+        """Forget a design whose feedback is no longer cached"""
+        with self._lock:
+            entry = self._entries.pop(cache_key, None)
+            if entry is not None:
+                for band in entry.bands:
+                    bucket = self._buckets[band]
+                    bucket.discard(cache_key)
+                    if not bucket:
+                        del self._buckets[band]
+
+    def stats(self):
+        with self._lock:
+            latencies = sorted(self._latencies)
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "lookups": self._lookups,
+                "matches": self._matches,
+                "mean_lookup_ms": sum(latencies) / len(latencies) * 1000 if latencies else 0.0,
+                "p95_lookup_ms": latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0.0,
+            }
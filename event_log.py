@@ -0,0 +1,252 @@
+"""Append-only learning-analytics event log, stored as compressed Parquet segments.
+
+Answer selections, Check Answer clicks, page views and XP awards are recorded
+with ``record`` (which only enqueues). A background thread writes them in
+batches: one zstd-compressed Parquet row group every ``batch_size`` events or
+``flush_interval`` seconds. Row groups go into the open segment,
+``events-<start>-<pid>.parquet.part``, which is renamed to ``.parquet`` once it
+holds ``segment_events`` events or is ``segment_seconds`` old, at exit, or
+on ``flush()``. Closed segments are never modified again, and readers only look
+at closed ones. A crash loses at most the open segment.
+
+``load_events`` reads the segments back as one DataFrame (strings as
+categoricals, so millions of events stay compact). ``item_difficulty`` and
+``time_on_page`` aggregate it with vectorized pandas and NumPy operations
+(factorized keys, grouped reductions), never a Python loop over events.
+"""
+
+import atexit
+import glob
+import logging
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+SCHEMA = pa.schema([
+    ("ts", pa.float64()),  # Unix time in seconds
+    ("session", pa.string()),  # browser session
+    ("student", pa.string()),  # signed-in student id, or ""
+    ("kind", pa.string()),
+    ("page", pa.string()),
+    ("item", pa.string()),  # question or check id
+    ("value", pa.string()),  # the chosen option
+    ("correct", pa.bool_()),  # null when the event is not graded
+    ("points", pa.int32()),
+])
+
+# Event kinds
+SELECT = "select"  # an answer option was chosen (graded for quiz questions)
+CHECK = "check"  # Check Answer on a Quick Check
+VIEW = "view"  # a page was opened
+XP = "xp"  # XP was awarded
+
+logger = logging.getLogger(__name__)
+
+
+def segment_paths(directory):
+    """Closed segments, oldest first"""
+    return sorted(glob.glob(os.path.join(directory, "events-*.parquet")))
+
+
+class EventLog:
+    """Write-behind event log shared by every session in the process"""
+
+    def __init__(self, directory, batch_size=5000, flush_interval=30.0, segment_events=500_000,
+                 segment_seconds=600.0):
+        self.directory = directory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.segment_events = segment_events
+        self.segment_seconds = segment_seconds
+        os.makedirs(directory, exist_ok=True)
+        self._queue = queue.Queue()
+        self._segment = None  # (writer, part path, opened at)
+        self._segment_rows = 0
+        self._events_written = 0
+        self._segments_closed = 0
+        self._thread = threading.Thread(target=self._write_loop, name="event-log", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def record(self, kind, session, student="", page="", item="", value="", correct=None, points=None):
+        self._queue.put((time.time(), session, student, kind, page, item, value, correct, points))
+
+    def flush(self, timeout=10):
+        """Block until every event queued so far is in a closed, readable segment"""
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def stats(self):
+        return {
+            "pending": self._queue.qsize(),
+            "events_written": self._events_written,
+            "segments_closed": self._segments_closed,
+        }
+
+    # Background writer
+
+    def _write_loop(self):
+        batch = []
+        waiters = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if self._segment is not None:
+                segment_deadline = self._segment[2] + self.segment_seconds - time.monotonic()
+                timeout = max(0.0, segment_deadline if timeout is None else min(timeout, segment_deadline))
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+            elif item is not None:
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            if waiters or len(batch) >= self.batch_size or (batch and time.monotonic() >= deadline):
+                try:
+                    self._write(batch)
+                except Exception:
+                    logger.exception("Failed to write %d analytics events", len(batch))
+                finally:
+                    batch = []
+                    deadline = None
+            if self._segment is not None and (
+                waiters or self._segment_rows >= self.segment_events
+                or time.monotonic() - self._segment[2] >= self.segment_seconds
+            ):
+                self._close_segment()
+            for waiter in waiters:
+                waiter.set()
+            waiters = []
+
+    def _write(self, batch):
+        if not batch:
+            return
+        table = pa.Table.from_arrays(
+            [pa.array(column, type=field.type) for column, field in zip(zip(*batch), SCHEMA)], schema=SCHEMA
+        )
+        if self._segment is None:
+            part = os.path.join(self.directory, f"events-{time.time_ns()}-{os.getpid()}.parquet.part")
+            self._segment = (pq.ParquetWriter(part, SCHEMA, compression="zstd"), part, time.monotonic())
+            self._segment_rows = 0
+        self._segment[0].write_table(table)
+        self._segment_rows += len(batch)
+        self._events_written += len(batch)
+
+    def _close_segment(self):
+        writer, part, _ = self._segment
+        self._segment = None
+        try:
+            writer.close()
+            os.replace(part, part[:-len(".part")])
+            self._segments_closed += 1
+        except Exception:
+            logger.exception("Failed to close analytics segment %s", part)
+
+
+# Queries
+
+def load_events(directory, columns=None, since=None):
+    """Every event in the closed segments as a DataFrame, optionally only from ``since`` (Unix time)"""
+    paths = segment_paths(directory)
+    if not paths:
+        frame = SCHEMA.empty_table().to_pandas()
+        return frame[columns] if columns else frame
+    dataset = ds.dataset(paths, format="parquet", schema=SCHEMA)
+    table = dataset.to_table(columns=columns, filter=None if since is None else ds.field("ts") >= since)
+    frame = table.to_pandas(strings_to_categorical=True)
+    if "correct" in frame:
+        frame["correct"] = frame["correct"].astype("boolean")
+    if "points" in frame:
+        frame["points"] = frame["points"].astype("Int32")
+    return frame
+
+
+def _who(events):
+    """Integer id per student: the signed-in student, or the browser session for anonymous ones"""
+    student_codes, students = pd.factorize(events["student"])
+    session_codes, _ = pd.factorize(events["session"])
+    anonymous = (events["student"] == "").to_numpy()
+    return np.where(anonymous, session_codes + len(students), student_codes)
+
+
+def item_difficulty(events):
+    """Per question or check: graded attempts, students, share correct and difficulty.
+
+    ``first_try_correct`` is the share of students whose first graded attempt
+    was right, and ``difficulty`` is one minus it (the classical item p-value,
+    inverted). ``attempts_per_student`` shows how often students retried.
+    """
+    graded = events.loc[events["kind"].isin([SELECT, CHECK]) & events["correct"].notna()]
+    item_codes, items = pd.factorize(graded["item"])
+    graded = pd.DataFrame({
+        "ts": graded["ts"].to_numpy(),
+        "who": _who(graded),
+        "item": item_codes,
+        "correct": graded["correct"].to_numpy(dtype=bool),
+    }).sort_values("ts", kind="stable")
+    first = graded.loc[~graded.duplicated(["who", "item"])]
+
+    by_item = graded.groupby("item")
+    result = pd.DataFrame({
+        "attempts": by_item.size(),
+        "students": first.groupby("item").size(),
+        "p_correct": by_item["correct"].mean(),
+        "first_try_correct": first.groupby("item")["correct"].mean(),
+    })
+    result.index = pd.Index(np.asarray(items)[result.index], name="item")
+    result["attempts_per_student"] = result["attempts"] / result["students"]
+    result["difficulty"] = 1 - result["first_try_correct"]
+    return result.sort_values("difficulty", ascending=False)
+
+
+def time_on_page(events, idle_seconds=600):
+    """Per page: visits, sessions and the mean, median and total time spent.
+
+    A visit runs from a page view to the session's next page view. The gaps
+    between its events count towards it, each up to ``idle_seconds`` (a longer
+    gap means the student left). Nothing counts after a session's last event,
+    since its end is unknown.
+    """
+    session_codes, _ = pd.factorize(events["session"])
+    page_codes, pages = pd.factorize(events["page"])
+    order = np.lexsort((events["ts"].to_numpy(), session_codes))
+    ts = events["ts"].to_numpy()[order]
+    session = session_codes[order]
+    view = (events["kind"] == VIEW).to_numpy()[order]
+
+    new_session = np.ones(len(ts), dtype=bool)
+    new_session[1:] = session[1:] != session[:-1]
+    # Gap to the session's next event (none after its last one)
+    seconds = np.zeros(len(ts))
+    seconds[:-1] = np.where(new_session[1:], 0.0, np.minimum(np.diff(ts), idle_seconds))
+    # A visit starts at every page view, and where a session starts
+    starts = np.flatnonzero(view | new_session)
+    visits = pd.DataFrame({
+        "session": session[starts],
+        "page": page_codes[order][starts],
+        "seconds": np.add.reduceat(seconds, starts) if len(starts) else seconds[:0],
+    })
+
+    by_page = visits.groupby("page")
+    result = pd.DataFrame({
+        "visits": by_page.size(),
+        "sessions": by_page["session"].nunique(),
+        "mean_seconds": by_page["seconds"].mean(),
+        "median_seconds": by_page["seconds"].median(),
+        "total_hours": by_page["seconds"].sum() / 3600,
+    })
+    result.index = pd.Index(np.asarray(pages)[result.index], name="page")
+    return result.sort_values("total_hours", ascending=False)
@@ -0,0 +1,129 @@
+"""Persistent cache for Professor Xavier's design feedback.
+
+Feedback is keyed on a normalized hash of the student's design, so classmates
+who submit the same design share one completion. Entries live in SQLite, expire
+after a TTL and are evicted least-recently-used once the cache is full.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# Bump when the feedback prompt changes so stale completions are not served
+PROMPT_VERSION = 1
+
+DESIGN_FIELDS = (
+    "name", "disease", "target", "drug_type", "mechanism", "delivery",
+    "efficacy_priority", "side_effects", "cost", "dosing", "rationale",
+)
+
+
+def _normalize(value):
+    """Case-fold and collapse whitespace so trivial edits hash the same"""
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple, set)):
+        return sorted(_normalize(v) for v in value)
+    return " ".join(str(value).split()).casefold()
+
+
+def design_cache_key(design, namespace="design"):
+    """Return a stable hex digest for a drug design dict"""
+    normalized = {field: _normalize(design.get(field)) for field in DESIGN_FIELDS}
+    payload = json.dumps([namespace, PROMPT_VERSION, normalized], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class FeedbackCache:
+    """SQLite-backed TTL + LRU cache shared by every session in the process"""
+
+    def __init__(self, path, ttl_seconds=7 * 24 * 3600, max_entries=5000):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS feedback (
+                key TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                created REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS feedback_lru ON feedback (last_access)")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS counters (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            )
+        """)
+        self._conn.execute("INSERT OR IGNORE INTO counters VALUES ('hits', 0), ('misses', 0)")
+
+    def _count(self, name):
+        self._conn.execute("UPDATE counters SET value = value + 1 WHERE name = ?", (name,))
+
+    def get(self, key):
+        """Return cached feedback text, or None on a miss or expired entry"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, created FROM feedback WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._count("misses")
+                return None
+            text, created = row
+            if now - created > self.ttl_seconds:
+                self._conn.execute("DELETE FROM feedback WHERE key = ?", (key,))
+                self._count("misses")
+                return None
+            self._conn.execute("UPDATE feedback SET last_access = ? WHERE key = ?", (now, key))
+            self._count("hits")
+            return text
+
+    def put(self, key, text):
+        """Store feedback text and evict the least recently used overflow"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO feedback (key, text, created, last_access) VALUES (?, ?, ?, ?)",
+                    (key, text, now, now),
+                )
+                self._conn.execute(
+                    "DELETE FROM feedback WHERE created < ?", (now - self.ttl_seconds,)
+                )
+                self._conn.execute("""
+                    DELETE FROM feedback WHERE key IN (
+                        SELECT key FROM feedback ORDER BY last_access DESC LIMIT -1 OFFSET ?
+                    )
+                """, (self.max_entries,))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def stats(self):
+        """Hit/miss counters and current size"""
+        with self._lock:
+            counters = dict(self._conn.execute("SELECT name, value FROM counters"))
+            entries = self._conn.execute("SELECT COUNT(*) FROM feedback").fetchone()[0]
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            "hits": counters["hits"],
+            "misses": counters["misses"],
+            "entries": entries,
+            "hit_rate": counters["hits"] / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,128 @@
+"""Background job queue for LLM feedback requests.
+
+Feedback runs on a bounded thread pool instead of the Streamlit script thread,
+so reruns triggered while Professor Xavier is "thinking" neither cancel nor
+re-send the request. The page keeps only a job id in session state and polls
+the job for (partial) text. Submissions with the same key while a job is still
+in flight are attached to that job instead of starting a new one.
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class FeedbackJob:
+    """State of one feedback request, safe to read from any thread"""
+
+    def __init__(self, key):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.status = QUEUED
+        self.error = None
+        self.http_status = None
+        self.queue_position = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self._chunks = []
+        self._lock = threading.Lock()
+
+    @property
+    def text(self):
+        with self._lock:
+            return "".join(self._chunks)
+
+    @property
+    def is_finished(self):
+        return self.status in (DONE, FAILED)
+
+    def append(self, chunk):
+        with self._lock:
+            self._chunks.append(chunk)
+
+    def fail(self, error, http_status=None):
+        self.error = error
+        self.http_status = http_status
+        self.finish(FAILED)
+
+    def finish(self, status):
+        # ``finished`` is set first: other threads take a finished status to mean it is there
+        self.finished = time.time()
+        self.status = status
+
+
+class FeedbackJobQueue:
+    """Runs feedback jobs on a fixed number of worker threads shared by all sessions"""
+
+    def __init__(self, max_workers=8, retention_seconds=3600):
+        self.max_workers = max_workers
+        self.retention_seconds = retention_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="feedback")
+        self._jobs = {}
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key, work):
+        """Queue ``work(job)`` unless a job for ``key`` is already in flight.
+
+        ``work`` streams text into the job with ``job.append`` and may call
+        ``job.fail``; an exception it raises also marks the job failed.
+        Returns the (possibly shared) job.
+        """
+        with self._lock:
+            self._prune()
+            job_id = self._in_flight.get(key)
+            if job_id is not None:
+                return self._jobs[job_id]
+
+            job = FeedbackJob(key)
+            self._jobs[job.id] = job
+            self._in_flight[key] = job.id
+
+        self._executor.submit(self._run, job, work)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def stats(self):
+        with self._lock:
+            statuses = [job.status for job in self._jobs.values()]
+        return {
+            "queued": statuses.count(QUEUED),
+            "running": statuses.count(RUNNING),
+            "done": statuses.count(DONE),
+            "failed": statuses.count(FAILED),
+            "max_workers": self.max_workers,
+        }
+
+    def _run(self, job, work):
+        job.started = time.time()
+        job.status = RUNNING
+        try:
+            work(job)
+            if job.status == RUNNING:
+                job.finish(DONE)
+        except Exception as e:
+            job.fail(str(e))
+        finally:
+            with self._lock:
+                if self._in_flight.get(job.key) == job.id:
+                    del self._in_flight[job.key]
+
+    def _prune(self):
+        cutoff = time.time() - self.retention_seconds
+        stale = [
+            job_id for job_id, job in self._jobs.items()
+            if job.is_finished and job.finished < cutoff
+        ]
+        for job_id in stale:
+            del self._jobs[job_id]
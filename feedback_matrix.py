@@ -0,0 +1,245 @@
+"""Precomputed feedback for the structured choices of a treatment design.
+
+Apart from its name, mechanism, rationale and side effects, a design is a
+choice from seven small lists: disease, molecular target (four per disease),
+drug type, delivery route, efficacy priority, cost band and dosing. That is
+4 x 4 x 5 x 4 x 3 x 4 x 5 = 19,200 combinations. ``tools/precompute_feedback.py``
+asks Professor Xavier about every one of them offline. The reviews are stored
+zlib-compressed in SQLite under their mixed-radix combination number, so serving
+one is a single primary-key lookup. At request time only the student's own
+writing still needs the LLM (see ``build_commentary_prompt`` in
+lesson_pages/design_challenge.py).
+
+The option lists come from the lesson content. The store records a digest of
+them and refuses to serve entries built for different lists.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+# Bump when the core prompt changes so the matrix is rebuilt
+MATRIX_VERSION = 1
+
+STRUCTURED_FIELDS = ("disease", "target", "drug_type", "delivery", "efficacy_priority", "cost", "dosing")
+
+# Content lists for every structured field except the per-disease targets
+_OPTION_LISTS = {
+    "drug_type": "drug_types",
+    "delivery": "delivery_routes",
+    "efficacy_priority": "efficacy_priorities",
+    "cost": "cost_bands",
+    "dosing": "dosing_options",
+}
+
+
+class DesignOptions:
+    """The choices offered by the design form, and the numbering of their combinations"""
+
+    def __init__(self, content):
+        """``content`` is the design_challenge lesson page"""
+        self.diseases = tuple(content["diseases"])
+        self.targets = {disease: tuple(info["target_options"]) for disease, info in content["diseases"].items()}
+        self.lists = {field: tuple(content[key]) for field, key in _OPTION_LISTS.items()}
+        self.targets_per_disease = max(len(targets) for targets in self.targets.values())
+        # Mixed-radix place values, disease most significant
+        self._radixes = [len(self.diseases), self.targets_per_disease] + [len(self.lists[f]) for f in STRUCTURED_FIELDS[2:]]
+        self.size = 1
+        for radix in self._radixes:
+            self.size *= radix
+        # Diseases with fewer targets leave unused numbers, so count the real combinations
+        self.count = self.size // (len(self.diseases) * self.targets_per_disease) * sum(map(len, self.targets.values()))
+        payload = json.dumps([MATRIX_VERSION, self.diseases, self.targets, self.lists], ensure_ascii=False, sort_keys=True)
+        self.digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def index(self, design):
+        """Combination number of a design dict, or None if any choice is not offered"""
+        try:
+            disease = design["disease"]
+            digits = [self.diseases.index(disease), self.targets[disease].index(design["target"])]
+            digits += [self.lists[field].index(design[field]) for field in STRUCTURED_FIELDS[2:]]
+        except (KeyError, ValueError):
+            return None
+        number = 0
+        for digit, radix in zip(digits, self._radixes):
+            number = number * radix + digit
+        return number
+
+    def combination(self, number):
+        """Structured fields for a combination number, or None for an unused target slot"""
+        digits = []
+        for radix in reversed(self._radixes):
+            number, digit = divmod(number, radix)
+            digits.append(digit)
+        digits.reverse()
+        disease = self.diseases[digits[0]]
+        if digits[1] >= len(self.targets[disease]):
+            return None
+        design = {"disease": disease, "target": self.targets[disease][digits[1]]}
+        for field, digit in zip(STRUCTURED_FIELDS[2:], digits[2:]):
+            design[field] = self.lists[field][digit]
+        return design
+
+    def __iter__(self):
+        """(number, structured fields) for every valid combination"""
+        for number in range(self.size):
+            design = self.combination(number)
+            if design is not None:
+                yield number, design
+
+
+def build_core_prompt(design):
+    """Prompt for the part of the review that depends only on the structured choices"""
+    return f"""You are Professor Xavier, a pharmaceutical scientist and biology educator helping high school students understand drug development for autoimmune diseases.
+
+A student has designed a treatment for an autoimmune disease by choosing:
+- **Target Disease:** {design['disease']}
+- **Molecular Target:** {design['target']}
+- **Drug Type:** {design['drug_type']}
+- **Route of Administration:** {design['delivery']}
+- **Efficacy vs Safety Priority:** {design['efficacy_priority']}
+- **Expected Cost:** {design['cost']}
+- **Dosing Frequency:** {design['dosing']}
+
+Write the part of your feedback that is about these choices. Do not refer to a treatment name,
+mechanism description or rationale; the student's own writing is reviewed separately.
+
+### 1. TARGET EVALUATION
+- Is this a good target for this disease? Explain the biology
+- What role does this target play in the disease pathway?
+- Are there existing drugs targeting this? How does the student's approach compare?
+
+### 2. DRUG TYPE ASSESSMENT
+- Is the chosen drug type appropriate for this target?
+- Explain structure-function: How would a {design['drug_type']} interact with {design['target']}?
+- What are the advantages and limitations of this drug type?
+
+### 3. PRACTICAL CONSIDERATIONS
+- Comment on the delivery route, dosing frequency and cost
+- Do these fit the drug type and the efficacy vs safety priority?
+
+### 4. HOMEWORK RESOURCES
+Recommend 2-3 specific resources with URLs (Khan Academy, CK-12, FDA, NIH), formatted as:
+"📚 **Study These Resources:**
+1. [Resource Name](URL) - How it relates to the design"
+
+Be encouraging but scientifically accurate. Use specific molecular details where appropriate."""
+
+
+class FeedbackMatrix:
+    """SQLite store of precomputed core feedback, keyed by combination number"""
+
+    def __init__(self, path, options):
+        self.path = path
+        self.options = options
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS matrix (
+                combo INTEGER PRIMARY KEY,
+                text BLOB NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._conn.execute("INSERT OR IGNORE INTO meta VALUES ('digest', ?)", (options.digest,))
+        stored = self._conn.execute("SELECT value FROM meta WHERE name = 'digest'").fetchone()[0]
+        self.valid = stored == options.digest
+
+    def get(self, design):
+        """Core feedback for a design dict, or None if it is not (validly) precomputed"""
+        number = self.options.index(design) if self.valid else None
+        with self._lock:
+            row = None
+            if number is not None:
+                row = self._conn.execute("SELECT text FROM matrix WHERE combo = ?", (number,)).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def put_many(self, rows):
+        """Store (combination number, text) pairs in one transaction"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO matrix (combo, text) VALUES (?, ?)",
+                    [(number, zlib.compress(text.encode("utf-8"), 9)) for number, text in rows],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def missing(self):
+        """Combination numbers that still have no stored feedback"""
+        with self._lock:
+            stored = {number for (number,) in self._conn.execute("SELECT combo FROM matrix")}
+        return [number for number, _ in self.options if number not in stored]
+
+    def reset(self):
+        """Drop every entry and adopt the current option lists"""
+        with self._lock:
+            self._conn.execute("DELETE FROM matrix")
+            self._conn.execute("UPDATE meta SET value = ? WHERE name = 'digest'", (self.options.digest,))
+        self.valid = True
+
+    def stats(self):
+        with self._lock:
+            entries, stored_bytes = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(text)), 0) FROM matrix").fetchone()
+            hits, misses = self._hits, self._misses
+        return {
+            "entries": entries if self.valid else 0,
+            "combinations": self.options.count,
+            "bytes": stored_bytes,
+            "hits": hits,
+            "misses": misses,
+        }
+
+
+def precompute(matrix, request, numbers, concurrency=4, commit_every=50, on_progress=None):
+    """Generate and store core feedback for ``numbers``; returns (stored, failed, seconds).
+
+    ``request(prompt) -> text`` is the LLM call (see
+    ``short_answer_grading.make_llm_requester``). Results are committed every
+    ``commit_every`` combinations, so an interrupted run resumes where it stopped.
+    """
+    started = time.perf_counter()
+    stored = failed = 0
+
+    def generate(number):
+        try:
+            return number, request(build_core_prompt(matrix.options.combination(number)))
+        except Exception:
+            return number, None
+
+    pending = []
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="precompute") as pool:
+        for number, text in pool.map(generate, numbers):
+            if text:
+                pending.append((number, text.strip()))
+                stored += 1
+            else:
+                failed += 1
+            if len(pending) >= commit_every:
+                matrix.put_many(pending)
+                pending = []
+                if on_progress is not None:
+                    on_progress(stored, failed)
+    if pending:
+        matrix.put_many(pending)
+    return stored, failed, time.perf_counter() - started
@@ -0,0 +1,161 @@
+"""Class gradebook export, streamed out of the progress store a chunk of students at a time.
+
+One row per student: XP, completed Quick Checks, achievements, the first
+answer to each quiz question (and whether it was right) and the latest short
+answers. Students are read in ``student_id`` order, ``chunk_size`` at a time,
+so memory stays bounded by the chunk however many students a district has.
+Every chunk has the same columns, whether it becomes appended CSV rows or a
+Parquet row group.
+
+The export reads through its own connection inside one read transaction. In WAL
+mode that gives a consistent snapshot while the app keeps writing progress.
+"""
+
+import re
+import time
+
+import pandas as pd
+
+from progress_store import connect
+
+DEFAULT_CHUNK_SIZE = 2000
+FORMATS = ("csv", "parquet")
+MIME_TYPES = {"csv": "text/csv", "parquet": "application/vnd.apache.parquet"}
+
+# Next chunk of student ids after a cursor; each arm walks its table's primary key index
+_NEXT_STUDENTS = " UNION ".join(
+    f"SELECT * FROM (SELECT DISTINCT student_id FROM {table} WHERE student_id > :after ORDER BY student_id LIMIT :n)"
+    for table in ("xp_ledger", "achievements", "quiz_answers", "short_answers")
+) + " ORDER BY student_id LIMIT :n"
+
+
+def _question_order(question_id):
+    """Sort q2 before q10"""
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", question_id)]
+
+
+def _joined(series):
+    return ";".join(series)
+
+
+class GradebookReader:
+    """Yields the gradebook as DataFrames of at most ``chunk_size`` students"""
+
+    def __init__(self, db_path, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.db_path = db_path
+        self.chunk_size = chunk_size
+
+    def _columns(self, conn):
+        quiz = sorted((q for (q,) in conn.execute("SELECT DISTINCT question_id FROM quiz_answers")), key=_question_order)
+        short = sorted((q for (q,) in conn.execute("SELECT DISTINCT question_id FROM short_answers")), key=_question_order)
+        columns = {
+            "student_id": "string",
+            "xp": "int64",
+            "checks_completed": "int64",
+            "completed_checks": "string",
+            "achievement_count": "int64",
+            "achievements": "string",
+            "quiz_answered": "int64",
+            "quiz_correct": "int64",
+        }
+        for question_id in quiz:
+            columns[f"{question_id}_answer"] = "string"
+            columns[f"{question_id}_correct"] = "boolean"
+        for question_id in short:
+            columns[f"{question_id}_short_answer"] = "string"
+        return columns
+
+    def _chunk(self, conn, students, columns):
+        params = {"first": students[0], "last": students[-1]}
+        where = "WHERE student_id BETWEEN :first AND :last"
+        frame = pd.DataFrame(index=pd.Index(students, name="student_id"))
+
+        checks = pd.read_sql_query(f"SELECT student_id, check_id, points FROM xp_ledger {where} ORDER BY awarded_at", conn, params=params)
+        by_student = checks.groupby("student_id")
+        frame["xp"] = by_student["points"].sum()
+        frame["checks_completed"] = by_student.size()
+        frame["completed_checks"] = by_student["check_id"].agg(_joined)
+
+        achievements = pd.read_sql_query(f"SELECT student_id, achievement FROM achievements {where} ORDER BY awarded_at", conn, params=params)
+        by_student = achievements.groupby("student_id")
+        frame["achievement_count"] = by_student.size()
+        frame["achievements"] = by_student["achievement"].agg(_joined)
+
+        answers = pd.read_sql_query(f"SELECT student_id, question_id, choice, correct FROM quiz_answers {where}", conn, params=params)
+        answers["correct"] = answers["correct"].astype(bool)
+        by_student = answers.groupby("student_id")
+        frame["quiz_answered"] = by_student.size()
+        frame["quiz_correct"] = by_student["correct"].sum()
+        if not answers.empty:
+            wide = answers.pivot(index="student_id", columns="question_id", values=["choice", "correct"])
+            for question_id in wide["choice"].columns:
+                frame[f"{question_id}_answer"] = wide["choice"][question_id]
+                frame[f"{question_id}_correct"] = wide["correct"][question_id]
+
+        short = pd.read_sql_query(f"SELECT student_id, question_id, answer FROM short_answers {where}", conn, params=params)
+        if not short.empty:
+            wide = short.pivot(index="student_id", columns="question_id", values="answer")
+            for question_id in wide.columns:
+                frame[f"{question_id}_short_answer"] = wide[question_id]
+
+        frame = frame.reset_index().reindex(columns=list(columns))
+        for column, dtype in columns.items():
+            if dtype == "int64":
+                frame[column] = frame[column].fillna(0)
+        return frame.astype(columns)
+
+    def __iter__(self):
+        conn = connect(self.db_path)
+        try:
+            # One read transaction: every chunk sees the same snapshot
+            conn.execute("BEGIN")
+            columns = self._columns(conn)
+            after = ""
+            while True:
+                students = [s for (s,) in conn.execute(_NEXT_STUDENTS, {"after": after, "n": self.chunk_size})]
+                if not students:
+                    break
+                yield self._chunk(conn, students, columns)
+                after = students[-1]
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+
+def write_csv(chunks, target):
+    """Append each chunk to a CSV file (path or text buffer); returns the row count"""
+    rows = 0
+    for chunk in chunks:
+        chunk.to_csv(target, mode="w" if rows == 0 else "a", header=rows == 0, index=False)
+        rows += len(chunk)
+    return rows
+
+
+def write_parquet(chunks, target):
+    """Write each chunk as a Parquet row group (path or binary buffer); returns the row count"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    rows = 0
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(target, table.schema, compression="zstd")
+            writer.write_table(table)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def export_gradebook(db_path, target, fmt="csv", chunk_size=DEFAULT_CHUNK_SIZE):
+    """Stream the gradebook to ``target``; returns (rows, seconds)"""
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown gradebook format {fmt!r}; expected one of {', '.join(FORMATS)}")
+    started = time.perf_counter()
+    chunks = GradebookReader(db_path, chunk_size)
+    rows = write_csv(chunks, target) if fmt == "csv" else write_parquet(chunks, target)
+    return rows, time.perf_counter() - started
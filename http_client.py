@@ -0,0 +1,46 @@
+"""Process-wide pooled HTTP session for outbound LLM calls.
+
+One ``requests.Session`` is created per server process through
+``st.cache_resource``, so every rerun and every student session reuses the same
+keep-alive connections instead of paying a new TCP+TLS handshake per click.
+"""
+
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import settings
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def create_session(pool_size=32, max_retries=3, backoff_factor=0.5):
+    """Build a session with a bounded connection pool and retry/backoff on 429/5xx"""
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=0,
+        status=max_retries,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"POST"}),
+        backoff_factor=backoff_factor,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry, pool_block=True)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@st.cache_resource
+def get_session():
+    """The shared session, created on first use"""
+    return create_session(
+        pool_size=settings.HTTP_POOL_SIZE,
+        max_retries=settings.HTTP_MAX_RETRIES,
+        backoff_factor=settings.HTTP_BACKOFF_FACTOR,
+    )
@@ -0,0 +1,244 @@
+"""Opt-in timing of the rerun hot path (set ``BLUEDEVIL_PROFILE=1``).
+
+When profiling is off, a ``timed`` function costs one global check per call
+(the decorator runs at import, before profiling is configured) and ``span``
+returns a no-op context manager. When it is on, every span feeds a latency
+histogram, and each rerun records its total time and the bytes of
+markdown/HTML it sent to the browser. The results can be exported as:
+
+  * Prometheus text, from ``GET /metrics`` on ``BLUEDEVIL_PROFILE_PORT``
+    (``/metrics.json`` serves the same numbers as JSON)
+  * a Chrome trace-event file (``BLUEDEVIL_PROFILE_TRACE``) that opens in
+    chrome://tracing or https://ui.perfetto.dev
+"""
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BYTE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576)
+
+_profiler = None
+_configure_lock = threading.Lock()
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "buckets": dict(zip(self.buckets, self.counts)),
+        }
+
+
+class Profiler:
+    """Span histograms, per-rerun markdown byte counts and an optional trace file"""
+
+    def __init__(self, trace_path=None):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._spans = {}
+        self._rerun_bytes = Histogram(BYTE_BUCKETS)
+        self._runs_started = 0
+        self._origin = time.perf_counter()
+        self._trace = None
+        if trace_path:
+            directory = os.path.dirname(trace_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # JSON array format: the viewer accepts a missing closing bracket,
+            # so events can simply be appended as they happen
+            self._trace = open(trace_path, "w", encoding="utf-8")
+            self._trace.write("[\n")
+
+    @contextlib.contextmanager
+    def span(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, started, time.perf_counter() - started)
+
+    def observe(self, name, started, seconds):
+        with self._lock:
+            histogram = self._spans.get(name)
+            if histogram is None:
+                histogram = self._spans[name] = Histogram(LATENCY_BUCKETS)
+            histogram.observe(seconds)
+            if self._trace:
+                event = {
+                    "name": name,
+                    "ph": "X",
+                    "ts": round((started - self._origin) * 1e6),
+                    "dur": round(seconds * 1e6),
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                }
+                self._trace.write(json.dumps(event) + ",\n")
+
+    # Reruns run on one script thread each, so per-rerun counters are thread-local
+
+    def start_rerun(self):
+        self._local.started = time.perf_counter()
+        self._local.bytes = 0
+        # Also counts runs cut short by a rerun request (st.rerun, st.switch_page)
+        with self._lock:
+            self._runs_started += 1
+
+    def finish_rerun(self):
+        started = getattr(self._local, "started", None)
+        if started is None:
+            return
+        self.observe("rerun", started, time.perf_counter() - started)
+        with self._lock:
+            self._rerun_bytes.observe(self._local.bytes)
+            if self._trace:
+                self._trace.flush()
+        self._local.started = None
+
+    def add_bytes(self, count):
+        self._local.bytes = getattr(self._local, "bytes", 0) + count
+
+    # Export
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "spans": {name: histogram.as_dict() for name, histogram in sorted(self._spans.items())},
+                "rerun_markdown_bytes": self._rerun_bytes.as_dict(),
+                "script_runs": self._runs_started,
+            }
+
+    def render_prometheus(self):
+        lines = [
+            "# HELP bluedevil_span_seconds Time spent in instrumented app code.",
+            "# TYPE bluedevil_span_seconds histogram",
+        ]
+        with self._lock:
+            for name, histogram in sorted(self._spans.items()):
+                lines.extend(_histogram_lines("bluedevil_span_seconds", histogram, f'span="{name}"'))
+            lines.append("# HELP bluedevil_rerun_markdown_bytes Markdown/HTML bytes emitted per rerun.")
+            lines.append("# TYPE bluedevil_rerun_markdown_bytes histogram")
+            lines.extend(_histogram_lines("bluedevil_rerun_markdown_bytes", self._rerun_bytes, ""))
+            lines.append("# HELP bluedevil_script_runs_total Script runs started, including interrupted ones.")
+            lines.append("# TYPE bluedevil_script_runs_total counter")
+            lines.append(f"bluedevil_script_runs_total {self._runs_started}")
+        return "\n".join(lines) + "\n"
+
+
+def _histogram_lines(metric, histogram, labels):
+    prefix = labels + "," if labels else ""
+    for bound, count in zip(histogram.buckets, histogram.counts):
+        yield f'{metric}_bucket{{{prefix}le="{bound}"}} {count}'
+    yield f'{metric}_bucket{{{prefix}le="+Inf"}} {histogram.count}'
+    suffix = f"{{{labels}}}" if labels else ""
+    yield f"{metric}_sum{suffix} {histogram.sum}"
+    yield f"{metric}_count{suffix} {histogram.count}"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path == "/metrics":
+            body = _profiler.render_prometheus().encode("utf-8")
+            content_type = "text/plain; version=0.0.4"
+        elif self.path == "/metrics.json":
+            body = json.dumps(_profiler.snapshot()).encode("utf-8")
+            content_type = "application/json"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _count_markdown_bytes(st_module):
+    """Wrap ``st.markdown`` so every call adds its body size to the current rerun"""
+    original = st_module.markdown
+
+    @functools.wraps(original)
+    def markdown(body, *args, **kwargs):
+        _profiler.add_bytes(len(str(body).encode("utf-8")))
+        return original(body, *args, **kwargs)
+
+    st_module.markdown = markdown
+
+
+def configure(enabled, st_module, trace_path=None, metrics_port=0):
+    """Set up the process-wide profiler once; later calls (every rerun) are no-ops"""
+    global _profiler
+    if not enabled or _profiler is not None:
+        return _profiler
+    with _configure_lock:
+        if _profiler is None:
+            profiler = Profiler(trace_path)
+            _profiler = profiler
+            _count_markdown_bytes(st_module)
+            if metrics_port:
+                server = ThreadingHTTPServer(("127.0.0.1", metrics_port), _MetricsHandler)
+                threading.Thread(target=server.serve_forever, name="profile-metrics", daemon=True).start()
+    return _profiler
+
+
+def get_profiler():
+    """The process-wide profiler, or None when profiling is off"""
+    return _profiler
+
+
+def timed(name=None):
+    """Decorator recording each call as a span while profiling is on.
+
+    Checked per call rather than at decoration time, since page modules are
+    imported (and decorated) before the entry script configures profiling.
+    """
+    def decorate(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _profiler is None:
+                return func(*args, **kwargs)
+            with _profiler.span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def span(name):
+    return contextlib.nullcontext() if _profiler is None else _profiler.span(name)
+
+
+def start_rerun():
+    if _profiler is not None:
+        _profiler.start_rerun()
+
+
+def finish_rerun():
+    if _profiler is not None:
+        _profiler.finish_rerun()
@@ -0,0 +1,86 @@
+"""Lesson text, loaded once per process from ``content/pages/*.yaml``.
+
+Each page's prose, tables and Quick Check questions live in one YAML file. They
+are parsed once into read-only mappings and tuples that every session shares.
+``tools/build_content.py`` pre-compiles the YAML into a compact JSON bundle so
+a cold start only has to ``json.load`` one file. The bundle records a digest of
+its sources and is ignored if any YAML file has changed since it was built.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import types
+
+import yaml
+
+BUNDLE_VERSION = 1
+
+
+def source_files(content_dir):
+    return sorted(glob.glob(os.path.join(content_dir, "pages", "*.yaml")))
+
+
+def source_digest(paths):
+    """Hash of the source file names and bytes (cheap: no YAML parsing)"""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.basename(path).encode("utf-8"))
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def parse_sources(content_dir):
+    """Parse every page file into plain dicts keyed by page name"""
+    pages = {}
+    for path in source_files(content_dir):
+        with open(path, encoding="utf-8") as f:
+            pages[os.path.splitext(os.path.basename(path))[0]] = yaml.safe_load(f) or {}
+    return pages
+
+
+def build_bundle(content_dir, bundle_path):
+    """Pre-compile the page sources into a JSON bundle; returns the page count"""
+    paths = source_files(content_dir)
+    bundle = {
+        "version": BUNDLE_VERSION,
+        "digest": source_digest(paths),
+        "pages": parse_sources(content_dir),
+    }
+    tmp_path = bundle_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(bundle, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, bundle_path)
+    return len(bundle["pages"])
+
+
+def _read_bundle(bundle_path, digest):
+    try:
+        with open(bundle_path, encoding="utf-8") as f:
+            bundle = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if bundle.get("version") != BUNDLE_VERSION or bundle.get("digest") != digest:
+        return None
+    return bundle["pages"]
+
+
+def freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples"""
+    if isinstance(value, dict):
+        return types.MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def load_lesson_content(content_dir, bundle_path=None):
+    """Return the frozen content of every page, from the bundle when it is current"""
+    pages = None
+    if bundle_path:
+        pages = _read_bundle(bundle_path, source_digest(source_files(content_dir)))
+    if pages is None:
+        pages = parse_sources(content_dir)
+    return freeze(pages)
@@ -0,0 +1 @@
+"""Lesson pages, one module each, imported the first time a page is visited (see app_pages/)."""
@@ -0,0 +1,32 @@
+"""News article page: the envudeucitinib story, key terms and a discussion prompt."""
+
+import streamlit as st
+
+import instrumentation
+from common import get_lesson_content, page_header
+
+@instrumentation.timed()
+def show_article():
+    page_header("📰 The News Article")
+    content = get_lesson_content()["article"]
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown(content["headline"])
+        
+        st.markdown(content["article_body"])
+    
+    with col2:
+        st.markdown("### 🔑 Key Terms")
+        
+        for term in content["key_terms"]:
+            with st.expander(f"**{term['term']}**"):
+                st.write(term["definition"])
+        
+        st.markdown("---")
+        st.markdown("### 💡 Discussion Prompt")
+        st.info(content["discussion_prompt"])
+        
+        if st.button("Show Answer"):
+            st.success(content["discussion_answer"])
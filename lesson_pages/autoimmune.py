@@ -0,0 +1,68 @@
+"""Autoimmune diseases page: psoriasis, the IL-23/TYK2 pathway and other diseases."""
+
+import pandas as pd
+import streamlit as st
+
+import instrumentation
+from common import get_lesson_content, michigan_box, page_header, quick_check
+
+@instrumentation.timed()
+def show_autoimmune():
+    page_header("⚠️ Autoimmune Diseases")
+    content = get_lesson_content()["autoimmune"]
+    
+    st.markdown("## When the Immune System Attacks Itself")
+    
+    st.warning(content["intro"])
+    
+    # Tabs for different aspects
+    tab1, tab2, tab3 = st.tabs(["🔴 What is Psoriasis?", "🧬 Molecular Mechanism", "📊 Other Autoimmune Diseases"])
+    
+    with tab1, instrumentation.span("autoimmune/tab1"):
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            st.markdown("### Understanding Psoriasis")
+            st.write(content["psoriasis"])
+        
+        with col2:
+            st.markdown("### Psoriasis Stats")
+            st.metric("Skin Cell Turnover", "3-4 days", "vs. normal 28-30 days")
+            st.metric("US Patients", "~8 million", "people affected")
+            st.metric("Onset Age", "15-35", "most common")
+            
+            st.markdown("---")
+            st.markdown("### Types of Psoriasis")
+            st.markdown(content["psoriasis_types"])
+        
+        # Quick Check
+        st.markdown("---")
+        st.markdown("### 🧠 Quick Check: Psoriasis")
+        
+        quick_check(**content["quick_checks"]["auto_q1"])
+    
+    with tab2, instrumentation.span("autoimmune/tab2"):
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            st.markdown("### The IL-23/TYK2 Pathway in Psoriasis")
+            st.write(content["il23_pathway"])
+        
+        with col2:
+            st.markdown("### Key Players")
+            st.markdown(content["key_players"])
+        
+        # Quick Check
+        st.markdown("---")
+        st.markdown("### 🧠 Quick Check: Mechanism")
+        
+        quick_check(**content["quick_checks"]["auto_q2"])
+    
+    with tab3, instrumentation.span("autoimmune/tab3"):
+        st.markdown("### Other Autoimmune Diseases")
+        st.write("Psoriasis is just one of over 80 known autoimmune diseases:")
+        
+        diseases = content["other_diseases"]
+        
+        df = pd.DataFrame(dict(diseases))
+        st.table(df)
+        
+        michigan_box(content["michigan_research"])
@@ -0,0 +1,107 @@
+"""Live class dashboard for teachers, backed by the progress store's class aggregates."""
+
+import io
+import os
+import time
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+import settings
+from common import get_progress_store, get_question_bank, get_session_spiller, teacher_authenticated
+from gradebook import MIME_TYPES, export_gradebook
+from session_model import live_sessions, total_memory_bytes
+
+@st.fragment(run_every=settings.CLASS_DASHBOARD_REFRESH)
+def show_class_dashboard():
+    """Live class summary; each refresh reruns only this fragment"""
+    if not teacher_authenticated():
+        return
+    started = time.perf_counter()
+    summary = get_progress_store().aggregates.snapshot()
+    
+    if not summary["students"]:
+        st.info("No signed-in students have recorded progress yet.")
+        return
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Students", summary["students"])
+    with col2:
+        st.metric("Average XP", f"{summary['mean_xp']:.0f}")
+    with col3:
+        st.metric("Achievements Earned", sum(count for _, count in summary["achievements"]))
+    
+    bank = get_question_bank(settings.QUIZ_BANK_PATH, os.path.getmtime(settings.QUIZ_BANK_PATH))
+    rows = []
+    for number, question in enumerate(bank.questions, start=1):
+        correct, answered = summary["questions"].get(question.id, (0, 0))
+        rows.append({
+            "Question": f"Q{number}: {question.stem}",
+            "Answered": answered,
+            "Accuracy": 100 * correct / answered if answered else None,
+        })
+    
+    st.markdown("##### 📊 Quiz Accuracy (first attempts)")
+    st.dataframe(
+        pd.DataFrame(rows),
+        hide_index=True,
+        width="stretch",
+        column_config={"Accuracy": st.column_config.ProgressColumn(format="%.0f%%", min_value=0, max_value=100)},
+    )
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("##### ⭐ XP Distribution")
+        size = get_progress_store().aggregates.xp_bucket_size
+        st.bar_chart(pd.DataFrame(
+            {"Students": [count for _, count in summary["xp_buckets"]]},
+            index=[f"{bucket}-{bucket + size - 1}" for bucket, _ in summary["xp_buckets"]],
+        ))
+    with col2:
+        st.markdown("##### 🎖️ Achievements")
+        st.dataframe(
+            pd.DataFrame(summary["achievements"], columns=["Achievement", "Students"]),
+            hide_index=True,
+            width="stretch",
+        )
+    
+    st.caption(
+        f"Updated {datetime.now():%H:%M:%S} · rendered in {(time.perf_counter() - started) * 1000:.0f} ms · "
+        f"{live_sessions()} open sessions holding {total_memory_bytes() / 1024:.0f} KiB of student state "
+        f"({get_session_spiller().stats()['spilled']} idle sessions spilled to disk)"
+    )
+
+# Gradebook export: built only when asked for, outside the auto-refreshing dashboard
+@st.fragment
+def show_gradebook_export():
+    """Download every student's XP, checks, achievements and answers as CSV or Parquet"""
+    # A fragment can be rerun on its own, so it checks the passcode itself
+    if not teacher_authenticated():
+        st.session_state.pop("gradebook_export", None)
+        return
+    st.markdown("##### 📥 Gradebook Export")
+    fmt = st.radio("Format", ["csv", "parquet"], horizontal=True, key="gradebook_format",
+                   format_func=lambda fmt: {"csv": "CSV (spreadsheets)", "parquet": "Parquet (data tools)"}[fmt])
+    if st.button("Prepare gradebook"):
+        store = get_progress_store()
+        store.flush()
+        buffer = io.StringIO() if fmt == "csv" else io.BytesIO()
+        rows, seconds = export_gradebook(store.path, buffer, fmt)
+        st.session_state.gradebook_export = (fmt, buffer.getvalue(), rows, seconds)
+    
+    export = st.session_state.get("gradebook_export")
+    if export is None:
+        return
+    fmt, data, rows, seconds = export
+    if not rows:
+        st.info("No signed-in students have recorded progress yet.")
+        return
+    st.download_button(
+        f"Download {rows} students ({fmt.upper()})",
+        data,
+        file_name=f"gradebook-{datetime.now():%Y%m%d-%H%M}.{fmt}",
+        mime=MIME_TYPES[fmt],
+    )
+    st.caption(f"Built in {seconds:.2f}s. For a district-wide export, run tools/export_gradebook.py on the server.")
@@ -0,0 +1,460 @@
+"""Design a Treatment page, and the background jobs that get Professor Xavier's feedback."""
+
+import functools
+import time
+
+import streamlit as st
+
+import http_client
+import instrumentation
+import llm_client
+import settings
+from common import (
+    award_xp, get_concept_scorers, get_feedback_cache, get_lesson_content, get_llm_breaker, get_llm_rate_limiter,
+    page_header, teacher_authenticated, unlock_achievement,
+)
+from design_similarity import DesignSimilarityIndex, adapt_feedback
+from feedback_cache import design_cache_key
+from feedback_jobs import DONE, QUEUED, FeedbackJobQueue
+from feedback_matrix import DesignOptions, FeedbackMatrix
+from session_model import TEXT_LIMITS, DesignSubmission
+
+# Professor Xavier feedback helpers
+def build_feedback_prompt(design):
+    """Prompt asking Professor Xavier to review a submitted treatment design"""
+    return f"""You are Professor Xavier, a pharmaceutical scientist and biology educator helping high school students understand drug development for autoimmune diseases.
+
+A student has designed a treatment for an autoimmune disease. Provide detailed, educational feedback that teaches the biology behind their choices.
+
+## Student's Treatment Design:
+- **Treatment Name:** {design.name if design.name else 'Unnamed'}
+- **Target Disease:** {design.disease}
+- **Molecular Target:** {design.target}
+- **Drug Type:** {design.drug_type}
+- **Mechanism Description:** {design.mechanism if design.mechanism else 'Not provided'}
+- **Route of Administration:** {design.delivery}
+- **Efficacy vs Safety Priority:** {design.efficacy_priority}
+- **Expected Side Effects:** {', '.join(design.side_effects) if design.side_effects else 'None listed'}
+- **Expected Cost:** {design.cost}
+- **Dosing Frequency:** {design.dosing}
+- **Scientific Rationale:** {design.rationale if design.rationale else 'Not provided'}
+
+## Provide Feedback On:
+
+### 1. TARGET EVALUATION
+- Is this a good target for this disease? Explain the biology
+- What role does this target play in the disease pathway?
+- Are there existing drugs targeting this? How does the student's approach compare?
+
+### 2. DRUG TYPE ASSESSMENT
+- Is the chosen drug type appropriate for this target?
+- Explain structure-function: How would a {design.drug_type} interact with {design.target}?
+- What are the advantages and limitations of this drug type?
+
+### 3. MECHANISM FEEDBACK
+- Evaluate their mechanism description
+- Fill in any gaps in their understanding
+- Explain exactly how blocking {design.target} would affect the disease
+
+### 4. PRACTICAL CONSIDERATIONS
+- Comment on their delivery route choice
+- Discuss the trade-offs they identified
+- Are there considerations they missed?
+
+### 5. HOMEWORK RESOURCES
+Recommend 2-3 specific resources with URLs:
+
+For immunology:
+- https://www.khanacademy.org/science/biology/human-biology/immunology/v/role-of-phagocytes-in-innate-or-nonspecific-immunity - Khan Academy: Immune System
+- https://www.ck12.org/biology/immune-system/ - CK-12: Immune System
+
+For drug development:
+- https://www.fda.gov/patients/learn-about-drug-and-device-approvals/drug-development-process - FDA: Drug Development Process
+- https://www.nih.gov/health-information/nih-clinical-research-trials-you/basics - NIH: Clinical Trials Basics
+
+For specific diseases:
+- https://www.niams.nih.gov/health-topics/psoriasis - NIH: Psoriasis
+- https://www.ck12.org/biology/autoimmune-diseases/ - CK-12: Autoimmune Diseases
+
+Format as:
+"📚 **Study These Resources:**
+1. [Resource Name](URL) - How it relates to your design"
+
+Be encouraging but scientifically accurate. Use specific molecular details where appropriate."""
+
+def build_commentary_prompt(design):
+    """Prompt for the student's own writing only; the rest of the review comes from the feedback matrix"""
+    return f"""You are Professor Xavier, a pharmaceutical scientist and biology educator helping high school students understand drug development for autoimmune diseases.
+
+A student designed a treatment: a {design.drug_type} against {design.target} for {design.disease}.
+Their choice of target, drug type, delivery, cost and dosing has already been reviewed. Comment ONLY on what they wrote.
+
+## Student's Writing:
+- **Treatment Name:** {design.name if design.name else 'Unnamed'}
+- **Mechanism Description:** {design.mechanism if design.mechanism else 'Not provided'}
+- **Expected Side Effects:** {', '.join(design.side_effects) if design.side_effects else 'None listed'}
+- **Scientific Rationale:** {design.rationale if design.rationale else 'Not provided'}
+
+### MECHANISM AND RATIONALE FEEDBACK
+- Evaluate their mechanism description and rationale
+- Fill in any gaps in their understanding
+- Explain exactly how blocking {design.target} would affect the disease
+- Are the side effects they expect consistent with this target?
+
+Keep it to two or three short paragraphs. Be encouraging but scientifically accurate."""
+
+def feedback_fallback(design):
+    """Template feedback: the last resort when nothing better is available"""
+    return f"""
+**Great work designing a treatment for {design.disease}!**
+
+**Target Analysis:** {design.target} is a solid choice for this disease. It plays a key role in the inflammatory pathway.
+
+**Drug Type:** Your choice of {design.drug_type} has specific advantages. Small molecules can be taken orally, while antibodies are highly specific but require injection.
+
+**Mechanism:** Remember that blocking {design.target} will interrupt the signaling cascade that drives inflammation. This should reduce disease symptoms without completely suppressing the immune system.
+
+**📚 Study These Resources:**
+1. [Khan Academy: Immune System](https://www.khanacademy.org/science/biology/human-biology/immunology/v/role-of-phagocytes-in-innate-or-nonspecific-immunity) - Understand how immune cells communicate
+2. [FDA: Drug Development](https://www.fda.gov/patients/learn-about-drug-and-device-approvals/drug-development-process) - Learn how drugs are approved
+3. [NIH: Autoimmune Diseases](https://www.niams.nih.gov/health-topics/autoimmune-diseases) - Deeper dive into autoimmunity
+    """
+
+def degraded_feedback(design, core_feedback=None, check_cache=True):
+    """Best feedback available without the LLM: cached, then precomputed, then the template"""
+    design_fields = design.as_dict()
+    if check_cache:
+        cached_feedback = get_feedback_cache().get(design_cache_key(design_fields))
+        if cached_feedback is not None:
+            return [("markdown", cached_feedback)]
+    core_feedback = core_feedback or get_feedback_matrix().get(design_fields)
+    if core_feedback:
+        return [
+            ("markdown", core_feedback),
+            ("caption", "Professor Xavier couldn't comment on your mechanism and rationale right now - try again in a few minutes."),
+        ]
+    return [("markdown", feedback_fallback(design))]
+
+# Feedback answered without a job is kept in session state as (kind, text) blocks, so it survives reruns
+def show_feedback_blocks(blocks):
+    for kind, text in blocks:
+        getattr(st, kind)(text)
+
+@st.cache_resource
+def get_feedback_matrix():
+    return FeedbackMatrix(settings.FEEDBACK_MATRIX_PATH, DesignOptions(get_lesson_content()["design_challenge"]))
+
+@st.cache_resource
+def get_design_index():
+    return DesignSimilarityIndex(
+        threshold=settings.SIMILAR_DESIGN_THRESHOLD,
+        max_entries=settings.SIMILAR_DESIGN_MAX_ENTRIES,
+    )
+
+@st.cache_resource
+def get_feedback_jobs():
+    return FeedbackJobQueue(max_workers=settings.FEEDBACK_WORKERS)
+
+@instrumentation.timed("llm_feedback")
+def run_feedback_job(job, prompt, feedback_cache, cache_key, session, limiter, breaker, design_index=None,
+                     design_fields=None, core_feedback=None, max_tokens=2000):
+    """Worker-thread body: wait for a rate-limit slot, then stream the completion into the job and cache it.
+
+    With ``core_feedback`` the completion is only the commentary on the student's
+    writing, and the two are cached together. The call is skipped while
+    ``breaker`` is open, and its outcome and time to first token are reported to it.
+    """
+    if breaker.is_open:
+        job.fail("circuit open")
+        return
+    limiter.acquire(on_position=lambda position: setattr(job, "queue_position", position))
+    if not breaker.allow():
+        # The circuit opened, or its probe was taken, while this job waited in line
+        limiter.refund()
+        job.fail("circuit open")
+        return
+    
+    started = time.monotonic()
+    answered = False
+    try:
+        response = llm_client.open_message_stream(prompt, max_tokens=max_tokens, session=session)
+        if response.status_code != 200:
+            response.close()
+            job.fail(f"HTTP {response.status_code}", http_status=response.status_code)
+            return
+        
+        for chunk in llm_client.stream_response_text(response):
+            if not answered:
+                answered = True
+                breaker.record_success(time.monotonic() - started)
+            job.append(chunk)
+    finally:
+        if not answered:
+            breaker.record_error(time.monotonic() - started, job.http_status)
+    
+    # Only complete streams get here: one cut off before message_stop raises (see llm_client.iter_text)
+    if job.text:
+        feedback_cache.put(cache_key, f"{core_feedback}\n\n{job.text}" if core_feedback else job.text)
+        if design_index is not None:
+            design_index.add(design_fields, cache_key)
+
+@st.fragment(run_every=0.5)
+def show_feedback_job_progress(job_id, core_feedback=None):
+    """Poll a running feedback job, re-rendering only this fragment"""
+    job = get_feedback_jobs().get(job_id)
+    if job is None or job.is_finished:
+        st.rerun()
+    
+    st.markdown("### 💬 Professor Xavier's Feedback:")
+    if core_feedback:
+        st.markdown(core_feedback)
+    if job.text:
+        st.markdown(job.text + " ▌")
+    elif job.queue_position:
+        st.info(f"⏳ You're #{job.queue_position} in line for Professor Xavier - lots of classmates are asking right now...")
+    elif job.status == QUEUED:
+        st.info("⏳ Waiting for Professor Xavier - lots of classmates are asking right now...")
+    else:
+        st.info("🧐 Professor Xavier is reviewing your treatment design...")
+
+def show_feedback_job_result(job, design, core_feedback=None):
+    """Final feedback for a finished job, or the best fallback if it failed"""
+    st.markdown("### 💬 Professor Xavier's Feedback:")
+    if job.status == DONE:
+        if core_feedback:
+            st.markdown(core_feedback)
+        st.markdown(job.text)
+        
+        if award_xp(15, "design_feedback"):
+            st.success("🎉 +15 XP for seeking expert feedback!")
+    else:
+        show_feedback_blocks(degraded_feedback(design, core_feedback))
+
+@instrumentation.timed()
+def show_design_challenge():
+    page_header("🧪 Design a Treatment")
+    content = get_lesson_content()["design_challenge"]
+    
+    st.markdown("## 🔬 Design Your Own Autoimmune Treatment!")
+    
+    st.info(content["task"])
+    
+    # Disease selection
+    st.markdown("### Step 1: Choose Your Target Disease")
+    
+    diseases = content["diseases"]
+    
+    disease = st.selectbox("Select a disease to target:", list(diseases.keys()))
+    selected_disease = diseases[disease]
+    
+    with st.expander("📋 Disease Background", expanded=True):
+        st.write(f"**Description:** {selected_disease['description']}")
+        st.write(f"**Key Pathway:** {selected_disease['key_pathway']}")
+        st.write(f"**Current Treatments:** {', '.join(selected_disease['current_treatments'])}")
+        st.write(f"**Unmet Medical Needs:** {selected_disease['unmet_needs']}")
+    
+    st.markdown("---")
+    
+    # Educational content about drug design
+    with st.expander("📚 Learn About Drug Design Approaches (Click to Learn)"):
+        st.markdown(content["drug_types_primer"])
+    
+    st.markdown("### Step 2: Design Your Treatment")
+    
+    with st.form("treatment_design"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            treatment_name = st.text_input("Treatment Name:", placeholder="e.g., Immunobalance-X",
+                max_chars=TEXT_LIMITS["name"])
+            
+            target = st.selectbox("Molecular Target:", selected_disease['target_options'])
+            
+            drug_type = st.selectbox("Drug Type:", content["drug_types"])
+        
+        with col2:
+            mechanism = st.text_area("How does your treatment work?",
+                placeholder="Describe the mechanism of action - how does blocking this target help the disease?",
+                max_chars=TEXT_LIMITS["mechanism"])
+            
+            delivery = st.selectbox("Route of Administration:", content["delivery_routes"])
+        
+        st.markdown("### Step 3: Consider Trade-offs")
+        
+        col3, col4 = st.columns(2)
+        
+        with col3:
+            efficacy_priority = st.select_slider("Efficacy vs. Safety Priority:",
+                options=content["efficacy_priorities"])
+            
+            expected_side_effects = st.multiselect("Potential Side Effects (based on target):",
+                content["side_effect_options"])
+        
+        with col4:
+            cost_estimate = st.select_slider("Expected Annual Cost:",
+                options=content["cost_bands"])
+            
+            dosing = st.select_slider("Dosing Frequency:",
+                options=content["dosing_options"])
+        
+        st.markdown("### Step 4: Scientific Rationale")
+        
+        rationale = st.text_area("Explain WHY your target and approach should work:",
+            placeholder="Use your understanding of the immune system and disease mechanism to explain your design choices...",
+            max_chars=TEXT_LIMITS["rationale"])
+        
+        submitted = st.form_submit_button("Submit Treatment Design")
+        
+        if submitted:
+            if award_xp(50, "design_challenge"):
+                unlock_achievement("🔬 Biotech Researcher")
+                st.balloons()
+                st.success("🎉 Treatment Design Submitted! +50 XP! 🎖️ Achievement: Biotech Researcher!")
+            else:
+                st.success("🎉 Treatment Design Submitted!")
+            
+            # Store data for AI feedback
+            st.session_state.feedback_job_id = None
+            st.session_state.feedback_result = None
+            st.session_state.student.design = DesignSubmission(
+                name=treatment_name,
+                disease=disease,
+                target=target,
+                drug_type=drug_type,
+                mechanism=mechanism,
+                delivery=delivery,
+                efficacy_priority=efficacy_priority,
+                side_effects=expected_side_effects,
+                cost=cost_estimate,
+                dosing=dosing,
+                rationale=rationale
+            )
+            
+            st.markdown("### 📊 Design Summary")
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Target", target)
+            with col2:
+                st.metric("Drug Type", drug_type.split()[0])
+            with col3:
+                st.metric("Delivery", delivery.split()[0])
+    
+    # AI Feedback Section
+    st.markdown("---")
+    st.markdown("### 🤖 Get Feedback from Professor Xavier")
+    
+    if st.session_state.student.design:
+        design = st.session_state.student.design
+        
+        feedback_xp = False
+        if st.button("🎓 Get Expert Feedback on Your Treatment Design"):
+            feedback_cache = get_feedback_cache()
+            design_index = get_design_index()
+            design_fields = design.as_dict()
+            cache_key = design_cache_key(design_fields)
+            cached_feedback = feedback_cache.get(cache_key)
+            
+            # No exact match: look for a near-duplicate design that already has feedback
+            near_match, near_feedback = None, None
+            if cached_feedback is None:
+                near_match = design_index.query(design_fields)
+                if near_match is not None:
+                    near_feedback = feedback_cache.get(near_match.cache_key)
+                    if near_feedback is None:
+                        design_index.discard(near_match.cache_key)
+            
+            design_concepts = get_concept_scorers()["design"].score(f"{design.mechanism} {design.rationale}")
+            
+            st.session_state.feedback_job_id = None
+            st.session_state.feedback_result = None
+            if cached_feedback is not None:
+                design_index.add(design_fields, cache_key)
+                st.session_state.feedback_result = [
+                    ("markdown", cached_feedback),
+                    ("caption", "⚡ Instant feedback - this design has been reviewed before"),
+                ]
+                feedback_xp = award_xp(15, "design_feedback")
+            elif near_feedback is not None:
+                st.session_state.feedback_result = [
+                    ("markdown", adapt_feedback(near_feedback, near_match.name, design.name)),
+                    ("caption", f"⚡ Instant feedback - adapted from the review of a very similar design ({near_match.similarity:.0%} match)"),
+                ]
+                feedback_xp = award_xp(15, "design_feedback")
+            elif design_concepts.low_effort:
+                # Too little written for a model review to add anything: answer locally, no API call
+                st.session_state.feedback_result = [(
+                    "warning",
+                    f"✏️ {design_concepts.feedback()} Add more detail to your mechanism and rationale, "
+                    "then resubmit for Professor Xavier's full review.",
+                )] + degraded_feedback(design, check_cache=False)
+            elif not settings.LLM_API_KEY or get_llm_breaker().is_open:
+                # No API key, or the API is failing or too slow: answer from what we have instead of queueing a doomed request
+                st.session_state.feedback_result = degraded_feedback(design, check_cache=False)
+            else:
+                # Precomputed review of the structured choices, when available: only the writing goes to the LLM
+                core_feedback = get_feedback_matrix().get(design_fields)
+                job = get_feedback_jobs().submit(cache_key, functools.partial(
+                    run_feedback_job,
+                    prompt=build_commentary_prompt(design) if core_feedback else build_feedback_prompt(design),
+                    feedback_cache=feedback_cache,
+                    cache_key=cache_key,
+                    session=http_client.get_session(),
+                    limiter=get_llm_rate_limiter(),
+                    breaker=get_llm_breaker(),
+                    design_index=design_index,
+                    design_fields=design_fields,
+                    core_feedback=core_feedback,
+                    max_tokens=800 if core_feedback else 2000,
+                ))
+                st.session_state.feedback_job_id = job.id
+                st.session_state.feedback_core = core_feedback
+        
+        if st.session_state.feedback_result:
+            st.markdown("### 💬 Professor Xavier's Feedback:")
+            show_feedback_blocks(st.session_state.feedback_result)
+            if feedback_xp:
+                st.success("🎉 +15 XP for seeking expert feedback!")
+        
+        # Feedback runs in the background; reruns only re-read the job
+        if st.session_state.feedback_job_id:
+            job = get_feedback_jobs().get(st.session_state.feedback_job_id)
+            if job is None:
+                st.session_state.feedback_job_id = None
+            elif job.is_finished:
+                show_feedback_job_result(job, design, st.session_state.feedback_core)
+            else:
+                show_feedback_job_progress(job.id, st.session_state.feedback_core)
+    else:
+        st.warning("👆 Please submit your treatment design above first, then return here for feedback!")
+    
+    if teacher_authenticated():
+        cache_stats = get_feedback_cache().stats()
+        st.caption(
+            f"👩‍🏫 Feedback cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+            f"({cache_stats['hit_rate']:.0%} hit rate, {cache_stats['entries']} stored designs)"
+        )
+        limiter_stats = get_llm_rate_limiter().metrics()
+        st.caption(
+            f"👩‍🏫 Feedback queue: {limiter_stats['queue_depth']} waiting "
+            f"(peak {limiter_stats['peak_queue_depth']}), {limiter_stats['admitted']} sent, "
+            f"mean wait {limiter_stats['mean_wait_seconds']:.1f}s, p95 {limiter_stats['p95_wait_seconds']:.1f}s"
+        )
+        breaker_stats = get_llm_breaker().metrics()
+        st.caption(
+            f"👩‍🏫 LLM circuit: {breaker_stats['state'].replace('_', '-')}, tripped {breaker_stats['trips']}x"
+            + (f" (last: {breaker_stats['last_trip_reason']})" if breaker_stats["last_trip_reason"] else "")
+            + f", {breaker_stats['rejected']} fast fallbacks, {breaker_stats['failures']} failures, "
+            f"p95 first token {breaker_stats['p95_first_token_seconds']:.1f}s"
+        )
+        matrix_stats = get_feedback_matrix().stats()
+        st.caption(
+            f"👩‍🏫 Precomputed feedback: {matrix_stats['entries']}/{matrix_stats['combinations']} combinations, "
+            f"{matrix_stats['hits']} served / {matrix_stats['misses']} missing"
+        )
+        index_stats = get_design_index().stats()
+        st.caption(
+            f"👩‍🏫 Similar-design index: {index_stats['entries']}/{index_stats['max_entries']} designs, "
+            f"{index_stats['matches']} of {index_stats['lookups']} lookups reused feedback, "
+            f"lookup mean {index_stats['mean_lookup_ms']:.2f} ms, p95 {index_stats['p95_lookup_ms']:.2f} ms"
+        )
@@ -0,0 +1,79 @@
+"""Drug development page: discovery, preclinical testing, clinical trials and FDA approval."""
+
+import streamlit as st
+
+import instrumentation
+from common import get_lesson_content, page_header, quick_check
+
+@instrumentation.timed()
+def show_drug_development():
+    page_header("💊 Drug Development")
+    content = get_lesson_content()["drug_development"]
+    
+    st.markdown("## From Lab Bench to Pharmacy Shelf")
+    
+    st.info(content["intro"])
+    
+    # Tabs for phases
+    tab1, tab2, tab3, tab4 = st.tabs(["🔬 Discovery", "🧪 Preclinical", "👥 Clinical Trials", "✅ FDA Approval"])
+    
+    with tab1, instrumentation.span("drug_development/tab1"):
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            st.markdown("### Drug Discovery Phase")
+            st.write(content["discovery"])
+        
+        with col2:
+            st.markdown("### Timeline")
+            st.metric("Discovery Phase", "3-6 years", "identifying and validating target")
+            st.metric("Compounds Tested", "10,000+", "to find one that works")
+            st.metric("Success Rate", "~1 in 10,000", "compounds becomes a drug")
+    
+    with tab2, instrumentation.span("drug_development/tab2"):
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            st.markdown("### Preclinical Testing")
+            st.write(content["preclinical"])
+        
+        with col2:
+            st.markdown("### Key Questions")
+            st.markdown(content["preclinical_questions"])
+    
+    with tab3, instrumentation.span("drug_development/tab3"):
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            st.markdown("### Clinical Trials in Humans")
+            st.write(content["clinical_trials"])
+        
+        with col2:
+            st.markdown("### Success Rates")
+            st.metric("Phase 1 → 2", "~70%", "pass")
+            st.metric("Phase 2 → 3", "~33%", "pass")
+            st.metric("Phase 3 → Approval", "~25-30%", "pass")
+            st.metric("Overall Success", "~10%", "from Phase 1 to market")
+            
+            st.markdown("---")
+            st.markdown("### Envudeucitinib Results")
+            st.success(content["envudeucitinib_results"])
+        
+        # Quick Check
+        st.markdown("---")
+        st.markdown("### 🧠 Quick Check: Clinical Trials")
+        
+        quick_check(**content["quick_checks"]["drug_q1"])
+    
+    with tab4, instrumentation.span("drug_development/tab4"):
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            st.markdown("### FDA Approval Process")
+            st.write(content["fda_approval"])
+        
+        with col2:
+            st.markdown("### What's Next for Envudeucitinib?")
+            st.markdown(content["whats_next"])
+        
+        # Quick Check
+        st.markdown("---")
+        st.markdown("### 🧠 Quick Check: Approval")
+        
+        quick_check(**content["quick_checks"]["drug_q2"])
@@ -0,0 +1,80 @@
+"""Home page: the lesson's big question, what students will learn and the standards covered."""
+
+import pandas as pd
+import streamlit as st
+
+import instrumentation
+from common import get_lesson_content, info_box, michigan_box, page_header
+
+@instrumentation.timed()
+def show_home():
+    page_header("🧬 The Immune System & Drug Development")
+    content = get_lesson_content()["home"]
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col2:
+        info_box(content["welcome_box"])
+        
+        st.markdown("### 🎯 Today's Big Question:")
+        st.success(content["big_question"])
+        
+        # Michigan Connection
+        michigan_box(content["michigan_connection"])
+        
+        st.markdown("### 📋 What You'll Learn:")
+        col_a, col_b = st.columns(2)
+        
+        with col_a:
+            st.markdown(content["learn_list_left"])
+        
+        with col_b:
+            st.markdown(content["learn_list_right"])
+        
+        st.markdown("### 🚀 Ready to Begin?")
+        st.info("👈 Use the sidebar navigation to explore different sections of this lesson!")
+        
+        # Michigan Science Standards Dropdown
+        st.markdown("---")
+        st.markdown("### 📋 Michigan Science Standards (MSS) Covered")
+        
+        with st.expander("🎓 Click to view all Michigan Science Standards addressed in this lesson", expanded=False):
+            michigan_box(content["standards_intro"])
+            
+            st.markdown("#### 🧬 Life Science Standards")
+            
+            st.markdown(content["standard_hs_ls1_1"])
+            
+            st.markdown(content["standard_hs_ls1_2"])
+            
+            st.markdown(content["standard_hs_ls1_4"])
+            
+            st.markdown("#### 🔬 Science & Engineering Practices")
+            
+            st.markdown(content["standard_hs_ls1_6"])
+            
+            st.markdown(content["standard_hs_ets1_3"])
+            
+            st.markdown("---")
+            
+            st.markdown("#### 📊 Standards Summary Table")
+            
+            standards_data = content["standards_table"]
+            
+            standards_df = pd.DataFrame(dict(standards_data))
+            st.table(standards_df)
+        
+        # Quick stats
+        st.markdown("---")
+        st.markdown("### 📊 Autoimmune Disease Facts")
+        
+        stat1, stat2, stat3, stat4 = st.columns(4)
+        
+        with stat1:
+            st.metric("Americans Affected", "~24 million", "by autoimmune diseases")
+        with stat2:
+            st.metric("Psoriasis Patients", "~8 million", "in the United States")
+        with stat3:
+            st.metric("Known Autoimmune", "80+", "different diseases")
+        with stat4:
+            st.metric("Drug Development", "10-15 years", "average timeline")
@@ -0,0 +1,88 @@
+"""Immune system page: immune cells, signaling, self vs. non-self and TYK2, with Quick Checks."""
+
+import streamlit as st
+
+import instrumentation
+from common import get_lesson_content, page_header, quick_check
+
+@instrumentation.timed()
+def show_immune_system():
+    page_header("🛡️ The Immune System")
+    content = get_lesson_content()["immune_system"]
+    
+    st.markdown("## Your Body's Defense Network")
+    
+    st.info(content["intro"])
+    
+    # Interactive tabs
+    tab1, tab2, tab3, tab4 = st.tabs(["🔬 Immune Cells", "⚡ Signaling Pathways", "🎯 Self vs. Non-Self", "🧬 TYK2 Enzyme"])
+    
+    with tab1, instrumentation.span("immune_system/tab1"):
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            st.markdown("### White Blood Cells (Leukocytes)")
+            st.write(content["immune_cells"])
+        
+        with col2:
+            st.markdown("### Key Stats")
+            st.metric("White Blood Cells", "4,500-11,000", "per microliter of blood")
+            st.metric("T-Cell Types", "3 main", "Helper, Killer, Regulatory")
+            st.metric("Antibody Types", "5 classes", "IgG, IgA, IgM, IgE, IgD")
+        
+        # Quick Check
+        st.markdown("---")
+        st.markdown("### 🧠 Quick Check: Immune Cells")
+        
+        quick_check(**content["quick_checks"]["immune_q1"])
+    
+    with tab2, instrumentation.span("immune_system/tab2"):
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            st.markdown("### How Immune Cells Communicate")
+            st.write(content["signaling_pathways"])
+        
+        with col2:
+            st.markdown("### The JAK Family")
+            st.markdown(content["jak_family"])
+        
+        # Quick Check
+        st.markdown("---")
+        st.markdown("### 🧠 Quick Check: Signaling")
+        
+        quick_check(**content["quick_checks"]["immune_q2"])
+    
+    with tab3, instrumentation.span("immune_system/tab3"):
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            st.markdown("### How Your Immune System Recognizes 'Self'")
+            st.write(content["self_vs_non_self"])
+        
+        with col2:
+            st.markdown("### Self-Tolerance Facts")
+            st.metric("T-Cell Deletion", "~95%", "die during development")
+            st.metric("MHC Genes", "Most polymorphic", "in human genome")
+            st.metric("Autoimmune Diseases", "5-8%", "of population affected")
+        
+        # Quick Check
+        st.markdown("---")
+        st.markdown("### 🧠 Quick Check: Self vs. Non-Self")
+        
+        quick_check(**content["quick_checks"]["immune_q3"])
+    
+    with tab4, instrumentation.span("immune_system/tab4"):
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            st.markdown("### TYK2: The Drug Target")
+            st.write(content["tyk2_enzyme"])
+        
+        with col2:
+            st.markdown("### TYK2 Facts")
+            st.metric("Amino Acids", "~1,187", "in TYK2 protein")
+            st.metric("Gene Location", "Chromosome 19", "human genome")
+            st.metric("Selectivity", ">1000x", "for TYK2 vs other JAKs")
+        
+        # Quick Check
+        st.markdown("---")
+        st.markdown("### 🧠 Quick Check: TYK2")
+        
+        quick_check(**content["quick_checks"]["immune_q4"])
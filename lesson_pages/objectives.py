@@ -0,0 +1,22 @@
+"""Learning objectives page."""
+
+import streamlit as st
+
+import instrumentation
+from common import get_lesson_content, page_header
+
+@instrumentation.timed()
+def show_objectives():
+    page_header("🎯 Learning Objectives")
+    content = get_lesson_content()["objectives"]
+    
+    st.markdown("## By the end of this lesson, you will be able to:")
+    
+    objectives = content["objectives"]
+    
+    for obj in objectives:
+        with st.expander(f"{obj['icon']} {obj['title']}", expanded=True):
+            st.write(f"**Learning Goal:** {obj['description']}")
+            st.write("**Key Concepts:**")
+            for example in obj['examples']:
+                st.write(f"- {example}")
@@ -0,0 +1,235 @@
+"""Quiz page: the multiple-choice bank, short answers and the teacher's batch grading."""
+
+import json
+import math
+import os
+
+import pandas as pd
+import streamlit as st
+
+import http_client
+import instrumentation
+import settings
+from common import (
+    award_xp, get_concept_scorers, get_feedback_cache, get_lesson_content, get_llm_breaker, get_llm_rate_limiter,
+    get_progress_store, get_question_bank, log_event, page_header, record_progress, success_box, teacher_authenticated,
+    touch_student, unlock_achievement,
+)
+from event_log import SELECT
+from session_model import TEXT_LIMITS
+from short_answer_grading import (
+    RubricQuestion, Submission, answer_key, concept_prefilter, grade_submissions, make_llm_requester,
+)
+
+# Quiz engine: one fragment per question card
+def log_quiz_selection(question):
+    choice = st.session_state[question.widget_key]
+    log_event(SELECT, item=question.id, value=choice or "", correct=choice == question.correct_label)
+
+@st.fragment
+def show_quiz_question(number, question):
+    """One quiz card; changing the answer reruns only this fragment"""
+    touch_student()
+    st.markdown(f"#### Question {number}")
+    st.markdown(f"**{question.stem}** *(MSS {question.mss})*")
+    
+    answer = st.radio(
+        "Select your answer:",
+        question.labels,
+        key=question.widget_key,
+        index=None,
+        on_change=log_quiz_selection,
+        args=(question,),
+    )
+    
+    if answer:
+        if question.progress_key not in st.session_state.student.quiz_progress:
+            st.session_state.student.record_quiz_answer(question.progress_key, answer)
+            record_progress("answer", question.id, answer, answer == question.correct_label)
+            if answer == question.correct_label:
+                award_xp(question.xp, question.check_id)
+            # First answer changes the score and maybe XP: refresh the whole page once
+            st.rerun()
+        
+        st.markdown("##### 📚 Detailed Explanation:")
+        
+        if answer == question.correct_label:
+            st.success(f"✅ **CORRECT!** +{question.xp} XP")
+        else:
+            st.error(f"❌ **Incorrect.** The correct answer is {question.correct}.")
+        
+        st.markdown(question.explanation_html, unsafe_allow_html=True)
+        st.markdown(f"**🧠 Memory Tip:** {question.memory_tip}")
+
+# Short answers (q7, q8) are graded against a rubric in class-wide batches
+def rubric_questions(content):
+    return {
+        question_id: RubricQuestion(question_id, content[f"{question_id}_prompt"], tuple(content[f"{question_id}_rubric"]))
+        for question_id in ("q7", "q8")
+    }
+
+def show_short_answer_grade(question_id, answer, concepts):
+    """Instant key-concept check, plus the rubric score once the teacher has graded the answer"""
+    st.info(f"🔎 **Key concepts: {len(concepts.matched)}/{len(concepts.matched) + len(concepts.missing)}** - {concepts.feedback()}")
+    if not answer or not concepts.needs_llm:
+        return
+    cached = get_feedback_cache().get(answer_key(question_id, answer))
+    if cached is not None:
+        grade = json.loads(cached)
+        st.info(f"📝 **Rubric score: {grade['score']}/{grade['max_score']}** - {grade['feedback']}")
+
+def show_short_answer_grading(content):
+    """Teacher tool: grade every stored short answer with batched LLM requests"""
+    if not teacher_authenticated():
+        return
+    st.markdown("---")
+    st.markdown("### 👩‍🏫 Grade the Class's Short Answers")
+    
+    store = get_progress_store()
+    store.flush()
+    submissions = [Submission(*row) for row in store.short_answers()]
+    st.caption(f"{len(submissions)} answers saved by signed-in students")
+    if not settings.LLM_API_KEY:
+        st.caption("No API key is configured: only answers the concept scorer is sure about, and cached grades, are graded.")
+    
+    if st.button("📝 Grade All Short Answers", disabled=not submissions):
+        with st.spinner(f"Grading {len(submissions)} answers..."):
+            st.session_state.grading_report = grade_submissions(
+                submissions,
+                rubric_questions(content),
+                get_feedback_cache(),
+                make_llm_requester(http_client.get_session(), get_llm_rate_limiter(), breaker=get_llm_breaker())
+                if settings.LLM_API_KEY else None,
+                batch_size=settings.GRADING_BATCH_SIZE,
+                max_concurrency=settings.GRADING_CONCURRENCY,
+                prefilter=concept_prefilter(get_concept_scorers()),
+            )
+    
+    report = st.session_state.get("grading_report")
+    if report is not None:
+        st.success(
+            f"Graded {len(report.rows)} answers in {report.seconds:.1f}s: {report.local} scored locally, "
+            f"{report.graded} by Professor Xavier ({report.batches} batched requests), "
+            f"{report.cached} from cache, {report.failed} failed"
+        )
+        st.dataframe(pd.DataFrame(report.rows), hide_index=True, width="stretch")
+
+@instrumentation.timed()
+def show_quiz():
+    page_header("❓ Quiz & Assessment")
+    content = get_lesson_content()["quiz"]
+    
+    st.markdown("## 📝 Lesson Assessment - Tutorial Mode")
+    st.info(content["tutorial_intro"])
+    
+    bank = get_question_bank(settings.QUIZ_BANK_PATH, os.path.getmtime(settings.QUIZ_BANK_PATH))
+    
+    st.markdown("---")
+    previous_part = None
+    for number, question in enumerate(bank.questions, start=1):
+        if number > 1:
+            st.markdown("---")
+        if question.part != previous_part:
+            st.markdown(f"### {question.part}")
+            previous_part = question.part
+        show_quiz_question(number, question)
+    
+    # Calculate and display score
+    st.markdown("---")
+    st.markdown("### 📊 Your Progress")
+    
+    total = len(bank)
+    answered = len([q for q in bank.questions if q.progress_key in st.session_state.student.quiz_progress])
+    correct = len([q for q in bank.questions if q.check_id in st.session_state.student.completed_checks])
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Questions Answered", f"{answered}/{total}")
+    with col2:
+        st.metric("Correct Answers", f"{correct}/{total}")
+    with col3:
+        if answered > 0:
+            percentage = (correct / answered) * 100
+            st.metric("Accuracy", f"{percentage:.0f}%")
+        else:
+            st.metric("Accuracy", "N/A")
+    
+    if answered == total:
+        if correct == total:
+            if unlock_achievement("🏆 Perfect Score"):
+                award_xp(bank.perfect_bonus_xp, "perfect_score_bonus")
+                st.balloons()
+            st.success(f"🎉 **PERFECT SCORE!** You've mastered the immune system and drug development concepts! +{bank.perfect_bonus_xp} Bonus XP")
+        elif correct >= math.ceil(total * 2 / 3):
+            if unlock_achievement("📝 Quiz Champion"):
+                award_xp(bank.champion_bonus_xp, "quiz_champion_bonus")
+            st.success(f"🎉 **Great job!** You got {correct}/{total} correct! 🎖️ Achievement: Quiz Champion!")
+        else:
+            st.info(f"📚 You got {correct}/{total} correct. Review the explanations above to strengthen your understanding!")
+    
+    # Short Answer Section
+    st.markdown("---")
+    st.markdown("### Part 4: Short Answer")
+    st.info("Complete the short answer questions below, then click 'Get Feedback' for detailed explanations.")
+    
+    q7 = st.text_area(
+        content["q7_prompt"],
+        key="quiz_q7",
+        height=150,
+        max_chars=TEXT_LIMITS["short_answer"]
+    )
+    
+    q8 = st.text_area(
+        content["q8_prompt"],
+        key="quiz_q8",
+        height=150,
+        max_chars=TEXT_LIMITS["short_answer"]
+    )
+    
+    if st.button("🎓 Get Feedback on Short Answers"):
+        if q7 or q8:
+            st.session_state.student.set_short_answers(q7, q8)
+            for question_id, answer in zip(("q7", "q8"), st.session_state.student.short_answers):
+                if answer:
+                    record_progress("short_answer", question_id, answer)
+            
+            with st.spinner("Professor Xavier is reviewing your responses..."):
+                st.markdown("### 💬 Professor Xavier's Feedback:")
+                
+                # Q7 Feedback
+                st.markdown("#### Question 7 - Structure-Function & Drug Design")
+                
+                q7_concepts = get_concept_scorers()["q7"].score(q7)
+                if not q7_concepts.low_effort:
+                    st.success("✅ You provided a response! Let's see how it compares to the model answer.")
+                else:
+                    st.warning("⚠️ Your response was brief. Here's a detailed explanation:")
+                show_short_answer_grade("q7", q7, q7_concepts)
+                
+                success_box(content["q7_model_answer"])
+                
+                st.markdown(content["q7_resources"])
+                
+                st.markdown("---")
+                
+                # Q8 Feedback
+                st.markdown("#### Question 8 - Stock Surge & Drug Development")
+                
+                q8_concepts = get_concept_scorers()["q8"].score(q8)
+                if not q8_concepts.low_effort:
+                    st.success("✅ You provided a response! Let's see how it compares to the model answer.")
+                else:
+                    st.warning("⚠️ Your response was brief. Here's a detailed explanation:")
+                show_short_answer_grade("q8", q8, q8_concepts)
+                
+                success_box(content["q8_model_answer"])
+                
+                st.markdown(content["q8_resources"])
+                
+                if award_xp(20, "short_answer_feedback"):
+                    st.success("🎉 +20 XP for completing the short answer section!")
+        else:
+            st.warning("Please write at least one response before requesting feedback.")
+    
+    if teacher_authenticated():
+        show_short_answer_grading(content)
@@ -0,0 +1,27 @@
+"""Resources page: links for further study and careers."""
+
+import streamlit as st
+
+import instrumentation
+from common import get_lesson_content, page_header
+
+@instrumentation.timed()
+def show_resources():
+    page_header("📚 Resources")
+    content = get_lesson_content()["resources"]
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 🧬 Immunology Resources")
+        st.markdown(content["immunology"])
+        
+        st.markdown("### 💊 Drug Development")
+        st.markdown(content["drug_development"])
+    
+    with col2:
+        st.markdown("### 🎓 Career Connections")
+        st.markdown(content["careers"])
+        
+        st.markdown("### 🏥 Michigan Research")
+        st.markdown(content["michigan_research"])
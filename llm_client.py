@@ -0,0 +1,106 @@
+"""Client for the messages API used by Professor Xavier's feedback.
+
+Completions are requested in streaming (server-sent events) form so the page can
+render tokens as they arrive instead of waiting for the whole response.
+"""
+
+import json
+
+import http_client
+import settings
+
+
+class LLMStreamError(Exception):
+    """The API reported an error event in the middle of a stream"""
+
+
+def iter_sse_events(lines):
+    """Parse server-sent events incrementally from an iterable of lines.
+
+    Yields ``(event, data)`` tuples as soon as each event's terminating blank
+    line arrives, so nothing beyond the current event is buffered.
+    """
+    event = None
+    data = []
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        line = line.rstrip("\r\n")
+
+        if not line:
+            if data:
+                yield event or "message", "\n".join(data)
+            event = None
+            data = []
+            continue
+        if line.startswith(":"):
+            continue
+
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "event":
+            event = value
+        elif field == "data":
+            data.append(value)
+
+    if data:
+        yield event or "message", "\n".join(data)
+
+
+def iter_text(events):
+    """Yield the text deltas from a stream of messages API events.
+
+    Raises :class:`LLMStreamError` on an error event, and when the stream ends
+    without ``message_stop``, so a truncated completion is never taken (or
+    cached) as a whole one.
+    """
+    for event, data in events:
+        payload = json.loads(data)
+        kind = payload.get("type", event)
+        if kind == "content_block_delta":
+            delta = payload.get("delta", {})
+            if delta.get("type") == "text_delta":
+                yield delta["text"]
+        elif kind == "error":
+            raise LLMStreamError(payload.get("error", {}).get("message", "stream error"))
+        elif kind == "message_stop":
+            return
+    raise LLMStreamError("stream ended before message_stop")
+
+
+def open_message_stream(prompt, max_tokens=2000, session=None):
+    """POST a single-turn prompt with ``stream`` enabled and return the response.
+
+    Goes through the shared pooled session, so 429/5xx answers are retried with
+    backoff before the caller sees them. The caller checks ``status_code`` and,
+    on 200, passes the response to :func:`stream_response_text`. Worker threads
+    pass ``session`` explicitly since they have no Streamlit script context.
+    """
+    session = session or http_client.get_session()
+    return session.post(
+        settings.LLM_API_URL,
+        headers={
+            "Content-Type": "application/json",
+            "x-api-key": settings.LLM_API_KEY,
+            "anthropic-version": "2023-06-01",
+        },
+        json={
+            "model": settings.LLM_MODEL,
+            "max_tokens": max_tokens,
+            "stream": True,
+            "messages": [{"role": "user", "content": prompt}],
+        },
+        stream=True,
+        timeout=(settings.LLM_CONNECT_TIMEOUT, settings.LLM_READ_TIMEOUT),
+    )
+
+
+def stream_response_text(response):
+    """Yield text deltas from an open streaming response, closing it when done"""
+    try:
+        # chunk_size=None hands lines over as soon as each chunk arrives
+        lines = response.iter_lines(chunk_size=None)
+        yield from iter_text(iter_sse_events(lines))
+    finally:
+        response.close()
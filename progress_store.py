@@ -0,0 +1,241 @@
+"""Durable XP and achievement ledger, keyed by student id.
+
+``award_xp`` only enqueues an event; a background writer thread flushes events
+to SQLite (WAL mode) in batches, every ``flush_interval`` seconds or once
+``batch_size`` events are waiting. Checks and achievements are primary keys, so
+replaying an event is harmless: ``check_id`` keeps awards idempotent in the
+store exactly as it does in session state. Each event also updates the
+in-memory class aggregates behind the teacher dashboard as it is recorded.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from class_stats import ClassAggregates
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS xp_ledger (
+    student_id TEXT NOT NULL,
+    check_id TEXT NOT NULL,
+    points INTEGER NOT NULL,
+    awarded_at REAL NOT NULL,
+    PRIMARY KEY (student_id, check_id)
+);
+CREATE TABLE IF NOT EXISTS achievements (
+    student_id TEXT NOT NULL,
+    achievement TEXT NOT NULL,
+    awarded_at REAL NOT NULL,
+    PRIMARY KEY (student_id, achievement)
+);
+CREATE TABLE IF NOT EXISTS quiz_answers (
+    student_id TEXT NOT NULL,
+    question_id TEXT NOT NULL,
+    choice TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    answered_at REAL NOT NULL,
+    PRIMARY KEY (student_id, question_id)
+);
+CREATE TABLE IF NOT EXISTS short_answers (
+    student_id TEXT NOT NULL,
+    question_id TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    submitted_at REAL NOT NULL,
+    PRIMARY KEY (student_id, question_id)
+);
+"""
+
+logger = logging.getLogger(__name__)
+
+
+def connect(path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # In WAL mode NORMAL only syncs at checkpoints, not on every commit
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class ProgressStore:
+    """Write-behind progress store shared by every session in the process"""
+
+    def __init__(self, path, batch_size=200, flush_interval=2.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._read_lock = threading.Lock()
+        self._batches = 0
+        self._events_written = 0
+
+        self._conn = connect(path)
+        self._conn.executescript(SCHEMA)
+        self.aggregates = ClassAggregates()
+        self._seed_aggregates()
+        self._writer_conn = connect(path)
+        self._writer = threading.Thread(target=self._write_loop, name="progress-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)
+
+    # Writes (non-blocking)
+
+    def record_check(self, student_id, check_id, points):
+        self._queue.put(("check", student_id, check_id, points, time.time()))
+        self.aggregates.add_check(student_id, check_id, points)
+
+    def record_achievement(self, student_id, achievement):
+        self._queue.put(("achievement", student_id, achievement, None, time.time()))
+        self.aggregates.add_achievement(student_id, achievement)
+
+    def record_answer(self, student_id, question_id, choice, correct):
+        """Record a student's first answer to a quiz question"""
+        self._queue.put(("answer", student_id, question_id, (choice, correct), time.time()))
+        self.aggregates.add_answer(student_id, question_id, correct)
+
+    def record_short_answer(self, student_id, question_id, answer):
+        """Store (or replace) a student's latest written answer"""
+        self._queue.put(("short_answer", student_id, question_id, answer, time.time()))
+
+    def flush(self, timeout=10):
+        """Block until every event queued so far is committed"""
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    # Reads
+
+    def load_student(self, student_id):
+        """Total XP, completed check ids and achievements (in award order)"""
+        with self._read_lock:
+            checks = self._conn.execute(
+                "SELECT check_id, points FROM xp_ledger WHERE student_id = ?", (student_id,)
+            ).fetchall()
+            achievements = self._conn.execute(
+                "SELECT achievement FROM achievements WHERE student_id = ? ORDER BY awarded_at",
+                (student_id,),
+            ).fetchall()
+            answers = self._conn.execute(
+                "SELECT question_id, choice FROM quiz_answers WHERE student_id = ?", (student_id,)
+            ).fetchall()
+            short_answers = self._conn.execute(
+                "SELECT question_id, answer FROM short_answers WHERE student_id = ?", (student_id,)
+            ).fetchall()
+        return {
+            "xp": sum(points for _, points in checks),
+            "checks": {check_id for check_id, _ in checks},
+            "achievements": [name for (name,) in achievements],
+            "answers": dict(answers),
+            "short_answers": dict(short_answers),
+        }
+
+    def short_answers(self):
+        """Every stored written answer as (student_id, question_id, answer) rows"""
+        with self._read_lock:
+            return self._conn.execute(
+                "SELECT student_id, question_id, answer FROM short_answers ORDER BY student_id, question_id"
+            ).fetchall()
+
+    def stats(self):
+        return {
+            "pending": self._queue.qsize(),
+            "batches": self._batches,
+            "events_written": self._events_written,
+        }
+
+    def _seed_aggregates(self):
+        """Build the class aggregates from the ledger (once, at startup)"""
+        aggregates = self.aggregates
+        for student_id, check_id, points in self._conn.execute(
+            "SELECT student_id, check_id, points FROM xp_ledger ORDER BY awarded_at"
+        ):
+            aggregates.add_check(student_id, check_id, points)
+        for student_id, achievement in self._conn.execute(
+            "SELECT student_id, achievement FROM achievements ORDER BY awarded_at"
+        ):
+            aggregates.add_achievement(student_id, achievement)
+        for student_id, question_id, correct in self._conn.execute(
+            "SELECT student_id, question_id, correct FROM quiz_answers"
+        ):
+            aggregates.add_answer(student_id, question_id, bool(correct))
+
+    # Background writer
+
+    def _write_loop(self):
+        batch = []
+        waiters = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+            elif item is not None:
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            if waiters or len(batch) >= self.batch_size or (batch and time.monotonic() >= deadline):
+                try:
+                    self._write(batch)
+                except Exception:
+                    logger.exception("Failed to write %d progress events", len(batch))
+                finally:
+                    batch = []
+                    deadline = None
+                    for waiter in waiters:
+                        waiter.set()
+                    waiters = []
+
+    def _write(self, batch):
+        if not batch:
+            return
+        checks = [(student, check_id, points, ts) for kind, student, check_id, points, ts in batch if kind == "check"]
+        achievements = [(student, name, ts) for kind, student, name, _, ts in batch if kind == "achievement"]
+        answers = [
+            (student, question_id, answer[0], int(answer[1]), ts)
+            for kind, student, question_id, answer, ts in batch if kind == "answer"
+        ]
+        short_answers = [
+            (student, question_id, text, ts)
+            for kind, student, question_id, text, ts in batch if kind == "short_answer"
+        ]
+
+        conn = self._writer_conn
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                "INSERT OR IGNORE INTO xp_ledger (student_id, check_id, points, awarded_at) VALUES (?, ?, ?, ?)",
+                checks,
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO achievements (student_id, achievement, awarded_at) VALUES (?, ?, ?)",
+                achievements,
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO quiz_answers (student_id, question_id, choice, correct, answered_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                answers,
+            )
+            conn.executemany(
+                "INSERT INTO short_answers (student_id, question_id, answer, submitted_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (student_id, question_id) DO UPDATE SET answer = excluded.answer, "
+                "submitted_at = excluded.submitted_at",
+                short_answers,
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        self._batches += 1
+        self._events_written += len(batch)
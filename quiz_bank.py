@@ -0,0 +1,158 @@
+"""Declarative multiple-choice question banks for the quiz page.
+
+A bank is a YAML file (see ``content/quiz.yaml``) listing questions with their
+options, per-option explanations, MSS tag and XP. It is parsed and validated
+once into immutable objects, and the explanation markdown is pre-rendered, so a
+rerun of the quiz page only iterates over ready-made strings.
+"""
+
+from dataclasses import dataclass
+
+import yaml
+
+
+class QuestionBankError(ValueError):
+    """The question bank file is malformed"""
+
+
+@dataclass(frozen=True)
+class Option:
+    key: str
+    text: str
+    explanation: str
+
+    @property
+    def label(self):
+        return f"{self.key}) {self.text}"
+
+
+@dataclass(frozen=True)
+class Question:
+    id: str
+    part: str
+    stem: str
+    mss: str
+    xp: int
+    correct: str
+    options: tuple
+    memory_tip: str
+    explanation_html: str
+
+    @property
+    def labels(self):
+        return [option.label for option in self.options]
+
+    @property
+    def correct_label(self):
+        return next(option.label for option in self.options if option.key == self.correct)
+
+    @property
+    def widget_key(self):
+        return f"quiz_{self.id}"
+
+    @property
+    def progress_key(self):
+        return f"{self.id}_answered"
+
+    @property
+    def check_id(self):
+        return f"quiz_{self.id}_correct"
+
+
+@dataclass(frozen=True)
+class QuestionBank:
+    title: str
+    questions: tuple
+    perfect_bonus_xp: int
+    champion_bonus_xp: int
+
+    def __len__(self):
+        return len(self.questions)
+
+
+def _require(mapping, field, kind, where):
+    value = mapping.get(field)
+    if not isinstance(value, kind) or (isinstance(value, str) and not value.strip()):
+        raise QuestionBankError(f"{where}: '{field}' must be a non-empty {kind.__name__}")
+    return value
+
+
+def _explanation_html(options, correct):
+    """Render the 'why each option is right or wrong' box once, at load time"""
+    blocks = []
+    for option in options:
+        mark = "✅" if option.key == correct else "❌"
+        quoted = "\n".join(f"> {line}" if line else ">" for line in option.explanation.strip().splitlines())
+        blocks.append(f"**{option.label}** {mark}\n{quoted}")
+    body = "\n\n".join(blocks)
+    return f'<div class="info-box">\n<h4>Why each option is correct or incorrect:</h4>\n\n{body}\n</div>'
+
+
+def parse_question_bank(data):
+    """Validate a parsed bank document and build a :class:`QuestionBank`"""
+    if not isinstance(data, dict):
+        raise QuestionBankError("question bank must be a mapping")
+
+    raw_questions = _require(data, "questions", list, "bank")
+    questions = []
+    seen_ids = set()
+    for index, raw in enumerate(raw_questions, start=1):
+        where = f"question {index}"
+        if not isinstance(raw, dict):
+            raise QuestionBankError(f"{where}: must be a mapping")
+
+        question_id = _require(raw, "id", str, where)
+        where = f"question '{question_id}'"
+        if question_id in seen_ids:
+            raise QuestionBankError(f"{where}: duplicate id")
+        seen_ids.add(question_id)
+
+        options = []
+        for raw_option in _require(raw, "options", list, where):
+            if not isinstance(raw_option, dict):
+                raise QuestionBankError(f"{where}: each option must be a mapping")
+            options.append(Option(
+                key=_require(raw_option, "key", str, where),
+                text=_require(raw_option, "text", str, where),
+                explanation=_require(raw_option, "explanation", str, where).strip(),
+            ))
+        keys = [option.key for option in options]
+        if len(options) < 2 or len(set(keys)) != len(keys):
+            raise QuestionBankError(f"{where}: needs at least two options with unique keys")
+
+        correct = _require(raw, "correct", str, where)
+        if correct not in keys:
+            raise QuestionBankError(f"{where}: correct answer '{correct}' is not one of {keys}")
+
+        xp = raw.get("xp", 10)
+        if not isinstance(xp, int) or xp < 0:
+            raise QuestionBankError(f"{where}: 'xp' must be a non-negative integer")
+
+        options = tuple(options)
+        questions.append(Question(
+            id=question_id,
+            part=_require(raw, "part", str, where),
+            stem=_require(raw, "stem", str, where),
+            mss=_require(raw, "mss", str, where),
+            xp=xp,
+            correct=correct,
+            options=options,
+            memory_tip=_require(raw, "memory_tip", str, where).strip(),
+            explanation_html=_explanation_html(options, correct),
+        ))
+
+    if not questions:
+        raise QuestionBankError("bank has no questions")
+
+    return QuestionBank(
+        title=data.get("title", "Quiz"),
+        questions=tuple(questions),
+        perfect_bonus_xp=int(data.get("perfect_bonus_xp", 0)),
+        champion_bonus_xp=int(data.get("champion_bonus_xp", 0)),
+    )
+
+
+def load_question_bank(path):
+    """Read and validate a YAML question bank file"""
+    with open(path, encoding="utf-8") as f:
+        return parse_question_bank(yaml.safe_load(f))
@@ -0,0 +1,183 @@
+"""Token-bucket admission control for outbound LLM requests.
+
+A single limiter is shared by every session in the server process. Requests
+over the limit wait in FIFO order (and can report their place in line) instead
+of failing. When several server processes share a machine, pointing them at
+the same SQLite state file makes them draw from one bucket.
+"""
+
+import collections
+import itertools
+import os
+import sqlite3
+import threading
+import time
+
+
+class _LocalBucket:
+    """Bucket state held in memory (single process)"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self):
+        """Try to take one token; return seconds until one is available"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def refund(self):
+        with self._lock:
+            self.tokens = min(self.burst, self.tokens + 1)
+
+
+class _SharedBucket:
+    """Bucket state held in SQLite so several processes share one budget"""
+
+    def __init__(self, rate, burst, path):
+        self.rate = rate
+        self.burst = burst
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # One connection per process, used by the head of the line and by refunds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS bucket (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                tokens REAL NOT NULL,
+                updated REAL NOT NULL
+            )
+        """)
+        self._conn.execute("INSERT OR IGNORE INTO bucket VALUES (1, ?, ?)", (float(burst), time.time()))
+
+    def take(self):
+        with self._lock:
+            # BEGIN IMMEDIATE takes the database write lock, serializing processes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                tokens, updated = self._conn.execute("SELECT tokens, updated FROM bucket WHERE id = 1").fetchone()
+                now = time.time()
+                tokens = min(self.burst, tokens + max(0.0, now - updated) * self.rate)
+                wait = 0.0
+                if tokens >= 1:
+                    tokens -= 1
+                else:
+                    wait = (1 - tokens) / self.rate
+                self._conn.execute("UPDATE bucket SET tokens = ?, updated = ? WHERE id = 1", (tokens, now))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            return wait
+
+    def refund(self):
+        with self._lock:
+            self._conn.execute("UPDATE bucket SET tokens = MIN(?, tokens + 1) WHERE id = 1", (float(self.burst),))
+
+
+class RateLimiter:
+    """FIFO token bucket: ``rate_per_minute`` sustained, ``burst`` at once"""
+
+    def __init__(self, rate_per_minute=50, burst=10, state_path=None, recent_waits=1000):
+        rate = rate_per_minute / 60.0
+        if state_path:
+            self._bucket = _SharedBucket(rate, burst, state_path)
+        else:
+            self._bucket = _LocalBucket(rate, burst)
+        self.rate_per_minute = rate_per_minute
+        self.burst = burst
+
+        self._cond = threading.Condition()
+        self._waiting = collections.deque()
+        self._tickets = itertools.count()
+        self._admitted = 0
+        self._peak_depth = 0
+        self._total_wait = 0.0
+        self._recent_waits = collections.deque(maxlen=recent_waits)
+
+    def acquire(self, on_position=None):
+        """Block until admitted and return the seconds spent waiting.
+
+        ``on_position(n)`` is called whenever this caller's place in line
+        changes (1 = next to be admitted) and with ``None`` once admitted.
+        """
+        start = time.monotonic()
+        ticket = next(self._tickets)
+        last_position = None
+
+        with self._cond:
+            self._waiting.append(ticket)
+            self._peak_depth = max(self._peak_depth, len(self._waiting))
+            try:
+                while True:
+                    position = self._waiting.index(ticket) + 1
+                    if position != last_position and on_position is not None:
+                        on_position(position)
+                    last_position = position
+
+                    if position == 1:
+                        # Only the head of the line takes tokens, and the bucket has its own
+                        # lock; a slow shared-state database must not block the queue
+                        self._cond.release()
+                        try:
+                            wait = self._bucket.take()
+                        finally:
+                            self._cond.acquire()
+                        if wait == 0.0:
+                            break
+                        self._cond.wait(wait)
+                    else:
+                        self._cond.wait()
+            finally:
+                self._waiting.remove(ticket)
+                self._cond.notify_all()
+
+            waited = time.monotonic() - start
+            self._admitted += 1
+            self._total_wait += waited
+            self._recent_waits.append(waited)
+
+        if on_position is not None:
+            on_position(None)
+        return waited
+
+    def refund(self):
+        """Give back the token of an admitted request that was never sent"""
+        self._bucket.refund()
+        with self._cond:
+            self._cond.notify_all()
+
+    def metrics(self):
+        """Queue depth and wait-time figures for dashboards"""
+        with self._cond:
+            waits = sorted(self._recent_waits)
+            depth = len(self._waiting)
+            admitted = self._admitted
+            total_wait = self._total_wait
+            peak_depth = self._peak_depth
+
+        def percentile(p):
+            if not waits:
+                return 0.0
+            return waits[min(len(waits) - 1, int(p * len(waits)))]
+
+        return {
+            "queue_depth": depth,
+            "peak_queue_depth": peak_depth,
+            "admitted": admitted,
+            "mean_wait_seconds": total_wait / admitted if admitted else 0.0,
+            "p95_wait_seconds": percentile(0.95),
+            "max_wait_seconds": waits[-1] if waits else 0.0,
+        }
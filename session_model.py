@@ -0,0 +1,198 @@
+"""Compact per-student session state with bounded memory.
+
+A server holds one of these per browser session, and most sessions sit idle
+for most of the lesson. The model keeps them small:
+
+  * check ids are interned once per process and mapped to bit positions, so
+    completed checks are a single int bitset instead of a set of strings
+  * achievements and quiz answers hold interned strings shared by all sessions
+  * free text (design fields, short answers) is clipped to ``TEXT_LIMITS``
+  * every class uses ``__slots__``, so there are no per-instance dicts
+
+``StudentSession.memory_bytes`` estimates one session's footprint, and
+``live_sessions``/``total_memory_bytes`` cover every session in the process.
+"""
+
+import sys
+import threading
+import weakref
+
+# Maximum characters kept for each free-text field
+TEXT_LIMITS = {
+    "name": 80,
+    "mechanism": 1500,
+    "rationale": 1500,
+    "short_answer": 2000,
+}
+
+_check_bits = {}
+_check_ids = []
+_check_lock = threading.Lock()
+_live_sessions = weakref.WeakSet()
+
+
+def check_bit(check_id):
+    """Bit position of a check id, assigned on first use and shared process-wide"""
+    bit = _check_bits.get(check_id)
+    if bit is None:
+        with _check_lock:
+            bit = _check_bits.get(check_id)
+            if bit is None:
+                bit = len(_check_ids)
+                _check_ids.append(sys.intern(check_id))
+                _check_bits[_check_ids[bit]] = bit
+    return bit
+
+
+def clip(text, field):
+    """Trim free text to its field's length limit"""
+    if not text:
+        return ""
+    return text[:TEXT_LIMITS[field]]
+
+
+def _intern(text):
+    return sys.intern(text) if isinstance(text, str) else text
+
+
+class CheckSet:
+    """Set of completed check ids stored as one integer bitset"""
+
+    __slots__ = ("bits",)
+
+    def __init__(self, check_ids=()):
+        self.bits = 0
+        for check_id in check_ids:
+            self.add(check_id)
+
+    def add(self, check_id):
+        self.bits |= 1 << check_bit(check_id)
+
+    def __contains__(self, check_id):
+        bit = _check_bits.get(check_id)
+        return bit is not None and bool(self.bits >> bit & 1)
+
+    def __iter__(self):
+        bits = self.bits
+        bit = 0
+        while bits:
+            if bits & 1:
+                yield _check_ids[bit]
+            bits >>= 1
+            bit += 1
+
+    def __len__(self):
+        return self.bits.bit_count()
+
+    def __repr__(self):
+        return f"CheckSet({sorted(self)!r})"
+
+
+class DesignSubmission:
+    """A submitted treatment design; choice fields are interned, free text clipped"""
+
+    __slots__ = (
+        "name", "disease", "target", "drug_type", "mechanism", "delivery",
+        "efficacy_priority", "side_effects", "cost", "dosing", "rationale",
+    )
+
+    def __init__(self, name, disease, target, drug_type, mechanism, delivery,
+                 efficacy_priority, side_effects, cost, dosing, rationale):
+        self.name = clip(name, "name")
+        self.disease = _intern(disease)
+        self.target = _intern(target)
+        self.drug_type = _intern(drug_type)
+        self.mechanism = clip(mechanism, "mechanism")
+        self.delivery = _intern(delivery)
+        self.efficacy_priority = _intern(efficacy_priority)
+        self.side_effects = tuple(_intern(effect) for effect in side_effects)
+        self.cost = _intern(cost)
+        self.dosing = _intern(dosing)
+        self.rationale = clip(rationale, "rationale")
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def memory_bytes(self):
+        size = sys.getsizeof(self) + sys.getsizeof(self.side_effects)
+        # Interned choice strings are shared with the page content; count only the free text
+        return size + sum(sys.getsizeof(getattr(self, field)) for field in ("name", "mechanism", "rationale"))
+
+
+class StudentSession:
+    """Everything one student has earned or entered during the lesson"""
+
+    __slots__ = (
+        "xp_points", "completed_checks", "achievements", "quiz_progress",
+        "design", "short_answers", "__weakref__",
+    )
+
+    def __init__(self):
+        self.xp_points = 0
+        self.completed_checks = CheckSet()
+        self.achievements = []
+        self.quiz_progress = {}
+        self.design = None
+        self.short_answers = None
+        _live_sessions.add(self)
+
+    def add_achievement(self, achievement):
+        self.achievements.append(sys.intern(achievement))
+
+    def record_quiz_answer(self, progress_key, answer):
+        self.quiz_progress[sys.intern(progress_key)] = sys.intern(answer)
+
+    def set_short_answers(self, q7, q8):
+        self.short_answers = (clip(q7, "short_answer"), clip(q8, "short_answer"))
+
+    def restore(self, xp_points, check_ids, achievements, quiz_progress):
+        """Replace earned progress with a copy loaded from the progress store"""
+        self.xp_points = xp_points
+        self.completed_checks = CheckSet(check_ids)
+        self.achievements = [sys.intern(name) for name in achievements]
+        self.quiz_progress = {}
+        for progress_key, answer in quiz_progress.items():
+            self.record_quiz_answer(progress_key, answer)
+
+    def to_dict(self):
+        """Plain-data copy of the session, for spilling to disk; shares no mutable state with it"""
+        return {
+            "xp_points": self.xp_points,
+            "completed_checks": list(self.completed_checks),
+            "achievements": list(self.achievements),
+            "quiz_progress": dict(self.quiz_progress),
+            "design": self.design.as_dict() if self.design is not None else None,
+            "short_answers": self.short_answers,
+        }
+
+    def load_dict(self, data):
+        self.restore(data["xp_points"], data["completed_checks"], data["achievements"], data["quiz_progress"])
+        self.design = DesignSubmission(**data["design"]) if data["design"] is not None else None
+        self.short_answers = tuple(data["short_answers"]) if data["short_answers"] is not None else None
+
+    def release(self):
+        """Drop everything except XP (shown in the sidebar) after the state was spilled"""
+        self.completed_checks = CheckSet()
+        self.achievements = []
+        self.quiz_progress = {}
+        self.design = None
+        self.short_answers = None
+
+    def memory_bytes(self):
+        """Approximate bytes owned by this session (shared interned strings excluded)"""
+        size = sys.getsizeof(self) + sys.getsizeof(self.completed_checks) + sys.getsizeof(self.completed_checks.bits)
+        size += sys.getsizeof(self.achievements) + sys.getsizeof(self.quiz_progress)
+        if self.design is not None:
+            size += self.design.memory_bytes()
+        if self.short_answers is not None:
+            size += sys.getsizeof(self.short_answers) + sum(sys.getsizeof(text) for text in self.short_answers)
+        return size
+
+
+def live_sessions():
+    """Number of StudentSession objects still alive in this process"""
+    return len(_live_sessions)
+
+
+def total_memory_bytes():
+    return sum(session.memory_bytes() for session in list(_live_sessions))
@@ -0,0 +1,125 @@
+"""Spill idle students' lesson state to disk and bring it back on demand.
+
+Streamlit keeps a session's state until the browser disconnects. Tabs left open
+through six class periods would otherwise keep every student's state resident
+all day. A background thread looks for sessions that have not been touched for
+``idle_seconds``, writes their ``StudentSession`` to a small JSON file and
+releases the in-memory copy. The next rerun or fragment run calls ``touch``,
+which reads the file back before any code looks at the state. Files are removed
+on rehydration, and also when the session itself is garbage collected.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+import weakref
+
+logger = logging.getLogger(__name__)
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class _Entry:
+    __slots__ = ("path", "last_active", "spilled")
+
+    def __init__(self, path):
+        self.path = path
+        self.last_active = time.monotonic()
+        self.spilled = False
+
+
+class SessionSpiller:
+    """Tracks StudentSession activity and spills the idle ones"""
+
+    def __init__(self, spill_dir, idle_seconds=900, check_interval=60):
+        self.spill_dir = spill_dir
+        self.idle_seconds = idle_seconds
+        self.check_interval = check_interval
+        os.makedirs(spill_dir, exist_ok=True)
+        self._entries = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._spills = 0
+        self._rehydrations = 0
+        self._sweeper = threading.Thread(target=self._sweep_loop, name="session-spill", daemon=True)
+        self._sweeper.start()
+
+    def touch(self, session):
+        """Mark the session active, rehydrating it first if it was spilled"""
+        with self._lock:
+            entry = self._entries.get(session)
+            if entry is None:
+                path = os.path.join(self.spill_dir, f"{uuid.uuid4().hex}.json")
+                entry = self._entries[session] = _Entry(path)
+                weakref.finalize(session, _remove_quietly, path)
+            entry.last_active = time.monotonic()
+            if entry.spilled:
+                with open(entry.path, encoding="utf-8") as f:
+                    session.load_dict(json.load(f))
+                _remove_quietly(entry.path)
+                entry.spilled = False
+                self._rehydrations += 1
+        return session
+
+    def spill_idle(self, now=None):
+        """Spill every session idle for longer than ``idle_seconds``; returns how many.
+
+        Candidates are picked and snapshotted under the lock, but written outside
+        it, so ``touch`` on every rerun never waits for the disk. A session touched
+        while its file was being written is kept in memory and the file dropped.
+        A session that fails to spill is logged and left in memory.
+        """
+        cutoff = (time.monotonic() if now is None else now) - self.idle_seconds
+        with self._lock:
+            candidates = [
+                (session, entry, entry.last_active, session.to_dict()) for session, entry in self._entries.items()
+                if not entry.spilled and entry.last_active <= cutoff
+            ]
+
+        spilled = 0
+        for session, entry, last_active, snapshot in candidates:
+            tmp_path = entry.path + ".tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
+                os.replace(tmp_path, entry.path)
+            except Exception:
+                logger.exception("Failed to spill session to %s", entry.path)
+                _remove_quietly(tmp_path)
+                continue
+            with self._lock:
+                kept = entry.last_active != last_active or entry.spilled
+                if not kept:
+                    session.release()
+                    entry.spilled = True
+                    spilled += 1
+            if kept:
+                _remove_quietly(entry.path)
+        with self._lock:
+            self._spills += spilled
+        return spilled
+
+    def stats(self):
+        with self._lock:
+            entries = list(self._entries.values())
+            return {
+                "tracked": len(entries),
+                "spilled": sum(entry.spilled for entry in entries),
+                "spills": self._spills,
+                "rehydrations": self._rehydrations,
+            }
+
+    def _sweep_loop(self):
+        while True:
+            time.sleep(self.check_interval)
+            try:
+                self.spill_idle()
+            except Exception:
+                logger.exception("Failed to spill idle sessions")
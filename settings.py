@@ -0,0 +1,115 @@
+"""Runtime settings for the lesson app, read from environment variables.
+
+Credentials may also come from .streamlit/secrets.toml (see ``secret``).
+"""
+
+import os
+
+
+def secret(name):
+    """``name`` from the environment, else from .streamlit/secrets.toml, else "" """
+    value = os.environ.get(name)
+    if value:
+        return value
+    import streamlit as st
+
+    if st.secrets.load_if_toml_exists():
+        return str(st.secrets.get(name, ""))
+    return ""
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONTENT_DIR = os.path.join(BASE_DIR, "content")
+CONTENT_BUNDLE_PATH = os.environ.get("BLUEDEVIL_CONTENT_BUNDLE", os.path.join(CONTENT_DIR, "bundle.json"))
+
+# Directory for on-disk state (caches, progress store, etc.)
+DATA_DIR = os.environ.get("BLUEDEVIL_DATA_DIR", ".data")
+
+# Professor Xavier feedback cache
+FEEDBACK_CACHE_PATH = os.environ.get(
+    "BLUEDEVIL_FEEDBACK_CACHE", os.path.join(DATA_DIR, "feedback_cache.sqlite3")
+)
+FEEDBACK_CACHE_TTL = int(os.environ.get("BLUEDEVIL_FEEDBACK_CACHE_TTL", 7 * 24 * 3600))
+FEEDBACK_CACHE_MAX_ENTRIES = int(os.environ.get("BLUEDEVIL_FEEDBACK_CACHE_MAX", 5000))
+
+# Feedback precomputed offline for every structured design combination
+# (built by tools/precompute_feedback.py)
+FEEDBACK_MATRIX_PATH = os.environ.get(
+    "BLUEDEVIL_FEEDBACK_MATRIX", os.path.join(DATA_DIR, "feedback_matrix.sqlite3")
+)
+
+# Messages API used for Professor Xavier's feedback. The key is read from the
+# environment or .streamlit/secrets.toml; without one the LLM is never called
+# and students get the locally available feedback instead.
+LLM_API_URL = os.environ.get("BLUEDEVIL_LLM_URL", "https://api.anthropic.com/v1/messages")
+LLM_API_KEY = secret("ANTHROPIC_API_KEY")
+LLM_MODEL = os.environ.get("BLUEDEVIL_LLM_MODEL", "claude-sonnet-4-20250514")
+LLM_CONNECT_TIMEOUT = float(os.environ.get("BLUEDEVIL_LLM_CONNECT_TIMEOUT", 10))
+LLM_READ_TIMEOUT = float(os.environ.get("BLUEDEVIL_LLM_READ_TIMEOUT", 60))
+
+# Circuit breaker on LLM calls: opens after this many consecutive failures, or
+# consecutive calls whose first token took longer than the SLO (seconds), and
+# probes again after the open period
+LLM_BREAKER_FAILURES = int(os.environ.get("BLUEDEVIL_LLM_BREAKER_FAILURES", 5))
+LLM_BREAKER_SLOW_CALLS = int(os.environ.get("BLUEDEVIL_LLM_BREAKER_SLOW_CALLS", 3))
+LLM_LATENCY_SLO = float(os.environ.get("BLUEDEVIL_LLM_LATENCY_SLO", 15))
+LLM_BREAKER_OPEN_SECONDS = float(os.environ.get("BLUEDEVIL_LLM_BREAKER_OPEN_SECONDS", 30))
+
+# Shared HTTP connection pool for outbound LLM calls
+HTTP_POOL_SIZE = int(os.environ.get("BLUEDEVIL_HTTP_POOL_SIZE", 32))
+HTTP_MAX_RETRIES = int(os.environ.get("BLUEDEVIL_HTTP_MAX_RETRIES", 3))
+HTTP_BACKOFF_FACTOR = float(os.environ.get("BLUEDEVIL_HTTP_BACKOFF", 0.5))
+
+# Background feedback workers (global cap on concurrent LLM requests)
+FEEDBACK_WORKERS = int(os.environ.get("BLUEDEVIL_FEEDBACK_WORKERS", 8))
+
+# Rate limit for LLM requests. Set BLUEDEVIL_LLM_RATE_STATE to a file path to
+# share one budget between all server processes on the machine.
+LLM_RATE_PER_MINUTE = float(os.environ.get("BLUEDEVIL_LLM_RATE_PER_MINUTE", 50))
+LLM_RATE_BURST = int(os.environ.get("BLUEDEVIL_LLM_RATE_BURST", 10))
+LLM_RATE_STATE_PATH = os.environ.get("BLUEDEVIL_LLM_RATE_STATE", "")
+
+# Multiple-choice question bank shown on the quiz page
+QUIZ_BANK_PATH = os.environ.get("BLUEDEVIL_QUIZ_BANK", os.path.join(CONTENT_DIR, "quiz.yaml"))
+
+# Student progress ledger (write-behind SQLite in WAL mode)
+PROGRESS_DB_PATH = os.environ.get("BLUEDEVIL_PROGRESS_DB", os.path.join(DATA_DIR, "progress.sqlite3"))
+PROGRESS_BATCH_SIZE = int(os.environ.get("BLUEDEVIL_PROGRESS_BATCH_SIZE", 200))
+PROGRESS_FLUSH_INTERVAL = float(os.environ.get("BLUEDEVIL_PROGRESS_FLUSH_INTERVAL", 2.0))
+
+# Learning-analytics event log: Parquet row groups every N events or T seconds,
+# in segments closed after N events or T seconds
+EVENT_LOG_DIR = os.environ.get("BLUEDEVIL_EVENT_LOG_DIR", os.path.join(DATA_DIR, "events"))
+EVENT_LOG_BATCH_SIZE = int(os.environ.get("BLUEDEVIL_EVENT_LOG_BATCH_SIZE", 5000))
+EVENT_LOG_FLUSH_INTERVAL = float(os.environ.get("BLUEDEVIL_EVENT_LOG_FLUSH_INTERVAL", 30.0))
+EVENT_LOG_SEGMENT_EVENTS = int(os.environ.get("BLUEDEVIL_EVENT_LOG_SEGMENT_EVENTS", 500_000))
+EVENT_LOG_SEGMENT_SECONDS = float(os.environ.get("BLUEDEVIL_EVENT_LOG_SEGMENT_SECONDS", 600))
+
+# Passcode for the teacher tools (class dashboard, gradebook export, batch
+# grading), from the environment or .streamlit/secrets.toml. It is checked on
+# the server; without one the teacher tools stay locked.
+TEACHER_PASSCODE = secret("BLUEDEVIL_TEACHER_PASSCODE")
+
+# Seconds between live refreshes of the teacher's class dashboard
+CLASS_DASHBOARD_REFRESH = float(os.environ.get("BLUEDEVIL_DASHBOARD_REFRESH", 3.0))
+
+# Opt-in profiling of reruns: Prometheus text on 127.0.0.1:<port>/metrics when
+# the port is set, and/or a Chrome trace-event file
+PROFILING = os.environ.get("BLUEDEVIL_PROFILE", "").lower() in ("1", "true", "yes")
+PROFILE_TRACE_PATH = os.environ.get("BLUEDEVIL_PROFILE_TRACE", "")
+PROFILE_METRICS_PORT = int(os.environ.get("BLUEDEVIL_PROFILE_PORT", 0))
+
+# Sessions idle this long have their lesson state spilled to disk until the
+# student interacts again
+SESSION_IDLE_SECONDS = float(os.environ.get("BLUEDEVIL_SESSION_IDLE_SECONDS", 900))
+SESSION_SPILL_INTERVAL = float(os.environ.get("BLUEDEVIL_SESSION_SPILL_INTERVAL", 60))
+SESSION_SPILL_DIR = os.environ.get("BLUEDEVIL_SESSION_SPILL_DIR", os.path.join(DATA_DIR, "sessions"))
+
+# Batched short-answer grading: answers per LLM request and requests in flight
+GRADING_BATCH_SIZE = int(os.environ.get("BLUEDEVIL_GRADING_BATCH_SIZE", 10))
+GRADING_CONCURRENCY = int(os.environ.get("BLUEDEVIL_GRADING_CONCURRENCY", 4))
+
+# Reuse feedback for designs with the same choices and nearly the same text
+# (estimated Jaccard similarity of the mechanism and rationale)
+SIMILAR_DESIGN_THRESHOLD = float(os.environ.get("BLUEDEVIL_SIMILAR_DESIGN_THRESHOLD", 0.8))
+SIMILAR_DESIGN_MAX_ENTRIES = int(os.environ.get("BLUEDEVIL_SIMILAR_DESIGN_MAX_ENTRIES", 2000))
@@ -0,0 +1,240 @@
+"""Rubric grading of the quiz short answers (q7, q8) for a whole class at once.
+
+Answers are de-duplicated by a hash of the normalized text and looked up in the
+shared feedback cache. The remaining answers are packed, per question, into
+batched prompts that ask for one JSON score per answer. Batches run on a small
+thread pool, so concurrency is capped independently of the class size. The
+LLM call is passed in as a function, so the grader runs the same way against
+the real API, the local stub server or a fake. An optional prefilter (see
+``concept_prefilter``) grades the clear-cut answers locally before any of that.
+"""
+
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import llm_client
+
+GRADING_VERSION = 1
+
+LOCAL = "local"
+CACHED = "cached"
+GRADED = "graded"
+FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class Submission:
+    student_id: str
+    question_id: str
+    answer: str
+
+
+@dataclass(frozen=True)
+class RubricQuestion:
+    id: str
+    prompt: str
+    criteria: tuple
+
+    @property
+    def max_score(self):
+        return len(self.criteria)
+
+
+@dataclass
+class GradingReport:
+    rows: list = field(default_factory=list)
+    unique_answers: int = 0
+    local: int = 0
+    cached: int = 0
+    graded: int = 0
+    failed: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+
+def answer_key(question_id, answer):
+    """Cache key for one answer: identical answers (ignoring case and spacing) share a grade"""
+    normalized = " ".join(answer.lower().split())
+    payload = json.dumps(["short_answer", GRADING_VERSION, question_id, normalized], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def build_batch_prompt(question, answers):
+    """Prompt grading several answers to one question; ``answers`` is a list of (id, text)"""
+    criteria = "\n".join(f"{number}. {criterion}" for number, criterion in enumerate(question.criteria, start=1))
+    blocks = "\n".join(f'<answer id="{answer_id}">\n{text}\n</answer>' for answer_id, text in answers)
+    return f"""You are Professor Xavier, grading high school biology short answers against a rubric.
+
+## Question
+{question.prompt}
+
+## Rubric (one point per criterion met)
+{criteria}
+
+Score each answer from 0 to {question.max_score} and give one or two sentences of feedback
+addressed to the student, naming what they got right and the most important thing missing.
+
+Reply with ONLY a JSON array, one object per answer, in this form:
+[{{"id": 1, "score": 3, "feedback": "..."}}]
+
+<answers>
+{blocks}
+</answers>"""
+
+
+def parse_batch_response(text, answer_ids, max_score):
+    """Map answer id -> (score, feedback) from the model's JSON array; missing ids are left out"""
+    start, end = text.find("["), text.rfind("]")
+    if start == -1 or end < start:
+        raise ValueError("no JSON array in grading response")
+    grades = {}
+    for item in json.loads(text[start:end + 1]):
+        try:
+            answer_id = int(item["id"])
+            score = int(item["score"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if answer_id in answer_ids:
+            grades[answer_id] = (min(max(score, 0), max_score), str(item.get("feedback", "")).strip())
+    return grades
+
+
+def concept_prefilter(scorers):
+    """Prefilter grading the answers the local concept scorer is sure about (see concept_scorer)"""
+    def prefilter(submission, question):
+        result = scorers[submission.question_id].score(submission.answer)
+        if result.needs_llm:
+            return None
+        return {
+            "score": result.rubric_score(question.max_score),
+            "max_score": question.max_score,
+            "feedback": result.feedback(),
+        }
+    return prefilter
+
+
+def make_llm_requester(session, limiter=None, max_tokens=4000, breaker=None):
+    """``request(prompt) -> text`` using the streaming messages client.
+
+    With a ``breaker`` (see circuit_breaker) requests fail fast while it is open
+    and report their outcome and time to first token to it.
+    """
+    def request(prompt):
+        # An open circuit fails fast, without spending a token the students' feedback needs
+        if breaker is not None and breaker.is_open:
+            raise llm_client.LLMStreamError("circuit open")
+        if limiter is not None:
+            limiter.acquire()
+        if breaker is not None and not breaker.allow():
+            if limiter is not None:
+                limiter.refund()
+            raise llm_client.LLMStreamError("circuit open")
+        started = time.monotonic()
+        status_code = None
+        chunks = []
+        try:
+            response = llm_client.open_message_stream(prompt, max_tokens=max_tokens, session=session)
+            if response.status_code != 200:
+                status_code = response.status_code
+                response.close()
+                raise llm_client.LLMStreamError(f"HTTP {status_code}")
+            for chunk in llm_client.stream_response_text(response):
+                if not chunks and breaker is not None:
+                    breaker.record_success(time.monotonic() - started)
+                chunks.append(chunk)
+        except Exception:
+            if not chunks and breaker is not None:
+                breaker.record_error(time.monotonic() - started, status_code)
+            raise
+        if not chunks and breaker is not None:
+            breaker.record_success(time.monotonic() - started)
+        return "".join(chunks)
+    return request
+
+
+def grade_submissions(submissions, questions, cache, request, batch_size=10, max_concurrency=4, prefilter=None):
+    """Grade every submission; returns a :class:`GradingReport` with one row per submission.
+
+    ``prefilter(submission, question)`` may return a grade dict to skip the
+    cache and the LLM for that answer, or None to grade it normally. Without a
+    ``request`` (no API key) the answers that would need the LLM fail.
+    """
+    started = time.perf_counter()
+    report = GradingReport()
+
+    keyed = [(submission, answer_key(submission.question_id, submission.answer))
+             for submission in submissions if submission.answer.strip() and submission.question_id in questions]
+    grades = {}
+    pending = {}
+    for submission, key in keyed:
+        if key in grades or key in pending:
+            continue
+        local = prefilter(submission, questions[submission.question_id]) if prefilter else None
+        if local is not None:
+            grades[key] = (LOCAL, local)
+            continue
+        cached = cache.get(key)
+        if cached is not None:
+            grades[key] = (CACHED, json.loads(cached))
+        else:
+            pending[key] = submission
+    report.unique_answers = len(grades) + len(pending)
+
+    batches = []
+    for question_id, question in questions.items():
+        keys = [key for key, submission in pending.items() if submission.question_id == question_id]
+        for i in range(0, len(keys), batch_size):
+            batches.append((question, keys[i:i + batch_size]))
+    report.batches = len(batches)
+
+    def grade_batch(batch):
+        question, keys = batch
+        if request is None:
+            return {key: (FAILED, {"error": "LLM grading is disabled (no API key)"}) for key in keys}
+        answers = [(number, pending[key].answer) for number, key in enumerate(keys, start=1)]
+        try:
+            text = request(build_batch_prompt(question, answers))
+            parsed = parse_batch_response(text, set(range(1, len(keys) + 1)), question.max_score)
+        except Exception as e:
+            return {key: (FAILED, {"error": str(e)}) for key in keys}
+        results = {}
+        for number, key in enumerate(keys, start=1):
+            if number in parsed:
+                score, feedback = parsed[number]
+                grade = {"score": score, "max_score": question.max_score, "feedback": feedback}
+                cache.put(key, json.dumps(grade))
+                results[key] = (GRADED, grade)
+            else:
+                results[key] = (FAILED, {"error": "answer missing from grading response"})
+        return results
+
+    if batches:
+        with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="grading") as pool:
+            for results in pool.map(grade_batch, batches):
+                grades.update(results)
+
+    for source, _ in grades.values():
+        if source == LOCAL:
+            report.local += 1
+        elif source == CACHED:
+            report.cached += 1
+        elif source == GRADED:
+            report.graded += 1
+        else:
+            report.failed += 1
+
+    for submission, key in keyed:
+        source, grade = grades[key]
+        report.rows.append({
+            "student_id": submission.student_id,
+            "question_id": submission.question_id,
+            "score": grade.get("score"),
+            "max_score": grade.get("max_score", questions[submission.question_id].max_score),
+            "feedback": grade.get("feedback") or grade.get("error", ""),
+            "source": source,
+        })
+    report.seconds = time.perf_counter() - started
+    return report
@@ -0,0 +1,77 @@
+"""The lesson stylesheet, served as a static file instead of on every rerun.
+
+``tools/build_content.py`` minifies ``assets/lesson.css`` and writes it to
+``static/`` under a name carrying its content hash (``lesson.<hash>.css``); the
+file is committed with the source. With Streamlit's static file serving on
+(``server.enableStaticServing`` in .streamlit/config.toml), each rerun sends a
+one-line ``<link>`` to ``app/static/lesson.<hash>.css`` instead of the whole
+``<style>`` block. The browser fetches the file once and revalidates it from
+cache afterwards. Editing the CSS changes the hash and so the URL, which means a
+stale copy is never used. The app never writes the file. When it is missing or
+out of date, or the Streamlit version cannot serve it (see
+``STATIC_CSS_STREAMLIT``), the minified CSS is inlined as before.
+"""
+
+import glob
+import hashlib
+import os
+import re
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STYLESHEET_SOURCE = os.path.join(ROOT, "assets", "lesson.css")
+# Streamlit serves the "static" directory next to the entry script at app/static/
+STATIC_DIR = os.path.join(ROOT, "static")
+STATIC_URL = "app/static"
+# Before 1.57, Streamlit sends app/static files other than images, fonts and a few
+# others as text/plain with "X-Content-Type-Options: nosniff", and browsers
+# refuse a stylesheet served that way
+STATIC_CSS_STREAMLIT = (1, 57)
+
+_COMMENTS = re.compile(r"/\*.*?\*/", re.DOTALL)
+_SPACE_AROUND = re.compile(r"\s*([{}:;,>])\s*")
+
+
+def minify_css(text):
+    """Drop comments and insignificant whitespace (enough for hand-written CSS)"""
+    text = _COMMENTS.sub("", text)
+    text = " ".join(text.split())
+    text = _SPACE_AROUND.sub(r"\1", text)
+    return text.replace(";}", "}")
+
+
+class Stylesheet:
+    """Minified CSS and the hashed file name it is published under"""
+
+    def __init__(self, source_path=STYLESHEET_SOURCE):
+        with open(source_path, encoding="utf-8") as f:
+            self.css = minify_css(f.read())
+        stem = os.path.splitext(os.path.basename(source_path))[0]
+        self.digest = hashlib.sha256(self.css.encode("utf-8")).hexdigest()[:12]
+        self.filename = f"{stem}.{self.digest}.css"
+        self._stem = stem
+
+    def is_published(self, static_dir=STATIC_DIR):
+        return os.path.exists(os.path.join(static_dir, self.filename))
+
+    def publish(self, static_dir=STATIC_DIR):
+        """Build step: write the hashed file (unless present) and remove older versions of it"""
+        os.makedirs(static_dir, exist_ok=True)
+        path = os.path.join(static_dir, self.filename)
+        if not os.path.exists(path):
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(self.css)
+            os.replace(tmp_path, path)
+        for stale in glob.glob(os.path.join(static_dir, f"{self._stem}.*.css")):
+            if stale != path:
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+        return path
+
+    def link_tag(self):
+        return f'<link rel="stylesheet" href="{STATIC_URL}/{self.filename}">'
+
+    def style_tag(self):
+        return f"<style>{self.css}</style>"
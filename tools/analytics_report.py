@@ -0,0 +1,98 @@
+"""Item difficulty and time on page from the analytics event log.
+
+    python tools/analytics_report.py
+    python tools/analytics_report.py --since-hours 24
+    python tools/analytics_report.py --synthetic 5000000
+
+Reads every closed segment under settings.EVENT_LOG_DIR (see event_log.py).
+--synthetic N writes N generated events to a temporary log first, as
+full-size row groups, and times loading and both aggregations over them.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import settings  # noqa: E402
+from event_log import CHECK, SCHEMA, SELECT, VIEW, XP, item_difficulty, load_events, time_on_page  # noqa: E402
+
+PAGES = (
+    "Home", "News Article", "Learning Objectives", "The Immune System", "Autoimmune Diseases",
+    "Drug Development", "Design a Treatment", "Quiz & Assessment", "Resources",
+)
+ITEMS = ("immune_q1", "auto_q1", "auto_q2", "drug_q1", "drug_q2", "q1", "q2", "q3", "q4", "q5", "q6")
+
+
+def write_synthetic(directory, events, seed, segment_events=1_000_000):
+    """Generated sessions that view pages, pick answers, check them and earn XP"""
+    rng = np.random.default_rng(seed)
+    sessions = max(1, events // 40)
+    for start in range(0, events, segment_events):
+        n = min(segment_events, events - start)
+        session = rng.integers(0, sessions, n)
+        kind = rng.choice([VIEW, SELECT, CHECK, XP], n, p=[0.25, 0.4, 0.25, 0.1])
+        item_index = rng.integers(0, len(ITEMS), n)
+        # Later items are harder
+        correct = rng.random(n) < 0.9 - 0.06 * item_index
+        graded = np.isin(kind, [SELECT, CHECK])
+        table = pa.table({
+            "ts": 1.7e9 + np.sort(rng.random(n)) * 86400,
+            "session": pa.array(np.char.add("s", session.astype(str))),
+            "student": pa.array(np.where(session % 3 == 0, "", np.char.add("student-", session.astype(str)))),
+            "kind": pa.array(kind),
+            "page": pa.array(np.array(PAGES)[rng.integers(0, len(PAGES), n)]),
+            "item": pa.array(np.where(kind == VIEW, "", np.array(ITEMS)[item_index])),
+            "value": pa.array(np.where(graded, np.array(list("ABCD"))[rng.integers(0, 4, n)], "")),
+            "correct": pa.array(correct, mask=~graded),
+            "points": pa.array(np.full(n, 10, dtype=np.int32), mask=kind != XP),
+        }, schema=SCHEMA)
+        pq.write_table(table, os.path.join(directory, f"events-{start:012d}-0.parquet"),
+                       compression="zstd", row_group_size=50_000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--since-hours", type=float, help="only events from the last N hours")
+    parser.add_argument("--synthetic", type=int, default=0, help="report on this many generated events instead")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bluedevil-events-") as scratch:
+        directory = settings.EVENT_LOG_DIR
+        if args.synthetic:
+            directory = scratch
+            write_synthetic(directory, args.synthetic, args.seed)
+
+        since = time.time() - args.since_hours * 3600 if args.since_hours else None
+        started = time.perf_counter()
+        events = load_events(directory, since=since)
+        loaded = time.perf_counter()
+        difficulty = item_difficulty(events)
+        scored = time.perf_counter()
+        pages = time_on_page(events)
+        finished = time.perf_counter()
+
+    pd.set_option("display.width", 120)
+    print(f"{len(events):,} events, {events.memory_usage(deep=True).sum() / 2**20:.0f} MiB in memory")
+    print(f"  load {loaded - started:.2f}s, item difficulty {scored - loaded:.2f}s, "
+          f"time on page {finished - scored:.2f}s")
+    if events.empty:
+        return
+    print("\nItem difficulty (hardest first)")
+    print(difficulty.round(3).to_string())
+    print("\nTime on page")
+    print(pages.round(1).to_string())
+
+
+if __name__ == "__main__":
+    main()
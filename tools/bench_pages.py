@@ -0,0 +1,175 @@
+"""Per-page render benchmarks, compared against a stored baseline.
+
+    python tools/bench_pages.py                    # compare with the baseline
+    python tools/bench_pages.py --update-baseline  # accept the current numbers
+    python tools/bench_pages.py --baseline local.json --update-baseline --with-times  # also this machine's times
+
+Each of the nine pages is rendered on its own in a fresh headless AppTest
+session. The page is opened directly by its entry script in app_pages/, so no
+navigation click is involved. With profiling on (see instrumentation.py), the show_* span isolates
+the page function from the sidebar and CSS. For every page the benchmark
+records:
+
+  * page_ms: median time spent in the page's show_* function
+  * rerun_ms: median time for the whole rerun
+  * elements: number of elements in the main area
+  * delta_bytes: serialized size of those elements (what is sent to the browser)
+
+A page whose numbers exceed the baseline by more than the tolerance is
+reported as a regression and the script exits with status 1, as it does when
+there is no baseline. Element counts and delta sizes are deterministic for a
+given Streamlit version, and the committed baseline
+(tools/page_benchmark_baseline.json) holds only those; update it in the same
+commit as a change that is meant to alter them. Times depend on the machine, so
+they are only compared when a local baseline was written with --with-times.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+APP_PATH = os.path.join(ROOT, "app.py")
+BASELINE_PATH = os.path.join(ROOT, "tools", "page_benchmark_baseline.json")
+PAGES = (
+    "home", "article", "objectives", "immune_system", "autoimmune",
+    "drug_development", "design_challenge", "quiz", "resources",
+)
+# Allowed growth over the baseline before a metric counts as a regression
+TOLERANCES = {"page_ms": 0.5, "rerun_ms": 0.5, "elements": 0.0, "delta_bytes": 0.05}
+# Metrics that are the same on every machine
+DETERMINISTIC = ("elements", "delta_bytes")
+
+
+def walk(node):
+    yield node
+    for child in getattr(node, "children", {}).values():
+        yield from walk(child)
+
+
+def measure_tree(root):
+    """Element count and serialized protobuf size of an AppTest subtree"""
+    elements = 0
+    size = 0
+    for node in walk(root):
+        proto = getattr(node, "proto", None)
+        if proto is None:
+            continue
+        size += proto.ByteSize()
+        if not hasattr(node, "children"):
+            elements += 1
+    return elements, size
+
+
+def bench_page(page, repeat, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    import instrumentation
+
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    at.switch_page(f"app_pages/{page}.py")
+    at.run()  # warm-up: module imports, cached resources, content load
+
+    span = f"show_{page}"
+    page_times = []
+    rerun_times = []
+    for _ in range(repeat):
+        before = instrumentation.get_profiler().snapshot()["spans"].get(span, {}).get("sum", 0.0)
+        started = time.perf_counter()
+        at.run()
+        rerun_times.append(time.perf_counter() - started)
+        after = instrumentation.get_profiler().snapshot()["spans"][span]["sum"]
+        page_times.append(after - before)
+
+    if at.exception:
+        raise RuntimeError(f"{page}: {at.exception[0].message}")
+
+    elements, delta_bytes = measure_tree(at.main)
+    return {
+        "page_ms": statistics.median(page_times) * 1000,
+        "rerun_ms": statistics.median(rerun_times) * 1000,
+        "elements": elements,
+        "delta_bytes": delta_bytes,
+    }
+
+
+def compare(results, baseline, tolerances):
+    """Regression messages for metrics that grew past their tolerance"""
+    problems = []
+    for page, metrics in results.items():
+        expected = baseline.get(page)
+        if expected is None:
+            problems.append(f"{page}: not in the baseline")
+            continue
+        for metric, value in metrics.items():
+            limit = expected.get(metric)
+            if limit is not None and value > limit * (1 + tolerances[metric]):
+                problems.append(f"{page}: {metric} {value:,.1f} > baseline {limit:,.1f} (+{tolerances[metric]:.0%} allowed)")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*", default=list(PAGES), help="pages to benchmark (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="measured reruns per page")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--with-times", action="store_true",
+                        help="with --update-baseline, also store this machine's page_ms and rerun_ms")
+    parser.add_argument("--time-tolerance", type=float, default=TOLERANCES["page_ms"],
+                        help="allowed fractional slowdown for page_ms and rerun_ms")
+    args = parser.parse_args()
+
+    tolerances = dict(TOLERANCES, page_ms=args.time_tolerance, rerun_ms=args.time_tolerance)
+
+    with tempfile.TemporaryDirectory(prefix="bluedevil-bench-") as data_dir:
+        os.environ["BLUEDEVIL_DATA_DIR"] = data_dir
+        os.environ["BLUEDEVIL_PROFILE"] = "1"
+        results = {page: bench_page(page, args.repeat, args.timeout) for page in args.pages}
+        # Close the analytics segment while the data directory still exists
+        from common import get_event_log
+        get_event_log().flush()
+
+    print(f"{'page':<18}{'page ms':>10}{'rerun ms':>10}{'elements':>10}{'delta bytes':>13}")
+    for page, metrics in results.items():
+        print(f"{page:<18}{metrics['page_ms']:>10.1f}{metrics['rerun_ms']:>10.1f}"
+              f"{metrics['elements']:>10}{metrics['delta_bytes']:>13,}")
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        for page, metrics in results.items():
+            baseline[page] = {
+                metric: value for metric, value in metrics.items() if args.with_times or metric in DETERMINISTIC
+            }
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nBaseline written to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; run with --update-baseline to create one")
+        sys.exit(1)
+
+    with open(args.baseline, encoding="utf-8") as f:
+        problems = compare(results, json.load(f), tolerances)
+    if problems:
+        print("\nREGRESSIONS:")
+        for problem in problems:
+            print(f"  {problem}")
+        sys.exit(1)
+    print("\nNo regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Pre-compile the lesson content YAML into the JSON bundle loaded at startup,
+and build the hashed lesson stylesheet served from static/.
+
+    python tools/build_content.py
+
+Run after editing anything under content/pages/ or assets/lesson.css, and
+commit the new static/lesson.<hash>.css. The app still works without the bundle
+(or with a stale one); it just parses the YAML on cold start. Without a current
+stylesheet it inlines the CSS on every page instead.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import settings  # noqa: E402
+from lesson_content import build_bundle  # noqa: E402
+from static_assets import Stylesheet  # noqa: E402
+
+
+def main():
+    count = build_bundle(settings.CONTENT_DIR, settings.CONTENT_BUNDLE_PATH)
+    size = os.path.getsize(settings.CONTENT_BUNDLE_PATH)
+    print(f"Wrote {count} pages to {settings.CONTENT_BUNDLE_PATH} ({size / 1024:.1f} KiB)")
+
+    path = Stylesheet().publish()
+    print(f"Wrote the lesson stylesheet to {path} ({os.path.getsize(path) / 1024:.1f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Export the class gradebook from the progress store as CSV or Parquet.
+
+    python tools/export_gradebook.py gradebook.csv
+    python tools/export_gradebook.py gradebook.parquet --chunk-size 5000
+    python tools/export_gradebook.py district.parquet --synthetic 50000
+
+The format follows the file extension unless --format is given. Students are
+streamed a chunk at a time (see gradebook.py), so a district export never holds
+the whole class in memory. --synthetic N first fills a temporary progress
+store with N generated students, which measures export time and peak memory
+offline.
+"""
+
+import argparse
+import os
+import random
+import resource
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import settings  # noqa: E402
+from gradebook import DEFAULT_CHUNK_SIZE, FORMATS, export_gradebook  # noqa: E402
+
+CHECKS = (
+    "immune_q1", "auto_q1", "auto_q2", "drug_q1", "drug_q2", "quiz_q1", "quiz_q2", "quiz_q3",
+    "design_challenge", "design_feedback", "short_answer_feedback",
+)
+ACHIEVEMENTS = ("🌟 First Steps", "🔬 Biotech Researcher", "📝 Quiz Champion", "🏆 Perfect Score")
+QUESTIONS = tuple(f"q{n}" for n in range(1, 7))
+
+
+def fill_synthetic(db_path, students, seed):
+    """Write ``students`` generated students straight into a fresh progress database"""
+    from progress_store import SCHEMA, connect
+
+    rng = random.Random(seed)
+    conn = connect(db_path)
+    conn.executescript(SCHEMA)
+    for start in range(0, students, 5000):
+        checks, achievements, answers, short_answers = [], [], [], []
+        for n in range(start, min(start + 5000, students)):
+            student = f"student-{n:06d}"
+            checks += [(student, check, rng.choice((10, 15, 25, 50)), n) for check in rng.sample(CHECKS, rng.randint(0, len(CHECKS)))]
+            achievements += [(student, name, n) for name in rng.sample(ACHIEVEMENTS, rng.randint(0, len(ACHIEVEMENTS)))]
+            answers += [(student, q, rng.choice("ABCD"), rng.random() < 0.6, n) for q in QUESTIONS if rng.random() < 0.9]
+            short_answers += [(student, q, "The drug fits the active site and blocks TYK2.", n) for q in ("q7", "q8") if rng.random() < 0.7]
+        conn.execute("BEGIN")
+        conn.executemany("INSERT INTO xp_ledger VALUES (?, ?, ?, ?)", checks)
+        conn.executemany("INSERT INTO achievements VALUES (?, ?, ?)", achievements)
+        conn.executemany("INSERT INTO quiz_answers VALUES (?, ?, ?, ?, ?)", answers)
+        conn.executemany("INSERT INTO short_answers VALUES (?, ?, ?, ?)", short_answers)
+        conn.execute("COMMIT")
+    conn.close()
+
+
+def peak_rss_mib():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 if sys.platform != "darwin" else peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("output", help="file to write (.csv or .parquet)")
+    parser.add_argument("--format", choices=FORMATS, help="default: from the output file extension")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="students read per chunk")
+    parser.add_argument("--synthetic", type=int, default=0, help="export this many generated students instead")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    fmt = args.format or os.path.splitext(args.output)[1].lstrip(".").lower()
+    if fmt not in FORMATS:
+        parser.error("cannot tell the format from the file name; pass --format")
+
+    with tempfile.TemporaryDirectory(prefix="bluedevil-gradebook-") as scratch:
+        db_path = settings.PROGRESS_DB_PATH
+        if args.synthetic:
+            db_path = os.path.join(scratch, "progress.sqlite3")
+            fill_synthetic(db_path, args.synthetic, args.seed)
+        elif not os.path.exists(db_path):
+            parser.error(f"no progress store at {db_path}")
+
+        rss_before = peak_rss_mib()
+        rows, seconds = export_gradebook(db_path, args.output, fmt, args.chunk_size)
+
+    size = os.path.getsize(args.output) if rows else 0
+    print(f"Exported {rows} students to {args.output} in {seconds:.1f}s ({size / 1024 / 1024:.1f} MiB)")
+    print(f"  peak RSS {peak_rss_mib():.0f} MiB ({peak_rss_mib() - rss_before:+.0f} MiB during the export, "
+          f"chunks of {args.chunk_size})")
+
+
+if __name__ == "__main__":
+    main()
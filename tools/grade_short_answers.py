@@ -0,0 +1,115 @@
+"""Grade stored quiz short answers in batches, or time a synthetic class offline.
+
+    python tools/grade_short_answers.py                      # every answer in the progress store
+    python tools/grade_short_answers.py --synthetic 150 --stub
+
+--synthetic N grades N generated answers (about half to each of q7 and q8), and
+--stub sends the requests to tools/stub_llm_server.py running in-process. The
+two together give a repeatable, offline measure of batch grading time. Answers
+the local concept scorer is sure about skip the LLM unless --no-prefilter. Grades
+go into the feedback cache, so a second run reports them as cached unless
+--fresh-cache is given.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tools"))
+
+import settings  # noqa: E402
+from stub_llm_server import make_server  # noqa: E402
+
+SENTENCES = (
+    "TYK2 is an enzyme and its active site has a specific shape.",
+    "Scientists map the protein structure with X-ray crystallography.",
+    "The drug fits into the active site like a key in a lock and blocks ATP.",
+    "Blocking TYK2 stops the inflammatory signal from reaching the nucleus.",
+    "Phase 3 trials test the drug on thousands of patients.",
+    "After Phase 3 success the FDA is very likely to approve the drug.",
+    "Investors expect billions of dollars in sales because psoriasis is common.",
+    "Years of research on the immune pathway finally paid off.",
+)
+
+
+def synthetic_submissions(count, seed):
+    from short_answer_grading import Submission
+
+    rng = random.Random(seed)
+    return [
+        Submission(f"synthetic-{n // 2:04d}", "q7" if n % 2 == 0 else "q8",
+                   " ".join(rng.sample(SENTENCES, rng.randint(1, len(SENTENCES)))))
+        for n in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--synthetic", type=int, default=0, help="grade this many generated answers")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--stub", action="store_true", help="use the in-process stub LLM server")
+    parser.add_argument("--fresh-cache", action="store_true", help="use an empty, temporary grade cache")
+    parser.add_argument("--no-prefilter", action="store_true", help="send every answer to the LLM")
+    parser.add_argument("--batch-size", type=int, default=settings.GRADING_BATCH_SIZE)
+    parser.add_argument("--concurrency", type=int, default=settings.GRADING_CONCURRENCY)
+    args = parser.parse_args()
+
+    server = None
+    if args.stub:
+        server = make_server("127.0.0.1", 0, token_delay=0.002)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        settings.LLM_API_URL = f"http://127.0.0.1:{server.server_address[1]}/v1/messages"
+    elif not settings.LLM_API_KEY:
+        parser.error("set ANTHROPIC_API_KEY (or pass --stub)")
+
+    import http_client
+    from concept_scorer import build_scorers
+    from feedback_cache import FeedbackCache
+    from lesson_content import load_lesson_content
+    from progress_store import ProgressStore
+    from short_answer_grading import (
+        RubricQuestion, Submission, concept_prefilter, grade_submissions, make_llm_requester,
+    )
+
+    content = load_lesson_content(settings.CONTENT_DIR, settings.CONTENT_BUNDLE_PATH)["quiz"]
+    questions = {
+        question_id: RubricQuestion(question_id, content[f"{question_id}_prompt"], tuple(content[f"{question_id}_rubric"]))
+        for question_id in ("q7", "q8")
+    }
+
+    prefilter = None
+    if not args.no_prefilter:
+        prefilter = concept_prefilter(build_scorers({
+            question_id: content[f"{question_id}_concepts"] for question_id in questions
+        }))
+
+    if args.synthetic:
+        submissions = synthetic_submissions(args.synthetic, args.seed)
+    else:
+        submissions = [Submission(*row) for row in ProgressStore(settings.PROGRESS_DB_PATH).short_answers()]
+
+    with tempfile.TemporaryDirectory(prefix="bluedevil-grading-") as scratch:
+        cache_path = os.path.join(scratch, "cache.sqlite3") if args.fresh_cache else settings.FEEDBACK_CACHE_PATH
+        cache = FeedbackCache(cache_path, settings.FEEDBACK_CACHE_TTL, settings.FEEDBACK_CACHE_MAX_ENTRIES)
+        session = http_client.create_session(pool_size=args.concurrency)
+        report = grade_submissions(
+            submissions, questions, cache, make_llm_requester(session),
+            batch_size=args.batch_size, max_concurrency=args.concurrency, prefilter=prefilter,
+        )
+
+    if server is not None:
+        server.shutdown()
+
+    print(f"{len(report.rows)} answers ({report.unique_answers} unique) graded in {report.seconds:.2f}s")
+    print(f"  {report.graded} newly graded in {report.batches} batched requests "
+          f"(batch size {args.batch_size}, concurrency {args.concurrency})")
+    print(f"  {report.local} scored locally, {report.cached} from cache, {report.failed} failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,483 @@
+"""Simulate a classroom of students against a real ``streamlit run`` server.
+
+    python tools/load_test.py --students 30 --concurrency 10
+    python tools/load_test.py --students 200 --concurrency 25 --json results.json
+    python tools/load_test.py --students 10 --concurrency 1 --full-reruns
+
+The app runs as a ``streamlit run app.py`` subprocess, and every simulated
+student is a websocket client speaking the browser's protocol (BackMsg and
+ForwardMsg protobufs on /_stcore/stream). Like a browser tab, a client sends a
+rerun request for each interaction, with its widget values, the page script
+hash of a clicked page link, or the fragment id of a widget inside a fragment.
+It polls auto-rerunning fragments at the interval the server asks for. Each
+student signs in, clicks through all nine sidebar page links, answers a Quick
+Check, answers the quiz, submits a treatment design and asks Professor Xavier
+for feedback. The LLM is the stub server from tools/stub_llm_server.py,
+started in-process, and every data file lives in a temporary directory. No
+network is needed, and a given --seed always produces the same interactions.
+
+Every session gets its own script thread in the server, as in production, so
+up to --concurrency students compete for the one server process. Latency runs
+from sending a request to the end of the last script run it caused, so it
+includes the time spent waiting for the CPU (and the GIL) behind other
+students. --full-reruns sends widget changes inside fragments as full reruns,
+which is what every click cost before the Quick Checks and quiz questions
+became fragments.
+
+Reported:
+  * latency (p50/p95/p99/max) per interaction type and overall, queueing included
+  * script runs per interaction: script runs the server finished for one
+    interaction (a page link click is one; st.switch_page would be two)
+  * server CPU per interaction: CPU time of the server process divided by the
+    number of interactions. Per interaction type this is measured around each
+    request, which is exact only with --concurrency 1.
+  * memory per session: server RSS growth divided by the number of students
+
+The client protocol is the one of the installed Streamlit (1.57 or later) and
+needs the websockets package, which Streamlit itself depends on. CPU and memory
+figures read /proc, so they are Linux-only.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "tools"))
+
+from stub_llm_server import make_server  # noqa: E402
+
+APP_PATH = os.path.join(ROOT, "app.py")
+# Sidebar page links, in sidebar order (see PAGES in app.py)
+PAGE_TITLES = (
+    "Home", "News Article", "Learning Objectives", "The Immune System", "Autoimmune Diseases",
+    "Drug Development", "Design a Treatment", "Quiz & Assessment", "Resources",
+)
+CHECK_PAGE = "The Immune System"
+CHECK_KEY = "immune_q1"
+QUIZ_PAGE = "Quiz & Assessment"
+DESIGN_PAGE = "Design a Treatment"
+FEEDBACK_BUTTON = "🎓 Get Expert Feedback on Your Treatment Design"
+FEEDBACK_HEADER = "### 💬 Professor Xavier's Feedback:"
+MECHANISMS = (
+    "It blocks the cytokine so immune cells stop getting the signal to attack.",
+    "The antibody binds the receptor and prevents T cells from activating.",
+    "It lowers inflammation by interrupting the signaling pathway inside the cell.",
+)
+
+
+class StudentError(RuntimeError):
+    """A simulated session hit an exception or could not find a widget"""
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an unsorted list"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(len(ordered) * pct / 100))
+    return ordered[rank - 1]
+
+
+def server_cpu_seconds(pid):
+    """User plus system CPU time of a process"""
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def server_rss_bytes(pid):
+    """Resident set size of a process"""
+    with open(f"/proc/{pid}/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class BrowserSession:
+    """One browser tab: a websocket to the app and the elements it currently shows"""
+
+    def __init__(self, ws, timeout):
+        self.ws = ws
+        self.timeout = timeout
+        self.elements = {}  # delta path -> (element, fragment id)
+        self.widget_states = {}  # widget id -> WidgetState this tab holds
+        self.auto_rerun = {}  # fragment id -> seconds between auto reruns
+        self.page_script_hash = ""
+        self.query_string = ""
+
+    def request(self, widget=None, fragment_id="", page_link=None, auto_rerun=False):
+        """Send one rerun request and read until the last script run it caused is over.
+
+        ``widget`` is a WidgetState that changed (a button's trigger is sent
+        once, other values are kept). Returns the number of script runs.
+        """
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+
+        if widget is not None and not widget.HasField("trigger_value"):
+            self.widget_states[widget.id] = widget
+        message = BackMsg()
+        state = message.rerun_script
+        state.query_string = page_link.query_string if page_link else self.query_string
+        state.page_script_hash = page_link.page_script_hash if page_link else self.page_script_hash
+        state.fragment_id = fragment_id
+        state.is_auto_rerun = auto_rerun
+        # Like the browser, send the values of the widgets on screen
+        shown = {element_widget_id(element) for element, _ in self.elements.values()}
+        state.widget_states.widgets.extend(
+            value for widget_id, value in self.widget_states.items() if widget_id in shown
+        )
+        if widget is not None and widget.HasField("trigger_value"):
+            state.widget_states.widgets.append(widget)
+        self.ws.send(message.SerializeToString())
+        return self.read_until_finished()
+
+    def read_until_finished(self):
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        runs = 0
+        while True:
+            message = ForwardMsg()
+            message.ParseFromString(self.ws.recv(timeout=self.timeout))
+            kind = message.WhichOneof("type")
+            if kind == "new_session":
+                fragments = set(message.new_session.fragment_ids_this_run)
+                if fragments:
+                    self.elements = {path: item for path, item in self.elements.items() if item[1] not in fragments}
+                else:
+                    self.elements = {}
+                    self.auto_rerun = {}
+                self.page_script_hash = message.new_session.page_script_hash
+            elif kind == "delta" and message.delta.WhichOneof("type") == "new_element":
+                element = message.delta.new_element
+                if element.WhichOneof("type") == "exception":
+                    raise StudentError(f"{element.exception.type}: {element.exception.message}")
+                self.elements[tuple(message.metadata.delta_path)] = (element, message.delta.fragment_id)
+            elif kind == "page_info_changed":
+                self.query_string = message.page_info_changed.query_string
+            elif kind == "auto_rerun":
+                self.auto_rerun[message.auto_rerun.fragment_id] = message.auto_rerun.interval
+            elif kind == "stop_auto_rerun":
+                self.auto_rerun.pop(message.stop_auto_rerun.fragment_id, None)
+            elif kind == "script_finished":
+                runs += 1
+                if message.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    return runs
+
+    def find(self, kind, label=None, key=None):
+        """The (element, fragment id) of the first ``kind`` element with this label or widget key"""
+        for path in sorted(self.elements):
+            element, fragment_id = self.elements[path]
+            if element.WhichOneof("type") != kind:
+                continue
+            proto = getattr(element, kind)
+            if (label is not None and proto.label == label) or (key is not None and proto.id.endswith(f"-{key}")):
+                return proto, fragment_id
+        raise StudentError(f"no {kind} with label {label!r} / key {key!r} on the page")
+
+    def all(self, kind):
+        return [getattr(element, kind) for path, (element, _) in sorted(self.elements.items())
+                if element.WhichOneof("type") == kind]
+
+    def markdown(self):
+        return [element.markdown.body for element, _ in self.elements.values() if element.WhichOneof("type") == "markdown"]
+
+
+def element_widget_id(element):
+    return getattr(getattr(element, element.WhichOneof("type")), "id", "")
+
+
+def widget_state(widget_id, **value):
+    from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+    state = WidgetState(id=widget_id)
+    (field, data), = value.items()
+    if field == "string_array_value":
+        state.string_array_value.data.extend(data)
+    else:
+        setattr(state, field, data)
+    return state
+
+
+class SimulatedStudent:
+    """One browser session walking through the lesson"""
+
+    def __init__(self, number, url, seed, timeout, unique_designs, feedback_timeout, server_pid, full_reruns=False):
+        self.number = number
+        self.url = url
+        self.rng = random.Random(seed * 100_003 + number)
+        self.timeout = timeout
+        self.unique_designs = unique_designs
+        self.feedback_timeout = feedback_timeout
+        self.server_pid = server_pid
+        self.full_reruns = full_reruns
+        self.session = None
+        self.samples = []
+        self.feedback_seconds = None
+
+    def step(self, action, **request):
+        cpu_before = server_cpu_seconds(self.server_pid)
+        started = time.perf_counter()
+        try:
+            runs = self.session.request(**request)
+        except StudentError as e:
+            raise StudentError(f"student {self.number} ({action}): {e}") from None
+        seconds = time.perf_counter() - started
+        self.samples.append((action, seconds, runs, server_cpu_seconds(self.server_pid) - cpu_before))
+
+    def change(self, action, widget, fragment_id, **value):
+        """A widget changed in the browser: a fragment rerun when the widget is in one"""
+        self.step(action, widget=widget_state(widget.id, **value),
+                  fragment_id="" if self.full_reruns else fragment_id)
+
+    def navigate(self, title):
+        # A sidebar page link click: one rerun request for the link's page
+        link, _ = self.session.find("page_link", label=title)
+        self.step("navigate", page_link=link)
+
+    def run(self):
+        from websockets.sync.client import connect
+
+        with connect(self.url, subprotocols=["streamlit"], max_size=None, open_timeout=self.timeout) as ws:
+            self.session = BrowserSession(ws, self.timeout)
+            self.step("first_load")
+            student_id, _ = self.session.find("text_input", key="student_id_input")
+            self.step("sign_in", widget=widget_state(student_id.id, string_value=f"load-test-{self.number:04d}"))
+
+            for title in PAGE_TITLES:
+                self.navigate(title)
+
+            self.navigate(CHECK_PAGE)
+            self.answer_quick_check()
+
+            self.navigate(QUIZ_PAGE)
+            for radio in [radio for radio in self.session.all("radio") if "-quiz_q" in radio.id]:
+                _, fragment_id = self.session.find("radio", key=radio.id.rsplit("-", 1)[1])
+                self.change("quiz_answer", radio, fragment_id, string_value=self.rng.choice(radio.options))
+
+            self.navigate(DESIGN_PAGE)
+            self.submit_design()
+            self.request_feedback()
+        return self
+
+    def answer_quick_check(self):
+        radio, fragment_id = self.session.find("radio", key=CHECK_KEY)
+        self.change("check_select", radio, fragment_id, string_value=self.rng.choice(radio.options))
+        button, fragment_id = self.session.find("button", key=f"check_{CHECK_KEY}")
+        self.change("check_answer", button, fragment_id, trigger_value=True)
+
+    def submit_design(self):
+        session = self.session
+        disease, _ = session.find("selectbox", label="Select a disease to target:")
+        self.step("design_input", widget=widget_state(disease.id, string_value=self.rng.choice(disease.options)))
+
+        # Form widgets only reach the server with the submit button
+        name = f"Compound-{self.number}" if self.unique_designs else "Immunobalance-X"
+        treatment_name, _ = session.find("text_input", label="Treatment Name:")
+        session.widget_states[treatment_name.id] = widget_state(treatment_name.id, string_value=name)
+        for selectbox in session.all("selectbox"):
+            if selectbox.label != disease.label:
+                session.widget_states[selectbox.id] = widget_state(selectbox.id, string_value=self.rng.choice(selectbox.options))
+        for slider in session.all("slider"):
+            if slider.options:
+                session.widget_states[slider.id] = widget_state(
+                    slider.id, string_array_value=[self.rng.choice(slider.options)])
+        for text_area in session.all("text_area"):
+            session.widget_states[text_area.id] = widget_state(text_area.id, string_value=self.rng.choice(MECHANISMS))
+        submit, _ = session.find("button", label="Submit Treatment Design")
+        self.step("design_submit", widget=widget_state(submit.id, trigger_value=True))
+
+    def request_feedback(self):
+        started = time.perf_counter()
+        button, _ = self.session.find("button", label=FEEDBACK_BUTTON)
+        self.step("feedback_click", widget=widget_state(button.id, trigger_value=True))
+        # The job is polled by an auto-rerunning fragment; rerun it like the browser's timer would
+        while self.session.auto_rerun:
+            if time.perf_counter() - started > self.feedback_timeout:
+                raise StudentError(f"student {self.number}: no feedback after {self.feedback_timeout}s")
+            fragment_id, interval = next(iter(self.session.auto_rerun.items()))
+            time.sleep(interval)
+            self.step("feedback_poll", fragment_id=fragment_id, auto_rerun=True)
+        if FEEDBACK_HEADER not in self.session.markdown():
+            raise StudentError(f"student {self.number}: the feedback click showed no feedback")
+        self.feedback_seconds = time.perf_counter() - started
+
+
+def summarize(samples):
+    return {
+        "count": len(samples),
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "max_ms": max(samples) * 1000,
+    }
+
+
+def server_environment(data_dir, stub_url, llm_rate):
+    """The app's environment: the stub LLM and a scratch data directory"""
+    env = dict(os.environ)
+    env["BLUEDEVIL_DATA_DIR"] = data_dir
+    env["BLUEDEVIL_LLM_URL"] = stub_url
+    env["ANTHROPIC_API_KEY"] = "stub"
+    env["BLUEDEVIL_LLM_RATE_PER_MINUTE"] = str(llm_rate)
+    env["BLUEDEVIL_LLM_RATE_BURST"] = str(max(1, int(llm_rate // 6)))
+    env.pop("BLUEDEVIL_LLM_RATE_STATE", None)
+    env.pop("BLUEDEVIL_PROFILE", None)
+    return env
+
+
+def start_app_server(port, env, timeout):
+    """``streamlit run app.py`` in a subprocess, once it answers its health check"""
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", APP_PATH, "--server.headless", "true",
+         "--server.port", str(port), "--server.address", "127.0.0.1",
+         "--browser.gatherUsageStats", "false", "--server.fileWatcherType", "none"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"streamlit exited: {server.stderr.read().decode(errors='replace')[-2000:]}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return server
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError(f"streamlit did not start within {timeout}s")
+
+
+def run_load_test(students, concurrency, seed=1, timeout=60, unique_designs=True, feedback_timeout=120,
+                  token_delay=0.02, first_token_delay=0.1, llm_rate=600, full_reruns=False):
+    stub = make_server("127.0.0.1", 0, token_delay, first_token_delay)
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+    stub_url = f"http://127.0.0.1:{stub.server_address[1]}/v1/messages"
+
+    with tempfile.TemporaryDirectory(prefix="bluedevil-load-") as data_dir:
+        port = free_port()
+        server = start_app_server(port, server_environment(data_dir, stub_url, llm_rate), timeout)
+        url = f"ws://127.0.0.1:{port}/_stcore/stream"
+
+        def student(number):
+            return SimulatedStudent(number, url, seed, timeout, unique_designs, feedback_timeout,
+                                    server.pid, full_reruns).run()
+
+        try:
+            # Warm-up session: imports, cached resources and content load are not per-student costs
+            student(0)
+
+            rss_before = server_rss_bytes(server.pid)
+            cpu_before = server_cpu_seconds(server.pid)
+            wall_before = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                finished = list(pool.map(student, range(1, students + 1)))
+            wall = time.perf_counter() - wall_before
+            cpu = server_cpu_seconds(server.pid) - cpu_before
+            rss_after = server_rss_bytes(server.pid)
+        finally:
+            # SIGTERM lets the app flush its progress and analytics writers
+            server.terminate()
+            try:
+                server.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                server.kill()
+            stub.shutdown()
+            stub.server_close()
+
+    by_action = {}
+    for student_run in finished:
+        for action, seconds, runs, cpu_seconds in student_run.samples:
+            by_action.setdefault(action, []).append((seconds, runs, cpu_seconds))
+    all_samples = [seconds for samples in by_action.values() for seconds, _, _ in samples]
+    feedback = [student_run.feedback_seconds for student_run in finished]
+
+    return {
+        "students": students,
+        "concurrency": concurrency,
+        "seed": seed,
+        "full_reruns": full_reruns,
+        "interactions": len(all_samples),
+        "wall_seconds": wall,
+        "interactions_per_second": len(all_samples) / wall,
+        "cpu_ms_per_interaction": cpu * 1000 / len(all_samples),
+        "memory_mb_per_session": (rss_after - rss_before) / students / 2**20,
+        "latency": summarize(all_samples),
+        "by_action": {
+            action: summarize([seconds for seconds, _, _ in samples]) for action, samples in sorted(by_action.items())
+        },
+        "script_runs_per_interaction": {
+            action: sum(runs for _, runs, _ in samples) / len(samples) for action, samples in sorted(by_action.items())
+        },
+        "cpu_ms_by_action": {
+            action: sum(cpu for _, _, cpu in samples) * 1000 / len(samples) for action, samples in sorted(by_action.items())
+        },
+        "feedback_seconds": summarize(feedback),
+    }
+
+
+def print_report(results):
+    print(f"{results['students']} students, concurrency {results['concurrency']}, seed {results['seed']}"
+          + (", full reruns" if results["full_reruns"] else ""))
+    print(f"{results['interactions']} interactions in {results['wall_seconds']:.1f}s "
+          f"({results['interactions_per_second']:.1f}/s)")
+    print(f"Server CPU per interaction: {results['cpu_ms_per_interaction']:.1f} ms")
+    print(f"Server memory per session:  {results['memory_mb_per_session']:.2f} MiB")
+    print()
+    print(f"{'interaction':<16}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+          f"{'runs':>7}{'cpu ms':>9}")
+    rows = list(results["by_action"].items()) + [("ALL", results["latency"])]
+    for action, stats in rows:
+        runs = results["script_runs_per_interaction"].get(action)
+        cpu = results["cpu_ms_by_action"].get(action)
+        print(f"{action:<16}{stats['count']:>7}{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}"
+              f"{stats['p99_ms']:>10.1f}{stats['max_ms']:>10.1f}"
+              + (f"{runs:>7.2f}{cpu:>9.1f}" if runs is not None else ""))
+    if results["concurrency"] > 1:
+        print("(cpu ms per interaction type includes other sessions' work; use --concurrency 1 for exact figures)")
+    feedback = results["feedback_seconds"]
+    print()
+    print(f"Feedback click to finished: p50 {feedback['p50_ms'] / 1000:.2f}s, "
+          f"p95 {feedback['p95_ms'] / 1000:.2f}s, max {feedback['max_ms'] / 1000:.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=30, help="number of simulated sessions")
+    parser.add_argument("--concurrency", type=int, default=10, help="sessions running at the same time")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=60, help="seconds allowed per interaction")
+    parser.add_argument("--same-design", action="store_true",
+                        help="every student submits the same design (exercises the feedback cache)")
+    parser.add_argument("--full-reruns", action="store_true",
+                        help="send widget changes inside fragments as full reruns")
+    parser.add_argument("--token-delay", type=float, default=0.02, help="stub LLM delay between tokens")
+    parser.add_argument("--first-token-delay", type=float, default=0.1, help="stub LLM time to first token")
+    parser.add_argument("--llm-rate", type=float, default=600, help="LLM requests per minute allowed")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    results = run_load_test(
+        args.students, args.concurrency, seed=args.seed, timeout=args.timeout,
+        unique_designs=not args.same_design, token_delay=args.token_delay,
+        first_token_delay=args.first_token_delay, llm_rate=args.llm_rate, full_reruns=args.full_reruns,
+    )
+    print_report(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Precompute Professor Xavier's feedback for every structured design combination.
+
+    python tools/precompute_feedback.py                  # fill in whatever is missing
+    python tools/precompute_feedback.py --stub --limit 500
+
+Each of the 19,200 disease/target/drug type/delivery/priority/cost/dosing
+combinations gets one LLM request (see feedback_matrix.py). Results are
+committed as they arrive, so an interrupted run picks up where it stopped; run
+it again after changing the option lists in content/pages/design_challenge.yaml
+(the old entries are then discarded). --stub uses tools/stub_llm_server.py
+in-process and a temporary store, which times the pipeline offline.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tools"))
+
+import settings  # noqa: E402
+from stub_llm_server import make_server  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stub", action="store_true", help="use the in-process stub LLM server and a scratch store")
+    parser.add_argument("--limit", type=int, default=0, help="generate at most this many combinations")
+    parser.add_argument("--concurrency", type=int, default=settings.GRADING_CONCURRENCY)
+    parser.add_argument("--reset", action="store_true", help="discard every stored entry first")
+    args = parser.parse_args()
+
+    server = None
+    if args.stub:
+        server = make_server("127.0.0.1", 0, token_delay=0, first_token_delay=0.01)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        settings.LLM_API_URL = f"http://127.0.0.1:{server.server_address[1]}/v1/messages"
+    elif not settings.LLM_API_KEY:
+        parser.error("set ANTHROPIC_API_KEY (or pass --stub)")
+
+    import http_client
+    from feedback_matrix import DesignOptions, FeedbackMatrix, precompute
+    from lesson_content import load_lesson_content
+    from rate_limiter import RateLimiter
+    from short_answer_grading import make_llm_requester
+
+    content = load_lesson_content(settings.CONTENT_DIR, settings.CONTENT_BUNDLE_PATH)["design_challenge"]
+    options = DesignOptions(content)
+
+    with tempfile.TemporaryDirectory(prefix="bluedevil-matrix-") as scratch:
+        path = os.path.join(scratch, "matrix.sqlite3") if args.stub else settings.FEEDBACK_MATRIX_PATH
+        matrix = FeedbackMatrix(path, options)
+        if args.reset or not matrix.valid:
+            matrix.reset()
+
+        numbers = matrix.missing()
+        print(f"{options.count - len(numbers)} of {options.count} combinations already stored")
+        if args.limit:
+            numbers = numbers[:args.limit]
+
+        limiter = None
+        if not args.stub:
+            limiter = RateLimiter(settings.LLM_RATE_PER_MINUTE, settings.LLM_RATE_BURST, settings.LLM_RATE_STATE_PATH)
+        request = make_llm_requester(http_client.create_session(pool_size=args.concurrency), limiter, max_tokens=1500)
+        stored, failed, seconds = precompute(
+            matrix, request, numbers, concurrency=args.concurrency,
+            on_progress=lambda done, errors: print(f"  {done + errors}/{len(numbers)}", end="\r", flush=True),
+        )
+        stats = matrix.stats()
+
+    if server is not None:
+        server.shutdown()
+
+    print(f"Generated {stored} combinations in {seconds:.1f}s ({failed} failed)")
+    print(f"  {stats['entries']} of {stats['combinations']} stored, {stats['bytes'] / 1024 / 1024:.1f} MiB compressed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Local stand-in for the messages API, for offline development and testing.
+
+Answers ``POST /v1/messages`` with canned feedback, either as a single JSON body
+or, when the request sets ``"stream": true``, as a chunked server-sent event
+stream with a short delay between tokens. Batched short-answer grading prompts
+get a JSON array of scores that depend only on each answer's length, so grading
+runs are deterministic.
+
+    python tools/stub_llm_server.py --port 8765 --token-delay 0.02
+    BLUEDEVIL_LLM_URL=http://127.0.0.1:8765/v1/messages streamlit run app.py
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CANNED_FEEDBACK = (
+    "**Great work on your treatment design!** "
+    "Your target sits in the inflammatory signaling pathway, so blocking it interrupts "
+    "the cascade that drives the disease. Think about how your delivery route affects "
+    "how often patients need to take the drug.\n\n"
+    "📚 **Study These Resources:**\n"
+    "1. [FDA: Drug Development](https://www.fda.gov/patients/learn-about-drug-and-device-approvals/drug-development-process)"
+)
+
+
+GRADING_ANSWER = re.compile(r'<answer id="(\d+)">\n(.*?)\n</answer>', re.S)
+GRADING_MAX_SCORE = re.compile(r"Score each answer from 0 to (\d+)")
+
+
+def grading_reply(prompt):
+    """Deterministic scores for a batched grading prompt: one point per 15 words"""
+    match = GRADING_MAX_SCORE.search(prompt)
+    max_score = int(match.group(1)) if match else 4
+    grades = []
+    for answer_id, answer in GRADING_ANSWER.findall(prompt):
+        score = min(max_score, len(answer.split()) // 15)
+        grades.append({"id": int(answer_id), "score": score, "feedback": f"Stub grade: {score}/{max_score}."})
+    return json.dumps(grades)
+
+
+class StubMessagesHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    token_delay = 0.02
+    first_token_delay = 0.1
+    fail_status = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_event(self, event, payload):
+        chunk = f"event: {event}\ndata: {json.dumps(payload)}\n\n".encode("utf-8")
+        self.wfile.write(f"{len(chunk):X}\r\n".encode("ascii") + chunk + b"\r\n")
+        self.wfile.flush()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+
+        if self.fail_status:
+            self._send_json(self.fail_status, {"type": "error", "error": {"message": "stub failure"}})
+            return
+
+        prompt = "".join(
+            message.get("content", "") for message in request.get("messages", [])
+            if isinstance(message.get("content"), str)
+        )
+        text = grading_reply(prompt) if "<answers>" in prompt else CANNED_FEEDBACK
+        time.sleep(self.first_token_delay)
+
+        if not request.get("stream"):
+            self._send_json(200, {
+                "type": "message",
+                "role": "assistant",
+                "content": [{"type": "text", "text": text}],
+            })
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        self._send_event("message_start", {"type": "message_start", "message": {"role": "assistant"}})
+        self._send_event("content_block_start", {
+            "type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""},
+        })
+        for token in text.split(" "):
+            self._send_event("content_block_delta", {
+                "type": "content_block_delta", "index": 0,
+                "delta": {"type": "text_delta", "text": token + " "},
+            })
+            time.sleep(self.token_delay)
+        self._send_event("content_block_stop", {"type": "content_block_stop", "index": 0})
+        self._send_event("message_stop", {"type": "message_stop"})
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Pooled keep-alive clients drop their idle connections when they exit
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+def make_server(host="127.0.0.1", port=8765, token_delay=0.02, first_token_delay=0.1, fail_status=None):
+    handler = type("ConfiguredStubHandler", (StubMessagesHandler,), {
+        "token_delay": token_delay,
+        "first_token_delay": first_token_delay,
+        "fail_status": fail_status,
+    })
+    return StubServer((host, port), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--token-delay", type=float, default=0.02)
+    parser.add_argument("--first-token-delay", type=float, default=0.1)
+    parser.add_argument("--fail-status", type=int, default=None,
+                        help="answer every request with this HTTP status")
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.token_delay, args.first_token_delay, args.fail_status)
+    print(f"Stub messages API on http://{args.host}:{args.port}/v1/messages")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()